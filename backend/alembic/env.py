@@ -34,6 +34,9 @@ from app.models import (
     audit,
     university,
     notice,
+    analytics,
+    export_job,
+    email_campaign,
 )
 
 target_metadata = Base.metadata
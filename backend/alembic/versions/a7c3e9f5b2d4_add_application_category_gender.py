@@ -0,0 +1,34 @@
+"""Denormalize student category and gender onto applications
+
+Revision ID: a7c3e9f5b2d4
+Revises: f2b8d4a6c1e3
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9f5b2d4'
+down_revision: Union[str, None] = 'f2b8d4a6c1e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('applications', sa.Column('category', sa.String(length=50), nullable=True))
+    op.add_column('applications', sa.Column('gender', sa.String(length=10), nullable=True))
+    # Analytics rollups are keyed on these columns, so they must match the profiles
+    # before the next rollup write; afterwards run scripts/rebuild_analytics_rollups.py
+    op.execute(
+        "UPDATE applications a LEFT JOIN student_profiles p ON p.user_id = a.student_id "
+        "SET a.department = p.department, a.branch = p.branch, a.category = p.category, a.gender = p.gender"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('applications', 'gender')
+    op.drop_column('applications', 'category')
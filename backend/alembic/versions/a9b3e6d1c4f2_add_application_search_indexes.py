@@ -0,0 +1,30 @@
+"""Add FULLTEXT and status indexes for application search
+
+Revision ID: a9b3e6d1c4f2
+Revises: f7d2c8e1a5b6
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9b3e6d1c4f2'
+down_revision: Union[str, None] = 'f7d2c8e1a5b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_fulltext_name_email', 'users', ['full_name', 'email'], unique=False, mysql_prefix='FULLTEXT')
+    op.create_index('ix_scholarships_fulltext_name', 'scholarships', ['name'], unique=False, mysql_prefix='FULLTEXT')
+    op.create_index('ix_applications_status_created_at_id', 'applications', ['status', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_status_created_at_id', table_name='applications')
+    op.drop_index('ix_scholarships_fulltext_name', table_name='scholarships')
+    op.drop_index('ix_users_fulltext_name_email', table_name='users')
@@ -0,0 +1,39 @@
+"""Add denormalized student fields and document counters to applications
+
+Revision ID: b2c7f4e9a1d8
+Revises: a9b3e6d1c4f2
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2c7f4e9a1d8'
+down_revision: Union[str, None] = 'a9b3e6d1c4f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('applications', sa.Column('student_name', sa.String(length=255), nullable=True))
+    op.add_column('applications', sa.Column('department', sa.String(length=100), nullable=True))
+    op.add_column('applications', sa.Column('branch', sa.String(length=100), nullable=True))
+    op.add_column('applications', sa.Column('total_docs', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('applications', sa.Column('verified_docs', sa.Integer(), nullable=False, server_default='0'))
+    op.create_index('ix_applications_department_created_at_id', 'applications', ['department', 'created_at', 'id'], unique=False)
+    op.create_index('ix_applications_department_status', 'applications', ['department', 'status'], unique=False)
+    # Existing rows are populated by scripts/backfill_application_fields.py
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_department_status', table_name='applications')
+    op.drop_index('ix_applications_department_created_at_id', table_name='applications')
+    op.drop_column('applications', 'verified_docs')
+    op.drop_column('applications', 'total_docs')
+    op.drop_column('applications', 'branch')
+    op.drop_column('applications', 'department')
+    op.drop_column('applications', 'student_name')
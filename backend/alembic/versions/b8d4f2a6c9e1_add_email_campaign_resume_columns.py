@@ -0,0 +1,30 @@
+"""Track per-recipient email campaign progress and worker heartbeats
+
+Revision ID: b8d4f2a6c9e1
+Revises: a7c3e9f5b2d4
+Create Date: 2026-10-20 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d4f2a6c9e1'
+down_revision: Union[str, None] = 'a7c3e9f5b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('email_campaigns', sa.Column('heartbeat_at', sa.DateTime(), nullable=True))
+    op.add_column('email_campaign_chunks', sa.Column('sent_offset', sa.Integer(), nullable=False, server_default='0'))
+    # Chunks already finished count as fully handled
+    op.execute("UPDATE email_campaign_chunks SET sent_offset = JSON_LENGTH(recipients) WHERE status <> 'PENDING'")
+
+
+def downgrade() -> None:
+    op.drop_column('email_campaign_chunks', 'sent_offset')
+    op.drop_column('email_campaigns', 'heartbeat_at')
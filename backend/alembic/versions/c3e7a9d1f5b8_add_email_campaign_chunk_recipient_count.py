@@ -0,0 +1,27 @@
+"""Store each email campaign chunk's recipient count
+
+Revision ID: c3e7a9d1f5b8
+Revises: b8d4f2a6c9e1
+Create Date: 2026-10-21 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e7a9d1f5b8'
+down_revision: Union[str, None] = 'b8d4f2a6c9e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('email_campaign_chunks', sa.Column('recipient_count', sa.Integer(), nullable=False, server_default='0'))
+    op.execute("UPDATE email_campaign_chunks SET recipient_count = JSON_LENGTH(recipients)")
+
+
+def downgrade() -> None:
+    op.drop_column('email_campaign_chunks', 'recipient_count')
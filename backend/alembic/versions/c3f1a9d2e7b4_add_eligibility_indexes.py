@@ -0,0 +1,28 @@
+"""Add eligibility indexes to student_profiles
+
+Revision ID: c3f1a9d2e7b4
+Revises: 10678dda529d
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f1a9d2e7b4'
+down_revision: Union[str, None] = '10678dda529d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_student_profiles_department'), 'student_profiles', ['department'], unique=False)
+    op.create_index(op.f('ix_student_profiles_category'), 'student_profiles', ['category'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_student_profiles_category'), table_name='student_profiles')
+    op.drop_index(op.f('ix_student_profiles_department'), table_name='student_profiles')
@@ -0,0 +1,53 @@
+"""Add analytics rollup tables
+
+Revision ID: c8e5a2f7b3d9
+Revises: b2c7f4e9a1d8
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e5a2f7b3d9'
+down_revision: Union[str, None] = 'b2c7f4e9a1d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUS_ENUM = ('DRAFT', 'SUBMITTED', 'UNDER_VERIFICATION', 'DOCS_REQUIRED', 'APPROVED', 'REJECTED')
+
+
+def _create_rollup_table(name: str) -> None:
+    op.create_table(name,
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('department', sa.String(length=100), nullable=False),
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('gender', sa.String(length=10), nullable=False),
+    sa.Column('status', sa.Enum(*STATUS_ENUM, name='applicationstatus'), nullable=False),
+    sa.Column('scholarship_id', sa.Integer(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('day', 'department', 'category', 'gender', 'status', 'scholarship_id', name=f'uq_{name}_key')
+    )
+    op.create_index(op.f(f'ix_{name}_id'), name, ['id'], unique=False)
+
+
+def upgrade() -> None:
+    _create_rollup_table('application_rollups')
+    op.create_index('ix_application_rollups_department_status', 'application_rollups', ['department', 'status'], unique=False)
+    _create_rollup_table('status_transition_rollups')
+    op.create_index('ix_status_transition_rollups_status_day', 'status_transition_rollups', ['status', 'day'], unique=False)
+    # Populate with scripts/rebuild_analytics_rollups.py
+
+
+def downgrade() -> None:
+    op.drop_index('ix_status_transition_rollups_status_day', table_name='status_transition_rollups')
+    op.drop_index(op.f('ix_status_transition_rollups_id'), table_name='status_transition_rollups')
+    op.drop_table('status_transition_rollups')
+    op.drop_index('ix_application_rollups_department_status', table_name='application_rollups')
+    op.drop_index(op.f('ix_application_rollups_id'), table_name='application_rollups')
+    op.drop_table('application_rollups')
@@ -0,0 +1,47 @@
+"""Add export_jobs table
+
+Revision ID: d4f1b8c6e2a7
+Revises: c8e5a2f7b3d9
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f1b8c6e2a7'
+down_revision: Union[str, None] = 'c8e5a2f7b3d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('export_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('entity', sa.String(length=50), nullable=False),
+    sa.Column('columns', sa.JSON(), nullable=False),
+    sa.Column('filters', sa.JSON(), nullable=True),
+    sa.Column('format', sa.Enum('CSV_GZ', 'PARQUET', 'XLSX', name='exportformat'), nullable=False),
+    sa.Column('status', sa.Enum('QUEUED', 'RUNNING', 'COMPLETED', 'FAILED', name='exportjobstatus'), nullable=False),
+    sa.Column('total_rows', sa.Integer(), nullable=True),
+    sa.Column('processed_rows', sa.Integer(), nullable=True),
+    sa.Column('file_path', sa.String(length=500), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_export_jobs_id'), 'export_jobs', ['id'], unique=False)
+    op.create_index('ix_export_jobs_created_by_created_at', 'export_jobs', ['created_by', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_export_jobs_created_by_created_at', table_name='export_jobs')
+    op.drop_index(op.f('ix_export_jobs_id'), table_name='export_jobs')
+    op.drop_table('export_jobs')
@@ -0,0 +1,32 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: e41b7c5a9d03
+Revises: c3f1a9d2e7b4
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41b7c5a9d03'
+down_revision: Union[str, None] = 'c3f1a9d2e7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_applications_created_at_id', 'applications', ['created_at', 'id'], unique=False)
+    op.create_index('ix_audit_logs_timestamp_id', 'audit_logs', ['timestamp', 'id'], unique=False)
+    op.create_index('ix_notices_created_at_id', 'notices', ['created_at', 'id'], unique=False)
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_created_at_id', table_name='users')
+    op.drop_index('ix_notices_created_at_id', table_name='notices')
+    op.drop_index('ix_audit_logs_timestamp_id', table_name='audit_logs')
+    op.drop_index('ix_applications_created_at_id', table_name='applications')
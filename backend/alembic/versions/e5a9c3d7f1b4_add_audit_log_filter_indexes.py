@@ -0,0 +1,30 @@
+"""Add audit log filter indexes
+
+Revision ID: e5a9c3d7f1b4
+Revises: d4f1b8c6e2a7
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c3d7f1b4'
+down_revision: Union[str, None] = 'd4f1b8c6e2a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_audit_logs_user_timestamp_id', 'audit_logs', ['user_id', 'timestamp', 'id'], unique=False)
+    op.create_index('ix_audit_logs_action_timestamp_id', 'audit_logs', ['action', 'timestamp', 'id'], unique=False)
+    op.create_index('ix_audit_logs_target_timestamp_id', 'audit_logs', ['target_type', 'target_id', 'timestamp', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_logs_target_timestamp_id', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_action_timestamp_id', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_user_timestamp_id', table_name='audit_logs')
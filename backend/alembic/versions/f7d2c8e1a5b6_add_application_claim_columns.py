@@ -0,0 +1,32 @@
+"""Add verifier work queue claim columns to applications
+
+Revision ID: f7d2c8e1a5b6
+Revises: e41b7c5a9d03
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7d2c8e1a5b6'
+down_revision: Union[str, None] = 'e41b7c5a9d03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('applications', sa.Column('claimed_by', sa.Integer(), nullable=True))
+    op.add_column('applications', sa.Column('claimed_until', sa.DateTime(), nullable=True))
+    op.create_foreign_key('fk_applications_claimed_by_users', 'applications', 'users', ['claimed_by'], ['id'])
+    op.create_index('ix_applications_status_claimed_until', 'applications', ['status', 'claimed_until'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_status_claimed_until', table_name='applications')
+    op.drop_constraint('fk_applications_claimed_by_users', 'applications', type_='foreignkey')
+    op.drop_column('applications', 'claimed_until')
+    op.drop_column('applications', 'claimed_by')
@@ -1,11 +1,12 @@
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Body, BackgroundTasks
+from datetime import date, datetime
+from fastapi import APIRouter, Depends, HTTPException, Body, BackgroundTasks, Response, Query, Request
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from app.db.database import get_db
 from app.models.user import User, UserRole
-from app.models.student import StudentProfile, StudentDocument
-from app.models.application import Application, ApplicationStatus
+from app.models.student import StudentProfile
+from app.models.application import Application, ApplicationStatus, STAFF_STATUS_TRANSITIONS
 from app.models.scholarship import Scholarship
 from app.schemas import schemas
 from app.api import deps
@@ -14,24 +15,25 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-from app.core.email import send_email_async, get_email_template
 
 router = APIRouter()
 
 # --- Super Admin Routes ---
 
-from app.api.pagination import PaginationParams
+from app.api.pagination import CursorParams, keyset_paginate
+from app.core.stats import invalidate_application_stats, invalidate_department_stats
 
 @router.get("/users", response_model=List[schemas.UserResponse])
 def get_users(
-    pagination: PaginationParams = Depends(),
+    response: Response,
+    pagination: CursorParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN])),
 ) -> Any:
     """
     Get all users (Super Admin only)
     """
-    return db.query(User).offset(pagination.skip).limit(pagination.limit).all()
+    return keyset_paginate(db.query(User), pagination, User.id, User.created_at, response)
 
 class UserRoleUpdate(BaseModel):
     role: UserRole
@@ -79,6 +81,7 @@ def update_user_profile(
         raise HTTPException(status_code=404, detail="User not found")
     
     profile = db.query(StudentProfile).filter(StudentProfile.user_id == user_id).first()
+    previous_department = profile.department if profile else None
     if not profile:
         # Create if not exists (handle case where profile wasn't created yet)
         profile_data = profile_in.dict(exclude_unset=True)
@@ -89,9 +92,14 @@ def update_user_profile(
         profile_data = profile_in.dict(exclude_unset=True)
         for field, value in profile_data.items():
             setattr(profile, field, value)
-            
+
+    from app.core.denorm import sync_student_fields
+    moved_departments = sync_student_fields(db, [user_id])
     db.commit()
     db.refresh(profile)
+    invalidate_department_stats({previous_department, profile.department})
+    if moved_departments:
+        invalidate_application_stats(moved_departments)
     
     try:
         log_action(
@@ -110,6 +118,7 @@ def update_user_profile(
 @router.delete("/users/{user_id}")
 def delete_user(
     user_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN])),
 ) -> Any:
@@ -133,32 +142,13 @@ def delete_user(
     user_role = user.role.value
     
     try:
-        # Unlink AuditLogs
-        from app.models.audit import AuditLog
-        db.query(AuditLog).filter(AuditLog.user_id == user_id).update({AuditLog.user_id: None})
-        
-        # Unlink Notices
-        from app.models.notice import Notice
-        db.query(Notice).filter(Notice.created_by == user_id).update({Notice.created_by: None})
-
-        # Delete related StudentProfile if exists
-        profile = db.query(StudentProfile).filter(StudentProfile.user_id == user_id).first()
-        if profile:
-            db.delete(profile)
-        
-        # Delete related StudentDocuments
-        documents = db.query(StudentDocument).filter(StudentDocument.student_id == user_id).all()
-        for doc in documents:
-            db.delete(doc)
-        
-        # Delete related Applications
-        applications = db.query(Application).filter(Application.student_id == user_id).all()
-        for app in applications:
-            db.delete(app)
-        
-        # Delete the user
-        db.delete(user)
+        from app.core.user_deletion import purge_users, delete_files_later
+        result = purge_users(db, [user_id])
         db.commit()
+        # The deleted profile also leaves its department's student count
+        invalidate_application_stats(result["departments"])
+        # Files go only after the rows are gone for good
+        delete_files_later(result["file_paths"], background_tasks)
         
         # Log the action
         try:
@@ -180,6 +170,73 @@ def delete_user(
         logger.error(f"Error deleting user {user_id}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to delete user: {str(e)}")
 
+class UserPurgeRequest(BaseModel):
+    user_ids: Optional[List[int]] = None  # Explicit ids; otherwise every inactive account matching the filters
+    role: Optional[UserRole] = UserRole.STUDENT
+    created_before: Optional[date] = None
+    dry_run: bool = False
+
+@router.post("/users/purge")
+def purge_inactive_users(
+    purge_in: UserPurgeRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN])),
+) -> Any:
+    """
+    Delete many inactive accounts at once (Super Admin only).
+    Only users with is_active = False are purged, never admins or the caller.
+    Runs in batches, one transaction each; files are removed in the background.
+    """
+    from datetime import datetime, time
+    from app.core.user_deletion import purge_users, delete_files_later, PURGE_BATCH_SIZE
+
+    query = db.query(User.id).filter(
+        User.is_active == False,
+        User.role != UserRole.ADMIN,
+        User.id != current_user.id,
+    )
+    if purge_in.user_ids is not None:
+        query = query.filter(User.id.in_(purge_in.user_ids))
+    if purge_in.role:
+        query = query.filter(User.role == purge_in.role)
+    if purge_in.created_before:
+        query = query.filter(User.created_at < datetime.combine(purge_in.created_before, time.min))
+    user_ids = [user_id for (user_id,) in query.order_by(User.id)]
+
+    if purge_in.dry_run:
+        return {"matched": len(user_ids), "deleted": 0, "files_queued": 0, "dry_run": True}
+
+    deleted = 0
+    files_queued = 0
+    departments = set()
+    try:
+        for i in range(0, len(user_ids), PURGE_BATCH_SIZE):
+            result = purge_users(db, user_ids[i:i + PURGE_BATCH_SIZE])
+            db.commit()
+            deleted += result["deleted"]
+            departments |= result["departments"]
+            delete_files_later(result["file_paths"], background_tasks)
+            files_queued += len(result["file_paths"])
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Bulk purge failed after {deleted} users: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Purge failed after deleting {deleted} users: {str(e)}")
+    finally:
+        if deleted:
+            invalidate_application_stats(departments)
+
+    log_action(
+        db,
+        action="PURGE_USERS",
+        user_id=current_user.id,
+        target_type="User",
+        details={"count": deleted, "role": purge_in.role, "created_before": purge_in.created_before},
+        durable=True
+    )
+    logger.info(f"Purged {deleted} inactive users by admin {current_user.id}")
+    return {"matched": len(user_ids), "deleted": deleted, "files_queued": files_queued, "dry_run": False}
+
 @router.get("/stats")
 def get_admin_stats(
     db: Session = Depends(get_db),
@@ -188,25 +245,27 @@ def get_admin_stats(
     """
     Get super admin dashboard stats
     """
-    total_users = db.query(User).count()
-    total_applications = db.query(Application).count()
-    pending_verifications = db.query(Application).filter(Application.status == ApplicationStatus.UNDER_VERIFICATION).count()
-    total_scholarships = db.query(Scholarship).count()
-    
-    return {
-        "total_users": total_users,
-        "total_applications": total_applications,
-        "pending_verifications": pending_verifications,
-        "total_scholarships": total_scholarships
-    }
+    from app.core.stats import get_admin_stats as get_cached_admin_stats
+    return get_cached_admin_stats(db)
+
+@router.get("/stats/cache")
+def get_stats_cache_counters(
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN])),
+):
+    """
+    Hit/miss counters for the dashboard stats cache
+    """
+    from app.core import cache
+    from app.core.stats import ADMIN_STATS_KEY, ALL_DEPT_STATS_KEY
+    return cache.get_counters([ADMIN_STATS_KEY, ALL_DEPT_STATS_KEY])
 
 # --- General Office / Admin Routes ---
 
 @router.get("/applications", response_model=List[schemas.ApplicationResponse])
 def get_all_applications(
+    response: Response,
     status: Optional[ApplicationStatus] = None,
-    skip: int = 0,
-    limit: int = 100,
+    pagination: CursorParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
 ) -> Any:
@@ -222,17 +281,127 @@ def get_all_applications(
     )
     if status:
         query = query.filter(Application.status == status)
-    return query.offset(skip).limit(limit).all()
+    return keyset_paginate(query, pagination, Application.id, Application.created_at, response)
+
+LISTING_SORT_FIELDS = ("created_at", "updated_at", "student_name", "scholarship_name", "status")
+
+@router.get("/applications/listing", response_model=List[schemas.ApplicationListItem])
+def get_applications_listing(
+    response: Response,
+    status: Optional[ApplicationStatus] = None,
+    department: Optional[str] = None,
+    scholarship_id: Optional[int] = None,
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None,
+    sort: str = "created_at",
+    order: str = "desc",
+    pagination: CursorParams = Depends(),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+) -> Any:
+    """
+    Dashboard listing of applications (Admin & GOffice).
+    Selects only the columns the table shows in one query instead of loading
+    full application, document and profile objects.
+    Cursor pagination is available for the default newest-first order.
+    """
+    from datetime import datetime, time
+
+    if sort not in LISTING_SORT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(LISTING_SORT_FIELDS)}")
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be 'asc' or 'desc'")
+    is_default_order = sort == "created_at" and order == "desc"
+    if pagination.is_cursor_mode and not is_default_order:
+        raise HTTPException(status_code=400, detail="Cursor pagination is only supported for newest-first ordering")
+
+    query = db.query(
+        Application.id,
+        Application.student_id,
+        Application.student_name,
+        StudentProfile.enrollment_no,
+        Application.department,
+        Application.scholarship_id,
+        Scholarship.name.label("scholarship_name"),
+        Application.status,
+        Application.total_docs,
+        Application.verified_docs,
+        Application.created_at,
+        Application.updated_at,
+    ).join(Scholarship, Scholarship.id == Application.scholarship_id)\
+     .outerjoin(StudentProfile, StudentProfile.user_id == Application.student_id)
+
+    if status:
+        query = query.filter(Application.status == status)
+    if department:
+        query = query.filter(Application.department == department)
+    if scholarship_id:
+        query = query.filter(Application.scholarship_id == scholarship_id)
+    if created_from:
+        query = query.filter(Application.created_at >= datetime.combine(created_from, time.min))
+    if created_to:
+        query = query.filter(Application.created_at <= datetime.combine(created_to, time.max))
+
+    if not is_default_order:
+        sort_column = {
+            "created_at": Application.created_at,
+            "updated_at": Application.updated_at,
+            "student_name": Application.student_name,
+            "scholarship_name": Scholarship.name,
+            "status": Application.status,
+        }[sort]
+        direction = sort_column.asc() if order == "asc" else sort_column.desc()
+        query = query.order_by(direction, Application.id)
+    elif not pagination.is_cursor_mode:
+        query = query.order_by(Application.created_at.desc(), Application.id.desc())
+
+    return keyset_paginate(query, pagination, Application.id, Application.created_at, response)
+
+@router.get("/applications/search", response_model=List[schemas.ApplicationResponse])
+def search_applications(
+    response: Response,
+    q: str,
+    status: Optional[List[ApplicationStatus]] = Query(None),
+    pagination: CursorParams = Depends(),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+) -> Any:
+    """
+    Search applications by student name, email, enrollment number or scholarship name (Admin & GOffice).
+    Every word in q must prefix-match one of those fields; results are newest first.
+    """
+    from sqlalchemy.orm import selectinload
+    from app.models.application import ApplicationDocument
+    from app.core.search import application_search_clause
+
+    clause = application_search_clause(db, q)
+    if clause is None:
+        raise HTTPException(status_code=400, detail="Search query must contain at least one word")
+
+    query = db.query(Application).options(
+        selectinload(Application.documents).selectinload(ApplicationDocument.document_format),
+        selectinload(Application.student).selectinload(User.profile)
+    ).filter(clause)
+    if status:
+        query = query.filter(Application.status.in_(status))
+    if not pagination.is_cursor_mode:
+        query = query.order_by(Application.created_at.desc(), Application.id.desc())
+    return keyset_paginate(query, pagination, Application.id, Application.created_at, response)
 
 class ApplicationStatusUpdate(BaseModel):
     status: ApplicationStatus
     remarks: Optional[str] = None
 
+STATUS_NOTIFICATIONS = {
+    ApplicationStatus.APPROVED: "application_approved",
+    ApplicationStatus.REJECTED: "application_rejected",
+    ApplicationStatus.DOCS_REQUIRED: "docs_required",
+}
+
 @router.put("/applications/{application_id}/status", response_model=schemas.ApplicationResponse)
 def update_application_status(
     application_id: int,
     status_update: ApplicationStatusUpdate,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
 ) -> Any:
@@ -243,12 +412,21 @@ def update_application_status(
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
+    previous_status = application.status
+    if status_update.status != previous_status and status_update.status not in STAFF_STATUS_TRANSITIONS[previous_status]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid status transition from '{previous_status.value}' to '{status_update.status.value}'"
+        )
     application.status = status_update.status
     if status_update.remarks:
         application.remarks = status_update.remarks
     
+    from app.core.analytics import record_status_changes
+    departments = record_status_changes(db, {application.id: previous_status}, status_update.status)
     db.commit()
     db.refresh(application)
+    invalidate_application_stats(departments)
     
     log_action(
         db, 
@@ -262,46 +440,152 @@ def update_application_status(
     
     # Email Notification
     try:
-        # Determine notification type
-        notification_type = None
-        if status_update.status == ApplicationStatus.APPROVED:
-            notification_type = "application_approved"
-        elif status_update.status == ApplicationStatus.REJECTED:
-            notification_type = "application_rejected"
-        elif status_update.status == ApplicationStatus.DOCS_REQUIRED:
-            notification_type = "docs_required"
-            
+        notification_type = STATUS_NOTIFICATIONS.get(status_update.status)
         if notification_type:
             student_user = db.query(User).filter(User.id == application.student_id).first()
             if student_user:
                 scholarship = application.scholarship # Accessed via relationship
                 
-                email_data = {
-                    "student_name": student_user.full_name,
-                    "scholarship_name": scholarship.name,
-                    "remarks": status_update.remarks,
-                    "application_id": application.id
-                }
-                
-                # Get Subject
-                subject_map = {
-                    "application_approved": "Scholarship Application Approved",
-                    "application_rejected": "Scholarship Application Status Update",
-                    "docs_required": "Action Required: Documents Needed"
-                }
-                subject = subject_map.get(notification_type, "Application Update")
-                
-                # Render Body
-                body = get_email_template(notification_type, email_data)
-                
-                # Send in Background
-                background_tasks.add_task(send_email_async, subject, [student_user.email], body)
+                # Sent by a worker over its pooled SMTP connection
+                from app.tasks.email_tasks import send_notification_task
+                send_notification_task.delay(
+                    notification_type=notification_type,
+                    recipients=[student_user.email],
+                    data={
+                        "student_name": student_user.full_name,
+                        "scholarship_name": scholarship.name,
+                        "remarks": status_update.remarks,
+                        "application_id": application.id
+                    }
+                )
                 
     except Exception as e:
         logger.error(f"Failed to queue email notification: {e}")
     
     return application
 
+class BulkStatusUpdate(BaseModel):
+    application_ids: List[int]
+    status: ApplicationStatus
+    remarks: Optional[str] = None
+
+@router.post("/applications/bulk-status")
+def bulk_update_application_status(
+    bulk_update: BulkStatusUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Move many applications to one status in a single transaction (Admin & GOffice).
+    Returns an outcome per application id.
+    """
+    from app.core.audit_logger import build_audit_row, log_actions_bulk
+    from app.core.analytics import record_status_changes
+
+    requested_ids = list(dict.fromkeys(bulk_update.application_ids))
+    if not requested_ids:
+        raise HTTPException(status_code=400, detail="No application ids given")
+    if len(requested_ids) > 1000:
+        raise HTTPException(status_code=400, detail="At most 1000 applications can be updated at once")
+
+    target = bulk_update.status
+    allowed_from = [s for s, targets in STAFF_STATUS_TRANSITIONS.items() if target in targets]
+
+    rows = db.query(
+        Application.id, Application.status, Application.student_id, Application.scholarship_id
+    ).filter(Application.id.in_(requested_ids)).all()
+    found = {row.id: row for row in rows}
+
+    outcomes = {}
+    valid_ids = []
+    for app_id in requested_ids:
+        row = found.get(app_id)
+        if not row:
+            outcomes[app_id] = "not_found"
+        elif row.status == target:
+            outcomes[app_id] = "unchanged"
+        elif row.status not in allowed_from:
+            outcomes[app_id] = "invalid_transition"
+        else:
+            valid_ids.append(app_id)
+
+    updated_ids = []
+    if valid_ids:
+        try:
+            values = {Application.status: target}
+            if bulk_update.remarks:
+                values[Application.remarks] = bulk_update.remarks
+            # Re-check the source status in the UPDATE itself so concurrent edits are not overwritten
+            db.query(Application).filter(
+                Application.id.in_(valid_ids),
+                Application.status.in_(allowed_from)
+            ).update(values, synchronize_session=False)
+
+            updated_ids = [row.id for row in db.query(Application.id).filter(
+                Application.id.in_(valid_ids),
+                Application.status == target
+            ).all()]
+
+            log_actions_bulk(db, [
+                build_audit_row(
+                    action="UPDATE_APPLICATION_STATUS",
+                    user_id=current_user.id,
+                    target_type="Application",
+                    target_id=str(app_id),
+                    details={
+                        "old_status": found[app_id].status,
+                        "new_status": target,
+                        "remarks": bulk_update.remarks,
+                        "bulk": True
+                    }
+                )
+                for app_id in updated_ids
+            ])
+            departments = record_status_changes(db, {app_id: found[app_id].status for app_id in updated_ids}, target)
+            db.commit()
+            invalidate_application_stats(departments)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Bulk status update failed: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail="Bulk status update failed")
+
+    updated_set = set(updated_ids)
+    for app_id in valid_ids:
+        outcomes[app_id] = "updated" if app_id in updated_set else "conflict"
+
+    # One batched notification job for every updated application
+    notification_type = STATUS_NOTIFICATIONS.get(target)
+    if notification_type and updated_ids:
+        try:
+            recipients = db.query(
+                Application.id, User.email, User.full_name, Scholarship.name
+            ).join(User, User.id == Application.student_id).join(
+                Scholarship, Scholarship.id == Application.scholarship_id
+            ).filter(Application.id.in_(updated_ids)).all()
+
+            notifications = [
+                {
+                    "notification_type": notification_type,
+                    "recipients": [r.email],
+                    "data": {
+                        "student_name": r.full_name,
+                        "scholarship_name": r.name,
+                        "remarks": bulk_update.remarks,
+                        "application_id": r.id
+                    }
+                }
+                for r in recipients
+            ]
+            from app.tasks.email_tasks import send_notification_batch_task
+            send_notification_batch_task.delay(notifications)
+        except Exception as e:
+            logger.error(f"Failed to queue bulk notifications: {e}")
+
+    return {
+        "updated": len(updated_ids),
+        "outcomes": [{"application_id": app_id, "outcome": outcomes[app_id]} for app_id in requested_ids]
+    }
+
 class DocumentVerificationUpdate(BaseModel):
     is_verified: bool
     remarks: Optional[str] = None
@@ -310,7 +594,6 @@ class DocumentVerificationUpdate(BaseModel):
 def verify_document(
     doc_id: int,
     verification: DocumentVerificationUpdate,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
 ):
@@ -325,6 +608,8 @@ def verify_document(
         
     doc.is_verified = verification.is_verified
     doc.remarks = verification.remarks
+    from app.core.denorm import refresh_document_counts
+    refresh_document_counts(db, [doc.application_id])
     db.commit()
     
     log_action(
@@ -345,46 +630,279 @@ def verify_document(
              app = doc.application
              student_user = db.query(User).filter(User.id == app.student_id).first()
              if student_user:
-                 email_data = {
-                    "student_name": student_user.full_name,
-                    "scholarship_name": "Application Document Update",
-                    "remarks": f"Document '{doc.document_format.name}' issue: {verification.remarks}"
-                 }
-                 body = get_email_template("docs_required", email_data)
-                 background_tasks.add_task(send_email_async, "Action Required: Document Issue", [student_user.email], body)
+                 from app.tasks.email_tasks import send_notification_task
+                 send_notification_task.delay(
+                    notification_type="docs_required",
+                    recipients=[student_user.email],
+                    data={
+                        "student_name": student_user.full_name,
+                        "scholarship_name": "Application Document Update",
+                        "remarks": f"Document '{doc.document_format.name}' issue: {verification.remarks}"
+                    }
+                 )
                  
          except Exception as e:
              logger.error(f"Failed to queue email notification: {e}")
     
     return {"message": "Document updated", "is_verified": doc.is_verified}
 
+class BulkDocumentVerificationItem(BaseModel):
+    doc_id: int
+    is_verified: bool
+    remarks: Optional[str] = None
+
+class BulkDocumentVerification(BaseModel):
+    documents: List[BulkDocumentVerificationItem]
+
+@router.put("/applications/documents/bulk-verify")
+def bulk_verify_documents(
+    verification: BulkDocumentVerification,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Verify or reject many documents, across one or more applications, in one statement.
+    Sends at most one "docs required" email per application.
+    """
+    from sqlalchemy import case
+    from app.models.application import ApplicationDocument
+    from app.models.scholarship import DocumentFormat
+    from app.core.audit_logger import build_audit_row, log_actions_bulk
+    from app.core.denorm import refresh_document_counts
+
+    # Last entry wins if a document is listed twice
+    items = {item.doc_id: item for item in verification.documents}
+    if not items:
+        raise HTTPException(status_code=400, detail="No documents given")
+    if len(items) > 1000:
+        raise HTTPException(status_code=400, detail="At most 1000 documents can be verified at once")
+
+    docs = db.query(
+        ApplicationDocument.id, ApplicationDocument.application_id, DocumentFormat.name
+    ).outerjoin(
+        DocumentFormat, DocumentFormat.id == ApplicationDocument.document_format_id
+    ).filter(ApplicationDocument.id.in_(list(items))).all()
+    found = {d.id: d for d in docs}
+    doc_ids = list(found)
+
+    if doc_ids:
+        try:
+            db.query(ApplicationDocument).filter(ApplicationDocument.id.in_(doc_ids)).update({
+                ApplicationDocument.is_verified: case(
+                    {doc_id: items[doc_id].is_verified for doc_id in doc_ids}, value=ApplicationDocument.id
+                ),
+                ApplicationDocument.remarks: case(
+                    {doc_id: items[doc_id].remarks for doc_id in doc_ids}, value=ApplicationDocument.id
+                ),
+            }, synchronize_session=False)
+
+            log_actions_bulk(db, [
+                build_audit_row(
+                    action="VERIFY_DOCUMENT",
+                    user_id=current_user.id,
+                    target_type="ApplicationDocument",
+                    target_id=str(doc_id),
+                    details={"is_verified": items[doc_id].is_verified, "remarks": items[doc_id].remarks, "bulk": True}
+                )
+                for doc_id in doc_ids
+            ])
+            refresh_document_counts(db, {d.application_id for d in docs})
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Bulk document verification failed: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail="Bulk document verification failed")
+
+    # Document counters were refreshed alongside the update
+    application_ids = sorted({d.application_id for d in docs})
+    summaries = {}
+    if application_ids:
+        counts = db.query(
+            Application.id, Application.total_docs, Application.verified_docs
+        ).filter(Application.id.in_(application_ids)).all()
+        for app_id, total, verified in counts:
+            summaries[app_id] = {
+                "application_id": app_id,
+                "total_docs": total,
+                "verified_docs": verified,
+                "all_verified": total > 0 and verified == total,
+            }
+
+    # One notification per application that has rejected documents with remarks
+    issues_by_app = {}
+    for doc_id in doc_ids:
+        item = items[doc_id]
+        if not item.is_verified and item.remarks:
+            doc = found[doc_id]
+            issues_by_app.setdefault(doc.application_id, []).append(f"Document '{doc.name}' issue: {item.remarks}")
+
+    if issues_by_app:
+        try:
+            students = db.query(
+                Application.id, User.email, User.full_name, Scholarship.name
+            ).join(User, User.id == Application.student_id).join(
+                Scholarship, Scholarship.id == Application.scholarship_id
+            ).filter(Application.id.in_(list(issues_by_app))).all()
+
+            notifications = [
+                {
+                    "notification_type": "docs_required",
+                    "recipients": [s.email],
+                    "data": {
+                        "student_name": s.full_name,
+                        "scholarship_name": s.name,
+                        "remarks": "; ".join(issues_by_app[s.id]),
+                        "application_id": s.id
+                    }
+                }
+                for s in students
+            ]
+            from app.tasks.email_tasks import send_notification_batch_task
+            send_notification_batch_task.delay(notifications)
+        except Exception as e:
+            logger.error(f"Failed to queue document notifications: {e}")
+
+    return {
+        "updated": len(doc_ids),
+        "not_found": [doc_id for doc_id in items if doc_id not in found],
+        "applications": [summaries[app_id] for app_id in application_ids if app_id in summaries]
+    }
+
+# --- Verifier Work Queue ---
+
+class WorkQueueRelease(BaseModel):
+    application_ids: List[int]
+
+def _claimed_applications(db: Session, application_ids: List[int]) -> List[Any]:
+    from sqlalchemy.orm import selectinload
+    from app.models.application import ApplicationDocument
+    return db.query(Application).options(
+        selectinload(Application.documents).selectinload(ApplicationDocument.document_format),
+        selectinload(Application.student).selectinload(User.profile),
+    ).filter(Application.id.in_(application_ids)).order_by(Application.created_at, Application.id).all()
+
+def _work_queue_payload(applications: List[Any]) -> dict:
+    from app.core.config import settings
+    return {
+        "applications": [schemas.ApplicationResponse.model_validate(a) for a in applications],
+        "lease_expires_at": {a.id: a.claimed_until for a in applications},
+        # The secure preview endpoint doubles as the thumbnail source
+        "preview_urls": {
+            doc.id: f"{settings.API_V1_STR}/applications/documents/{doc.id}/preview"
+            for a in applications for doc in a.documents
+        },
+    }
+
+@router.post("/work-queue/claim")
+def claim_work_queue(
+    count: int = 10,
+    status: ApplicationStatus = ApplicationStatus.SUBMITTED,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Claim the next unclaimed applications for the current verifier.
+    Rows locked by another verifier's claim are skipped rather than waited on,
+    and claims expire after a lease so abandoned work returns to the queue.
+    """
+    from datetime import datetime, timedelta
+    from sqlalchemy import or_
+    from app.core.config import settings
+
+    count = max(1, min(count, settings.WORK_QUEUE_MAX_CLAIM))
+    now = datetime.utcnow()
+    lease_until = now + timedelta(minutes=settings.WORK_QUEUE_LEASE_MINUTES)
+
+    try:
+        candidates = db.query(Application.id).filter(
+            Application.status == status,
+            or_(Application.claimed_until.is_(None), Application.claimed_until < now)
+        ).order_by(Application.created_at, Application.id).limit(count).with_for_update(skip_locked=True).all()
+        claimed_ids = [row.id for row in candidates]
+
+        if claimed_ids:
+            db.query(Application).filter(Application.id.in_(claimed_ids)).update(
+                {Application.claimed_by: current_user.id, Application.claimed_until: lease_until},
+                synchronize_session=False
+            )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Work queue claim failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to claim applications")
+
+    applications = _claimed_applications(db, claimed_ids) if claimed_ids else []
+    return _work_queue_payload(applications)
+
+@router.get("/work-queue/mine")
+def get_my_work_queue(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Applications currently leased to the current verifier
+    """
+    from datetime import datetime
+    claimed_ids = [row.id for row in db.query(Application.id).filter(
+        Application.claimed_by == current_user.id,
+        Application.claimed_until >= datetime.utcnow()
+    ).all()]
+    applications = _claimed_applications(db, claimed_ids) if claimed_ids else []
+    return _work_queue_payload(applications)
+
+@router.post("/work-queue/release")
+def release_work_queue(
+    release: WorkQueueRelease,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Hand claimed applications back to the queue
+    """
+    released = db.query(Application).filter(
+        Application.id.in_(release.application_ids),
+        Application.claimed_by == current_user.id
+    ).update({Application.claimed_by: None, Application.claimed_until: None}, synchronize_session=False)
+    db.commit()
+    return {"released": released}
+
 # --- Dept Head Routes ---
 
 @router.get("/dept/students", response_model=List[schemas.StudentProfileResponse])
 def get_dept_students(
+    response: Response,
+    pagination: CursorParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.RoleChecker([UserRole.DEPT_HEAD, UserRole.ADMIN])),
 ) -> Any:
     """
-    Get students in the department
+    Get students in the department.
+    Returns every student unless a cursor is given.
     """
     query = db.query(StudentProfile)
     if current_user.role == UserRole.DEPT_HEAD and current_user.department:
         query = query.filter(StudentProfile.department == current_user.department)
-    return query.all()
+    if not pagination.is_cursor_mode:
+        return query.all()
+    return keyset_paginate(query, pagination, StudentProfile.id, response=response)
 
 @router.get("/dept/applications", response_model=List[schemas.ApplicationResponse])
 def get_dept_applications(
+    response: Response,
+    pagination: CursorParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.RoleChecker([UserRole.DEPT_HEAD, UserRole.ADMIN])),
 ) -> Any:
     """
-    Get applications for the department
+    Get applications for the department.
+    Returns every application unless a cursor is given.
     """
-    query = db.query(Application).join(StudentProfile, Application.student_id == StudentProfile.user_id)
+    query = db.query(Application)
     if current_user.role == UserRole.DEPT_HEAD and current_user.department:
-        query = query.filter(StudentProfile.department == current_user.department)
-    return query.all()
+        query = query.filter(Application.department == current_user.department)
+    if not pagination.is_cursor_mode:
+        return query.all()
+    return keyset_paginate(query, pagination, Application.id, Application.created_at, response)
 
 @router.get("/dept/stats")
 def get_dept_stats(
@@ -392,32 +910,24 @@ def get_dept_stats(
     current_user: User = Depends(deps.RoleChecker([UserRole.DEPT_HEAD, UserRole.ADMIN])),
 ):
     """
-    Get department statistics
+    Get department statistics (all departments combined for admins)
     """
-    student_query = db.query(StudentProfile)
-    app_query = db.query(Application).join(StudentProfile, Application.student_id == StudentProfile.user_id)
-    
+    from app.core.stats import get_department_stats, get_all_department_stats, combine_department_stats
+
     if current_user.role == UserRole.DEPT_HEAD and current_user.department:
-        student_query = student_query.filter(StudentProfile.department == current_user.department)
-        app_query = app_query.filter(StudentProfile.department == current_user.department)
-    
-    total_students = student_query.count()
-    total_applications = app_query.count()
-    pending_applications = app_query.filter(Application.status == ApplicationStatus.SUBMITTED).count()
-    approved_applications = app_query.filter(Application.status == ApplicationStatus.APPROVED).count()
-    
-    return {
-        "total_students": total_students,
-        "total_applications": total_applications,
-        "pending_applications": pending_applications,
-        "approved_applications": approved_applications
-    }
+        return get_department_stats(db, current_user.department)
+    return combine_department_stats(get_all_department_stats(db))
 
-    return {
-        "total_students": total_students,
-        "total_applications": total_applications,
-        "pending_applications": pending_applications
-    }
+@router.get("/dept/stats/all")
+def get_all_dept_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Statistics for every department at once, for the cross-department overview
+    """
+    from app.core.stats import get_all_department_stats
+    return get_all_department_stats(db)
 
 # --- Super Admin Enhancements ---
 
@@ -426,52 +936,149 @@ from app.models.audit import AuditLog
 from app.models.university import Department, SessionYear
 from app.schemas import schemas
 from fastapi.responses import StreamingResponse
-import csv
-import io
 
 @router.get("/audit-logs")
 def get_audit_logs(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    pagination: CursorParams = Depends(),
+    user_id: Optional[int] = None,
+    action: Optional[str] = None,
+    target_type: Optional[str] = None,
+    target_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN])),
 ):
     """
     Get audit logs (Super Admin only)
+    Filters by user, action, target (target_id requires target_type) and time range.
+    Rows older than the retention age live in the archive files, not here.
+    """
+    if target_id is not None and not target_type:
+        raise HTTPException(status_code=400, detail="target_id requires target_type")
+
+    query = db.query(AuditLog)
+    if user_id is not None:
+        query = query.filter(AuditLog.user_id == user_id)
+    if action:
+        query = query.filter(AuditLog.action == action)
+    if target_type:
+        query = query.filter(AuditLog.target_type == target_type)
+    if target_id is not None:
+        query = query.filter(AuditLog.target_id == target_id)
+    if since:
+        query = query.filter(AuditLog.timestamp >= since)
+    if until:
+        query = query.filter(AuditLog.timestamp <= until)
+    query = query.order_by(AuditLog.timestamp.desc())
+    return keyset_paginate(query, pagination, AuditLog.id, AuditLog.timestamp, response)
+
+@router.get("/audit-logs/writer")
+def get_audit_writer_stats(
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN])),
+):
     """
-    return db.query(AuditLog).order_by(AuditLog.timestamp.desc()).offset(skip).limit(limit).all()
+    Buffered audit writer counters for this process (Super Admin only)
+    """
+    from app.core.audit_writer import audit_writer
+    return audit_writer.stats()
 
 @router.get("/server-logs")
 def get_server_logs(
-    lines: int = 1000,
+    lines: int = Query(1000, ge=1, le=10000),
+    level: Optional[str] = None,
+    contains: Optional[str] = None,
     current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN])),
 ):
     """
-    Get server logs (Super Admin only)
+    Get the last lines of the server log (Super Admin only).
+    level keeps lines at or above that level; contains is a case-insensitive substring.
     """
-    import os
-    
-    log_file = "server.log" # Assumes in root or current working dir logic
-    
-    # Try different locations if not found
-    if not os.path.exists(log_file):
-        # try backend/server.log if running from root
-        if os.path.exists("backend/server.log"):
-            log_file = "backend/server.log"
-        elif os.path.exists("../server.log"):
-            log_file = "../server.log"
-        else:
-             return {"logs": ["Log file not found."]}
+    from app.core.log_reader import find_server_log, line_filter, tail_lines, LOG_LEVELS
+
+    if level and level.upper() not in LOG_LEVELS:
+        raise HTTPException(status_code=400, detail=f"level must be one of: {', '.join(LOG_LEVELS)}")
+
+    log_file = find_server_log()
+    if not log_file:
+        return {"logs": ["Log file not found."]}
 
     try:
-        # Efficiently read last N lines
-        with open(log_file, "r") as f:
-            # Simple approach for now
-            all_lines = f.readlines()
-            return {"logs": all_lines[-lines:]}
+        return {"logs": tail_lines(log_file, lines, line_filter(level, contains))}
     except Exception as e:
         return {"logs": [f"Error reading log file: {str(e)}"]}
 
+@router.get("/server-logs/stream")
+async def stream_server_logs(
+    request: Request,
+    level: Optional[str] = None,
+    contains: Optional[str] = None,
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN])),
+):
+    """
+    Follow the server log as Server-Sent Events (Super Admin only).
+    Each new line matching the filters is sent as one event.
+    """
+    from app.core.log_reader import find_server_log, line_filter, follow_lines, LOG_LEVELS
+
+    if level and level.upper() not in LOG_LEVELS:
+        raise HTTPException(status_code=400, detail=f"level must be one of: {', '.join(LOG_LEVELS)}")
+    log_file = find_server_log()
+    if not log_file:
+        raise HTTPException(status_code=404, detail="Log file not found")
+
+    async def events():
+        idle_polls = 0
+        async for line in follow_lines(log_file, line_filter(level, contains), is_disconnected=request.is_disconnected):
+            if line is None:
+                idle_polls += 1
+                # Comment lines keep proxies from closing an idle stream
+                if idle_polls % 15 == 0:
+                    yield ": keep-alive\n\n"
+                continue
+            idle_polls = 0
+            yield f"data: {line}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/logs/query")
+def query_structured_logs(
+    level: Optional[str] = None,
+    route: Optional[str] = None,
+    since_minutes: Optional[int] = Query(60, ge=1, le=60 * 24 * 31),
+    request_id: Optional[str] = None,
+    user_id: Optional[int] = None,
+    contains: Optional[str] = None,
+    limit: int = Query(200, ge=1, le=5000),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN])),
+):
+    """
+    Search the structured JSON logs, newest first (Super Admin only).
+    route is the path template, e.g. /api/v1/admin/applications/{application_id}.
+    Rotated files outside the time range, or without matching errors, are skipped via their index.
+    """
+    from datetime import datetime, timedelta
+    from app.core.log_index import query_logs, format_ts, LOG_LEVELS
+
+    if level and level.upper() not in LOG_LEVELS:
+        raise HTTPException(status_code=400, detail=f"level must be one of: {', '.join(LOG_LEVELS)}")
+    since = format_ts(datetime.utcnow() - timedelta(minutes=since_minutes)) if since_minutes else None
+
+    try:
+        records = query_logs(
+            level=level, route=route, since=since, request_id=request_id,
+            user_id=user_id, contains=contains, limit=limit
+        )
+    except Exception as e:
+        logger.error(f"Log query failed: {e}")
+        raise HTTPException(status_code=500, detail="Failed to query logs")
+    return {"since": since, "count": len(records), "records": records}
+
 @router.get("/analytics/dashboard")
 def get_analytics_dashboard(
     db: Session = Depends(get_db),
@@ -480,72 +1087,222 @@ def get_analytics_dashboard(
     """
     Get comprehensive analytics for dashboard (Admin & GOffice)
     """
-    # Department-wise application distribution
-    dept_stats = db.query(
-        StudentProfile.department, 
-        func.count(Application.id)
-    ).join(
-        Application, StudentProfile.user_id == Application.student_id
-    ).group_by(StudentProfile.department).all()
-    dept_data = [{"name": d[0] or "Unknown", "value": d[1]} for d in dept_stats]
-    
-    # Category-wise
-    cat_stats = db.query(StudentProfile.category, func.count(StudentProfile.id)).group_by(StudentProfile.category).all()
-    cat_data = [{"name": c[0] or "Unknown", "value": c[1]} for c in cat_stats]
-    
-    # Gender-wise
-    gender_stats = db.query(StudentProfile.gender, func.count(StudentProfile.id)).group_by(StudentProfile.gender).all()
-    gender_data = [{"name": g[0] or "Unknown", "value": g[1]} for g in gender_stats]
-    
-    # Application Status
-    status_stats = db.query(Application.status, func.count(Application.id)).group_by(Application.status).all()
-    status_data = [{"name": str(s[0].value) if hasattr(s[0], 'value') else str(s[0]), "value": s[1]} for s in status_stats]
+    from app.core import analytics, cache
+    from app.core.config import settings
+    from app.models.analytics import ApplicationRollup
+
+    # Application counts come from the rollup tables
+    dept_data = analytics.distribution(db, ApplicationRollup.department)
+    status_data = analytics.distribution(db, ApplicationRollup.status)
+
+    # Category and gender count students rather than applications, so they stay
+    # on student_profiles, behind the shared short-TTL cache
+    def profile_distributions():
+        cat_stats = db.query(StudentProfile.category, func.count(StudentProfile.id)).group_by(StudentProfile.category).all()
+        gender_stats = db.query(StudentProfile.gender, func.count(StudentProfile.id)).group_by(StudentProfile.gender).all()
+        return {
+            "category": [{"name": c[0] or "Unknown", "value": c[1]} for c in cat_stats],
+            "gender": [{"name": g[0] or "Unknown", "value": g[1]} for g in gender_stats],
+        }
+    profile_data = cache.get_or_set("analytics-profile-distributions", settings.STATS_CACHE_TTL_SECONDS, profile_distributions)
     
     return {
         "department_distribution": dept_data,
-        "category_distribution": cat_data,
-        "gender_distribution": gender_data,
+        "category_distribution": profile_data["category"],
+        "gender_distribution": profile_data["gender"],
         "application_status": status_data
     }
 
+@router.get("/analytics/timeseries")
+def get_analytics_timeseries(
+    days: int = Query(90, ge=1, le=366),
+    weeks: int = Query(12, ge=1, le=52),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Applications created per day and approvals per week (Admin & GOffice)
+    """
+    from app.core import analytics
+    return {
+        "applications_per_day": analytics.applications_per_day(db, days),
+        "approvals_per_week": analytics.transitions_per_week(db, ApplicationStatus.APPROVED, weeks),
+    }
+
 @router.get("/export/{export_type}")
 def export_data(
     export_type: str,
-    db: Session = Depends(get_db),
+    gzip: bool = False,
     current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
 ):
     """
-    Export data as CSV
+    Export data as CSV, streamed from a server-side cursor (optionally gzipped)
     """
-    stream = io.StringIO()
-    writer = csv.writer(stream)
-    
+    from app.core.exports import csv_export_response, enum_value
+
     if export_type == "applicants":
-        writer.writerow(["ID", "Name", "Email", "Role", "Joined At"])
-        users = db.query(User).all()
-        for user in users:
-            writer.writerow([user.id, user.full_name, user.email, user.role, user.created_at])
-            
+        header = ["ID", "Name", "Email", "Role", "Joined At"]
+        def build_query(db):
+            return db.query(User.id, User.full_name, User.email, User.role, User.created_at).order_by(User.id)
+        def format_row(row):
+            return [row.id, row.full_name, row.email, enum_value(row.role), row.created_at]
+
     elif export_type == "applications":
-        writer.writerow(["App ID", "Student ID", "Scholarship ID", "Status", "Remarks", "Created At"])
-        apps = db.query(Application).all()
-        for app in apps:
-            writer.writerow([app.id, app.student_id, app.scholarship_id, app.status, app.remarks, app.created_at])
-            
+        header = ["App ID", "Student ID", "Scholarship ID", "Status", "Remarks", "Created At",
+                  "Student Name", "Email", "Enrollment No", "Department", "Scholarship"]
+        def build_query(db):
+            return db.query(
+                Application.id, Application.student_id, Application.scholarship_id, Application.status,
+                Application.remarks, Application.created_at,
+                User.full_name, User.email, StudentProfile.enrollment_no, StudentProfile.department,
+                Scholarship.name.label("scholarship_name")
+            ).join(User, User.id == Application.student_id)\
+             .join(Scholarship, Scholarship.id == Application.scholarship_id)\
+             .outerjoin(StudentProfile, StudentProfile.user_id == Application.student_id)\
+             .order_by(Application.id)
+        def format_row(row):
+            return [row.id, row.student_id, row.scholarship_id, enum_value(row.status), row.remarks, row.created_at,
+                    row.full_name, row.email, row.enrollment_no, row.department, row.scholarship_name]
+
     else:
         raise HTTPException(status_code=400, detail="Invalid export type")
-        
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = f"attachment; filename={export_type}.csv"
-    return response
+
+    return csv_export_response(f"{export_type}.csv", header, build_query, format_row, gzip=gzip)
+
+# --- Background Export Jobs ---
+
+from app.models.export_job import ExportJob, ExportJobStatus
+
+def _get_export_job(db: Session, job_id: int, current_user: User) -> ExportJob:
+    job = db.query(ExportJob).filter(ExportJob.id == job_id).first()
+    # Jobs may hold bank and income details, so only the requester or a super admin can see them
+    if not job or (current_user.role != UserRole.ADMIN and job.created_by != current_user.id):
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return job
+
+@router.get("/export-jobs/entities")
+def get_export_entities(
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Columns and filters available to export jobs, per entity
+    """
+    from app.core.export_jobs import ENTITIES
+    return {
+        name: {"columns": list(spec["columns"]), "filters": list(spec["filters"])}
+        for name, spec in ENTITIES.items()
+    }
+
+@router.post("/export-jobs", response_model=schemas.ExportJobResponse)
+def create_export_job(
+    job_in: schemas.ExportJobCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Queue a background export (Admin & GOffice). Poll the job for progress,
+    then fetch the file from its download endpoint.
+    """
+    from app.core.export_jobs import validate_export_spec, check_format_available
+    try:
+        validate_export_spec(job_in.entity, job_in.columns, job_in.filters)
+        check_format_available(job_in.format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    job = ExportJob(
+        created_by=current_user.id,
+        entity=job_in.entity,
+        columns=job_in.columns,
+        filters=job_in.filters,
+        format=job_in.format,
+        status=ExportJobStatus.QUEUED
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    try:
+        from app.tasks.export_tasks import run_export_job_task
+        run_export_job_task.delay(job.id)
+    except Exception as e:
+        logger.error(f"Failed to queue export job {job.id}: {e}")
+        job.status = ExportJobStatus.FAILED
+        job.error = "Could not queue the export job"
+        db.commit()
+        db.refresh(job)
+
+    log_action(
+        db,
+        action="CREATE_EXPORT_JOB",
+        user_id=current_user.id,
+        target_type="ExportJob",
+        target_id=str(job.id),
+        details={"entity": job_in.entity, "columns": job_in.columns, "filters": job_in.filters, "format": job_in.format}
+    )
+    return job
+
+@router.get("/export-jobs", response_model=List[schemas.ExportJobResponse])
+def get_export_jobs(
+    limit: int = Query(50, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Recent export jobs of the current user
+    """
+    return db.query(ExportJob).filter(ExportJob.created_by == current_user.id)\
+        .order_by(ExportJob.created_at.desc(), ExportJob.id.desc()).limit(limit).all()
+
+@router.get("/export-jobs/{job_id}", response_model=schemas.ExportJobResponse)
+def get_export_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Status and progress of an export job
+    """
+    return _get_export_job(db, job_id, current_user)
+
+@router.get("/export-jobs/{job_id}/download")
+def download_export_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Download the file produced by a completed export job
+    """
+    import os
+    from fastapi.responses import FileResponse
+    from app.core.export_jobs import WRITERS
+
+    job = _get_export_job(db, job_id, current_user)
+    if job.status != ExportJobStatus.COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Export job is {job.status.value}")
+    if not job.file_path or not os.path.exists(job.file_path):
+        raise HTTPException(status_code=410, detail="Export file is no longer available")
+
+    media_types = {
+        "csv.gz": "application/gzip",
+        "parquet": "application/vnd.apache.parquet",
+        "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    }
+    extension = WRITERS[job.format][1]
+    return FileResponse(
+        job.file_path,
+        media_type=media_types[extension],
+        filename=f"{job.entity}_export_{job.id}.{extension}"
+    )
 
 # --- Communication Routes ---
 
 class EmailRequest(BaseModel):
     subject: str
     body: str
-    target_group: str # "all", "department", "scholarship", "custom"
-    target_id: Optional[str] = None # Dept Name, Scholarship ID, etc.
+    target_group: str # "all", "department", "branch", "scholarship", "eligible", "custom"
+    target_id: Optional[str] = None # Dept/Branch Name or Scholarship ID (applicants, or eligible students)
     custom_recipients: Optional[List[str]] = [] # List of emails
 
 @router.post("/communications/email/send")
@@ -557,63 +1314,122 @@ def send_custom_email(
 ):
     """
     Send custom email to students
+    Creates a campaign that a worker sends in chunks, one message per recipient,
+    under the configured rate limit. Track it with GET /communications/campaigns/{id}.
     """
+    from app.core.config import settings
+    from app.core.email_campaigns import count_campaign_recipients, enqueue_campaign
+    from app.core.recipients import validate_target
+    from app.models.email_campaign import EmailCampaign
+
     try:
-        recipients = []
-        
-        if email_req.target_group == "all":
-            users = db.query(User).filter(User.role == UserRole.STUDENT).all()
-            recipients = [u.email for u in users]
-            
-        elif email_req.target_group == "department":
-            if not email_req.target_id:
-                 raise HTTPException(status_code=400, detail="Department name required")
-            profiles = db.query(StudentProfile).filter(StudentProfile.department == email_req.target_id).all()
-            # Get emails from User table
-            user_ids = [p.user_id for p in profiles]
-            users = db.query(User).filter(User.id.in_(user_ids)).all()
-            recipients = [u.email for u in users]
-            
-        elif email_req.target_group == "branch":
-            if not email_req.target_id:
-                 raise HTTPException(status_code=400, detail="Branch name required")
-            profiles = db.query(StudentProfile).filter(StudentProfile.branch == email_req.target_id).all()
-            # Get emails from User table
-            user_ids = [p.user_id for p in profiles]
-            users = db.query(User).filter(User.id.in_(user_ids)).all()
-            recipients = [u.email for u in users]
-            
-        elif email_req.target_group == "scholarship":
-            if not email_req.target_id:
-                 raise HTTPException(status_code=400, detail="Scholarship ID required")
-            # Get applicants
-            apps = db.query(Application).filter(Application.scholarship_id == int(email_req.target_id)).all()
-            user_ids = [app.student_id for app in apps]
-            users = db.query(User).filter(User.id.in_(user_ids)).all()
-            recipients = [u.email for u in users]
-            
-        elif email_req.target_group == "custom":
-            recipients = email_req.custom_recipients
-            
-        if not recipients:
-            return {"message": "No recipients found", "count": 0}
-            
-        # Render Template
-        body = get_email_template("custom_message", {"body": email_req.body})
-        
-        # Send in Background
-        # We send as a single batch since send_email_async handles list of recipients
-        background_tasks.add_task(send_email_async, email_req.subject, recipients, body)
+        validate_target(email_req.target_group, email_req.target_id, email_req.custom_recipients)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
+    try:
+        campaign = EmailCampaign(
+            created_by=current_user.id,
+            subject=email_req.subject,
+            body=email_req.body,
+            target_group=email_req.target_group,
+            target_id=email_req.target_id,
+            custom_recipients=email_req.custom_recipients if email_req.target_group == "custom" else None,
+            chunk_size=settings.EMAIL_CAMPAIGN_CHUNK_SIZE,
+        )
+        recipient_count = count_campaign_recipients(db, campaign)
+        if not recipient_count:
+            return {"message": "No recipients found", "count": 0}
+        db.add(campaign)
+        db.commit()
+        db.refresh(campaign)
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to queue email notification: {e}")
-        # We don't return error to client if queuing fails logic-wise, but here strict failure is ok
-        # However, we want to know if it failed.
-        # But for background tasks, the request should return success if task was added.
-        # If logic *before* task addition fails, we return error.
+        db.rollback()
+        logger.error(f"Failed to create email campaign: {e}")
         return {"message": "Failed to queue email", "error": str(e)}
-    
-    return {"message": "Email queued", "count": len(recipients)}
+
+    # No broker: sent from this process after the response instead
+    enqueue_campaign(campaign.id, background_tasks)
+
+    return {"message": "Email queued", "count": recipient_count, "campaign_id": campaign.id}
+
+@router.get("/communications/campaigns", response_model=List[schemas.EmailCampaignResponse])
+def list_email_campaigns(
+    response: Response,
+    pagination: CursorParams = Depends(),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Email campaigns, newest first
+    """
+    from app.models.email_campaign import EmailCampaign
+    query = db.query(EmailCampaign).order_by(EmailCampaign.created_at.desc())
+    return keyset_paginate(query, pagination, EmailCampaign.id, EmailCampaign.created_at, response)
+
+@router.get("/communications/campaigns/{campaign_id}", response_model=schemas.EmailCampaignDetail)
+def get_email_campaign(
+    campaign_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Campaign progress with per-chunk status and failed recipients
+    """
+    from app.models.email_campaign import EmailCampaign, EmailCampaignChunk
+
+    campaign = db.query(EmailCampaign).filter(EmailCampaign.id == campaign_id).first()
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Email campaign not found")
+
+    # Recipient lists stay in the database; only their sizes are returned
+    chunks = db.query(
+        EmailCampaignChunk.chunk_index,
+        EmailCampaignChunk.status,
+        EmailCampaignChunk.recipient_count,
+        EmailCampaignChunk.sent_count,
+        EmailCampaignChunk.sent_offset,
+        EmailCampaignChunk.failures,
+        EmailCampaignChunk.sent_at,
+    ).filter(EmailCampaignChunk.campaign_id == campaign_id).order_by(EmailCampaignChunk.chunk_index).all()
+
+    detail = schemas.EmailCampaignDetail.model_validate(campaign)
+    detail.chunks = [schemas.EmailCampaignChunkResponse(**row._asdict()) for row in chunks]
+    return detail
+
+@router.post("/communications/campaigns/{campaign_id}/resume", response_model=schemas.EmailCampaignResponse)
+def resume_email_campaign(
+    campaign_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Resume a failed campaign, or one whose worker stopped, from its first unsent recipient
+    """
+    from app.core.email_campaigns import enqueue_campaign, requeue_campaign
+    from app.models.email_campaign import EmailCampaign
+
+    campaign = db.query(EmailCampaign).filter(EmailCampaign.id == campaign_id).first()
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Email campaign not found")
+    if not requeue_campaign(db, campaign):
+        raise HTTPException(status_code=409, detail=f"Email campaign is {campaign.status.value} and cannot be resumed")
+    db.commit()
+    db.refresh(campaign)
+    enqueue_campaign(campaign.id, background_tasks)
+
+    log_action(
+        db,
+        action="RESUME_EMAIL_CAMPAIGN",
+        user_id=current_user.id,
+        target_type="EmailCampaign",
+        target_id=str(campaign.id)
+    )
+    return campaign
 
 # --- Department Management Routes ---
 
@@ -1,5 +1,5 @@
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from app.db.database import get_db
@@ -11,6 +11,7 @@ from app.models.application import ApplicationDocument
 from app.models.scholarship import DocumentFormat
 from app.schemas import schemas
 from app.api import deps
+from app.core.stats import invalidate_application_stats
 import json
 import logging
 import os
@@ -20,6 +21,47 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+FILE_EXT_MAP = {
+    "application/pdf": "pdf",
+    "image/jpeg": "jpg",
+    "image/png": "png"
+}
+
+def check_requirement(req: Any, doc: Any) -> tuple:
+    """
+    Check a vault document against a scholarship document requirement.
+    Returns (status, detail): status is "ok", "missing", "invalid_type" or "too_many_pages".
+    """
+    name = req.document_format.name if req.document_format else f"Document #{req.document_format_id}"
+    if not doc:
+        return "missing", f"{name} (Missing)"
+
+    # Check MIME Type
+    # allowed_types is list like ["pdf", "jpg", "png"]
+    # stored mime_type is "application/pdf", "image/jpeg"
+    doc_ext = FILE_EXT_MAP.get(doc.mime_type, "unknown")
+    # Normalize allowed types to lowercase just in case
+    allowed = [t.lower() for t in (req.allowed_types or ["pdf"])]
+
+    # Special case: allow 'jpg' to match 'jpeg'
+    if doc_ext == "jpg" and "jpeg" in allowed: pass
+    elif doc_ext not in allowed:
+        is_valid_type = False
+        for t in allowed:
+            if t in ["jpg", "jpeg"] and doc.mime_type == "image/jpeg": is_valid_type = True
+            if t == "png" and doc.mime_type == "image/png": is_valid_type = True
+            if t == "pdf" and doc.mime_type == "application/pdf": is_valid_type = True
+
+        if not is_valid_type:
+            return "invalid_type", f"{name} (Invalid Type: {doc_ext}, Allowed: {', '.join(allowed)})"
+
+    # Check Page Count (Only for PDF and if limit set)
+    if doc.mime_type == "application/pdf" and req.max_pages:
+        if (doc.page_count or 0) > req.max_pages:
+            return "too_many_pages", f"{name} (Too many pages: {doc.page_count}, Max: {req.max_pages})"
+
+    return "ok", None
+
 @router.post("/apply", response_model=schemas.ApplicationResponse)
 def apply_for_scholarship(
     application_in: schemas.ApplicationCreate,
@@ -42,19 +84,17 @@ def apply_for_scholarship(
     if existing_app:
         raise HTTPException(status_code=400, detail="Already applied for this scholarship")
 
-    # Check Mutual Exclusion
-    user_apps = db.query(Application).filter(
-        Application.student_id == current_user.id,
-        Application.status != ApplicationStatus.REJECTED
-    ).all()
-    
-    applied_scholarship_ids = [app.scholarship_id for app in user_apps]
-    
-    if scholarship.mutually_exclusive_ids:
-        excluded_ids = scholarship.mutually_exclusive_ids
-        for app_id in applied_scholarship_ids:
-            if app_id in excluded_ids:
-                 raise HTTPException(status_code=400, detail="Cannot apply due to mutual exclusion rules")
+    # Check Mutual Exclusion (symmetric: A excludes B also means B excludes A)
+    from app.core.conflicts import get_conflict_graph
+    excluded_ids = get_conflict_graph(db).neighbours(scholarship.id)
+    if excluded_ids:
+        conflict = db.query(Application.id).filter(
+            Application.student_id == current_user.id,
+            Application.status != ApplicationStatus.REJECTED,
+            Application.scholarship_id.in_(excluded_ids)
+        ).first()
+        if conflict:
+            raise HTTPException(status_code=400, detail="Cannot apply due to mutual exclusion rules")
 
     # Create Application
     application = Application(
@@ -65,16 +105,6 @@ def apply_for_scholarship(
     )
     db.add(application)
     db.flush() # Get ID
-    
-    from app.core.audit_logger import log_action
-    log_action(
-        db, 
-        action="SUBMIT_APPLICATION", 
-        user_id=current_user.id, 
-        target_type="Application", 
-        target_id=str(application.id), 
-        details={"scholarship_id": application_in.scholarship_id}
-    )
 
     # Email Notification
     try:
@@ -110,44 +140,9 @@ def apply_for_scholarship(
         if req.is_mandatory:
             # Find matching document
             match = next((d for d in student_docs if d.document_format_id == req.document_format_id), None)
-            
-            if not match:
-                missing_docs.append(f"{req.document_format.name} (Missing)")
-                continue
-
-            # Check MIME Type
-            # allowed_types is list like ["pdf", "jpg", "png"]
-            # stored mime_type is "application/pdf", "image/jpeg"
-            file_ext_map = {
-                "application/pdf": "pdf",
-                "image/jpeg": "jpg",
-                "image/png": "png"
-            }
-            
-            doc_ext = file_ext_map.get(match.mime_type, "unknown")
-            # Normalize allowed types to lowercase just in case
-            allowed = [t.lower() for t in (req.allowed_types or ["pdf"])]
-            
-            # Special case: allow 'jpg' to match 'jpeg'
-            if doc_ext == "jpg" and "jpeg" in allowed: pass 
-            elif doc_ext not in allowed:
-                # If "jpg" is allowed, allow "image/jpeg"
-                # Simple check:
-                is_valid_type = False
-                for t in allowed:
-                    if t in ["jpg", "jpeg"] and match.mime_type == "image/jpeg": is_valid_type = True
-                    if t == "png" and match.mime_type == "image/png": is_valid_type = True
-                    if t == "pdf" and match.mime_type == "application/pdf": is_valid_type = True
-                
-                if not is_valid_type:
-                     missing_docs.append(f"{req.document_format.name} (Invalid Type: {doc_ext}, Allowed: {', '.join(allowed)})")
-                     continue
-
-            # Check Page Count (Only for PDF and if limit set)
-            if match.mime_type == "application/pdf" and req.max_pages:
-                 if (match.page_count or 0) > req.max_pages:
-                     missing_docs.append(f"{req.document_format.name} (Too many pages: {match.page_count}, Max: {req.max_pages})")
-                     continue
+            status, detail = check_requirement(req, match)
+            if status != "ok":
+                missing_docs.append(detail)
 
     if missing_docs:
         raise HTTPException(status_code=400, detail=f"Document Validation Failed: {'; '.join(missing_docs)}")
@@ -211,9 +206,27 @@ def apply_for_scholarship(
         linked_count += 1
     
     
+    from app.core.denorm import refresh_document_counts, sync_student_fields
+    from app.core.analytics import record_applications_created
+    refresh_document_counts(db, [application.id])
+    # The new application is counted below, already under the synced fields
+    sync_student_fields(db, [current_user.id], move_rollups=False)
+    departments = record_applications_created(db, [application.id])
+
     # Commit all document links
     db.commit()
+    invalidate_application_stats(departments)
     db.refresh(application)
+
+    from app.core.audit_logger import log_action
+    log_action(
+        db, 
+        action="SUBMIT_APPLICATION", 
+        user_id=current_user.id, 
+        target_type="Application", 
+        target_id=str(application.id), 
+        details={"scholarship_id": application_in.scholarship_id}
+    )
     
     return application
 
@@ -242,6 +255,7 @@ def update_application(
         raise HTTPException(status_code=400, detail="Application cannot be updated in current status")
         
     # Update Status and Remarks
+    previous_status = application.status
     application.status = ApplicationStatus.SUBMITTED
     application.remarks = application_in.remarks # Student's new remarks
     
@@ -304,8 +318,13 @@ def update_application(
             logger.error(f"File missing during update for doc {doc.id}: {e}")
             continue
 
+    from app.core.denorm import refresh_document_counts
+    from app.core.analytics import record_status_changes
+    refresh_document_counts(db, [application.id])
+    departments = record_status_changes(db, {application.id: previous_status}, ApplicationStatus.SUBMITTED)
     db.commit()
     db.refresh(application)
+    invalidate_application_stats(departments)
     
     # Audit
     from app.core.audit_logger import log_action
@@ -320,15 +339,179 @@ def update_application(
     
     return application
 
-@router.get("/", response_model=List[schemas.ApplicationResponse])
+from app.api.pagination import CursorParams, keyset_paginate
+
+@router.get("/", response_model=List[schemas.ApplicationWithScholarshipResponse])
 def get_my_applications(
+    response: Response,
+    expand: Optional[str] = None,
+    pagination: CursorParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """
-    Get current user's applications
+    Get current user's applications.
+    Returns every application unless a cursor is given.
+    With expand=scholarship, each application embeds a scholarship summary and its
+    documents are preloaded, so the list is served in a fixed number of queries.
+    """
+    from sqlalchemy.orm import selectinload, noload
+
+    query = db.query(Application).filter(Application.student_id == current_user.id)
+    if expand == "scholarship":
+        query = query.options(
+            selectinload(Application.scholarship),
+            selectinload(Application.documents).selectinload(ApplicationDocument.document_format),
+            selectinload(Application.student).selectinload(User.profile),
+        )
+    else:
+        query = query.options(noload(Application.scholarship))
+    if not pagination.is_cursor_mode:
+        return query.all()
+    return keyset_paginate(query, pagination, Application.id, Application.created_at, response)
+
+from fastapi import Query
+
+@router.get("/conflicts")
+def get_my_conflicts(
+    scholarship_ids: Optional[List[int]] = Query(None, description="Scholarships to check; defaults to all active"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.get_current_user),
+):
+    """
+    For each scholarship, list the current user's applications that conflict with it
+    """
+    from app.core.conflicts import get_conflict_graph
+    graph = get_conflict_graph(db)
+
+    if scholarship_ids is None:
+        scholarship_ids = [row.id for row in db.query(Scholarship.id).filter(Scholarship.is_active == True).all()]
+
+    user_apps = db.query(Application.id, Application.scholarship_id, Application.status).filter(
+        Application.student_id == current_user.id,
+        Application.status != ApplicationStatus.REJECTED
+    ).all()
+
+    apps_by_scholarship = {}
+    for app in user_apps:
+        apps_by_scholarship.setdefault(app.scholarship_id, []).append(app)
+
+    conflicts = {}
+    for scholarship_id in scholarship_ids:
+        conflicting = graph.conflicting_applications(scholarship_id, apps_by_scholarship)
+        conflicts[scholarship_id] = [
+            {"application_id": app.id, "scholarship_id": app.scholarship_id, "status": app.status}
+            for app in conflicting
+        ]
+
+    return {"conflicts": conflicts}
+
+def _load_scholarship(session: Session, scholarship_id: int):
+    from sqlalchemy.orm import joinedload
+    from app.models.scholarship import ScholarshipDocumentRequirement
+    scholarship = session.query(Scholarship).options(
+        joinedload(Scholarship.required_documents).joinedload(ScholarshipDocumentRequirement.document_format)
+    ).filter(Scholarship.id == scholarship_id).first()
+    return schemas.ScholarshipResponse.model_validate(scholarship) if scholarship else None
+
+def _load_vault(session: Session, user_id: int):
+    docs = session.query(StudentDocument).filter(
+        StudentDocument.student_id == user_id,
+        StudentDocument.is_active == True
+    ).all()
+    return [schemas.StudentDocumentResponse.model_validate(d) for d in docs]
+
+def _load_profile_and_branches(session: Session, user_id: int):
+    from app.models.university import Department, Branch
+    profile = session.query(StudentProfile).filter(StudentProfile.user_id == user_id).first()
+    if not profile:
+        return None, []
+    branches = []
+    if profile.department:
+        branches = session.query(Branch).join(Department, Branch.department_id == Department.id).filter(
+            Department.name == profile.department,
+            Branch.is_active == True
+        ).all()
+    return (
+        schemas.StudentProfileResponse.model_validate(profile),
+        [schemas.BranchResponse.model_validate(b) for b in branches],
+    )
+
+def _load_departments(session: Session):
+    from app.models.university import Department
+    departments = session.query(Department).filter(Department.is_active == True).all()
+    return [schemas.DepartmentResponse.model_validate(d) for d in departments]
+
+def _load_applications(session: Session, user_id: int):
+    from sqlalchemy.orm import selectinload, noload
+    apps = session.query(Application).options(
+        noload(Application.scholarship),
+        selectinload(Application.documents).selectinload(ApplicationDocument.document_format),
+    ).filter(Application.student_id == user_id).all()
+    return [schemas.ApplicationResponse.model_validate(a) for a in apps]
+
+@router.get("/apply-context/{scholarship_id}")
+def get_apply_context(
+    scholarship_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.get_current_user),
+):
+    """
+    Everything the Apply page needs in one round-trip: user, profile, scholarship,
+    vault documents, departments/branches, existing applications and a
+    precomputed requirement-vs-vault match.
+    The loaders are indexed lookups run one after another on the request
+    session, so a page load holds a single pooled connection.
     """
-    return db.query(Application).filter(Application.student_id == current_user.id).all()
+    from app.api.auth import build_user_info
+    from app.core.conflicts import get_conflict_graph
+    from app.core.eligibility import check_eligibility
+
+    scholarship = _load_scholarship(db, scholarship_id)
+    if not scholarship:
+        raise HTTPException(status_code=404, detail="Scholarship not found")
+    vault_docs = _load_vault(db, current_user.id)
+    profile, branches = _load_profile_and_branches(db, current_user.id)
+    departments = _load_departments(db)
+    applications = _load_applications(db, current_user.id)
+
+    # Requirement vs vault match
+    requirements = []
+    for req in scholarship.required_documents:
+        match = next((d for d in vault_docs if d.document_format_id == req.document_format_id), None)
+        status, detail = check_requirement(req, match)
+        requirements.append({
+            "requirement_id": req.id,
+            "document_format_id": req.document_format_id,
+            "name": req.document_format.name if req.document_format else None,
+            "is_mandatory": req.is_mandatory,
+            "vault_document_id": match.id if match else None,
+            "status": status,
+            "detail": detail,
+        })
+
+    existing_application = next((a for a in applications if a.scholarship_id == scholarship_id), None)
+
+    excluded_ids = get_conflict_graph(db).neighbours(scholarship_id)
+    conflicting_applications = [
+        a.id for a in applications
+        if a.scholarship_id in excluded_ids and a.status != ApplicationStatus.REJECTED
+    ]
+
+    return {
+        "user": build_user_info(current_user, profile),
+        "profile": profile,
+        "scholarship": scholarship,
+        "documents": vault_docs,
+        "departments": departments,
+        "branches": branches,
+        "applications": applications,
+        "existing_application": existing_application,
+        "requirements": requirements,
+        "documents_ready": all(r["status"] == "ok" for r in requirements if r["is_mandatory"]),
+        "conflicting_application_ids": conflicting_applications,
+        "eligibility": check_eligibility(profile, scholarship) if profile else None,
+    }
 
 from app.tasks.pdf_tasks import merge_pdfs_task
 from fastapi.responses import Response
@@ -507,8 +690,15 @@ def renew_scholarship(
                 except FileNotFoundError as e:
                     logger.error(f"File missing for previous doc {prev_doc.id}: {e}")
     
+    from app.core.denorm import refresh_document_counts, sync_student_fields
+    from app.core.analytics import record_applications_created
+    refresh_document_counts(db, [application.id])
+    # The new application is counted below, already under the synced fields
+    sync_student_fields(db, [current_user.id], move_rollups=False)
+    departments = record_applications_created(db, [application.id])
     db.commit()
     db.refresh(application)
+    invalidate_application_stats(departments)
     
     # Log action
     from app.core.audit_logger import log_action
@@ -707,23 +897,25 @@ def switch_scholarship(
         
     # 4. Find Conflicting Application
     # We need to find which application conflicts with the target
-    user_apps = db.query(Application).filter(
-        Application.student_id == current_user.id,
-        Application.status != ApplicationStatus.REJECTED
-    ).all()
-    
+    from app.core.conflicts import get_conflict_graph
+    excluded_ids = get_conflict_graph(db).neighbours(target_scholarship.id)
+
     conflicting_app = None
-    if target_scholarship.mutually_exclusive_ids:
-        for app in user_apps:
-            if app.scholarship_id in target_scholarship.mutually_exclusive_ids:
-                conflicting_app = app
-                break
+    if excluded_ids:
+        conflicting_app = db.query(Application).filter(
+            Application.student_id == current_user.id,
+            Application.status != ApplicationStatus.REJECTED,
+            Application.scholarship_id.in_(excluded_ids)
+        ).order_by(Application.id).first()
     
     if not conflicting_app:
         raise HTTPException(status_code=400, detail="No conflicting application found to switch from.")
         
     # 5. Execute Switch (Delete old app, increment count)
     try:
+        from app.core.analytics import record_applications_removed
+        departments = record_applications_removed(db, [conflicting_app.id])
+
         # Delete documents associated with the app explicitly to ensure no integrity error
         # Use synchronize_session=False to avoid session issues
         db.query(ApplicationDocument).filter(ApplicationDocument.application_id == conflicting_app.id).delete(synchronize_session=False)
@@ -735,6 +927,7 @@ def switch_scholarship(
         profile.scholarship_switch_count = (profile.scholarship_switch_count or 0) + 1
         
         db.commit()
+        invalidate_application_stats(departments)
         
         # Log action
         from app.core.audit_logger import log_action
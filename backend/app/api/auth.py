@@ -162,6 +162,8 @@ def login_google(
         db.add(user)
         db.commit()
         db.refresh(user)
+        from app.core.stats import invalidate_admin_stats
+        invalidate_admin_stats()
     else:
         # Update existing user
         if not user.google_id:
@@ -170,10 +172,14 @@ def login_google(
         if enrollment_no and user.role == UserRole.STUDENT:
             # Extract actual name from current full_name if it contains enrollment
             current_actual_name = extract_actual_name_from_formatted(user.full_name or "", enrollment_no)
+            previous_name = user.full_name
             if current_actual_name and current_actual_name != user.full_name:
                 user.full_name = current_actual_name
             elif actual_name and actual_name != user.full_name:
                 user.full_name = actual_name
+            if user.full_name != previous_name:
+                from app.core.denorm import sync_student_fields
+                sync_student_fields(db, [user.id])
         db.commit()
         db.refresh(user)
 
@@ -223,11 +229,17 @@ def get_current_user_info(
     """
     Get current user information (name, email, enrollment)
     """
+    profile = db.query(StudentProfile).filter(StudentProfile.user_id == current_user.id).first()
+    return build_user_info(current_user, profile)
+
+def build_user_info(current_user: User, profile: Any) -> dict:
+    """
+    Shape the /auth/me payload from a user and their (optional) profile.
+    """
     # Get enrollment from profile if exists
     enrollment_no = None
     is_profile_complete = False
     
-    profile = db.query(StudentProfile).filter(StudentProfile.user_id == current_user.id).first()
     if profile:
         enrollment_no = profile.enrollment_no
         
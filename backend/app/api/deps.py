@@ -8,6 +8,7 @@ from app.db.database import get_db
 from app.models.user import User, UserRole
 from app.core import security
 from app.core.config import settings
+from app.core.structured_logging import set_request_user
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login/access-token")
 
@@ -37,6 +38,7 @@ def get_current_user(
         raise HTTPException(status_code=404, detail="User not found")
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
+    set_request_user(user.id)
     return user
 
 def get_current_active_superuser(
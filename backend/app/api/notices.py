@@ -1,11 +1,12 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.models.notice import Notice
 from app.models.user import User, UserRole
 from app.schemas import schemas
 from app.api import deps
+from app.api.pagination import CursorParams, keyset_paginate
 
 router = APIRouter()
 
@@ -43,16 +44,16 @@ def create_notice(
 
 @router.get("/", response_model=List[schemas.NoticeResponse])
 def read_all_notices(
+    response: Response,
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    pagination: CursorParams = Depends(),
     current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
 ) -> Any:
     """
     Get all notices (Active & Inactive) - GOffice/Admin only
     """
-    notices = db.query(Notice).order_by(Notice.created_at.desc()).offset(skip).limit(limit).all()
-    return notices
+    query = db.query(Notice).order_by(Notice.created_at.desc())
+    return keyset_paginate(query, pagination, Notice.id, Notice.created_at, response)
 
 @router.put("/{notice_id}", response_model=schemas.NoticeResponse)
 def update_notice(
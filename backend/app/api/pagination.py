@@ -1,4 +1,11 @@
-from fastapi import Query
+from typing import Any, List, Optional, Tuple
+from datetime import datetime
+from fastapi import Query, HTTPException, Response
+from sqlalchemy import and_, or_
+import base64
+import json
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 class PaginationParams:
     def __init__(
@@ -8,3 +15,89 @@ class PaginationParams:
     ):
         self.skip = skip
         self.limit = limit
+
+class CursorParams:
+    """
+    Keyset pagination parameters.
+    Cursor mode is used when `cursor` is present (an empty value starts from the first page);
+    otherwise endpoints fall back to offset pagination with `skip`.
+    The cursor for the next page is returned in the X-Next-Cursor response header.
+    """
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor; empty for the first page"),
+        skip: int = Query(0, ge=0, description="Number of items to skip (offset mode)"),
+        limit: int = Query(100, ge=1, le=100, description="Max number of items to return"),
+    ):
+        self.cursor = cursor
+        self.skip = skip
+        self.limit = limit
+
+    @property
+    def is_cursor_mode(self) -> bool:
+        return self.cursor is not None
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    if isinstance(sort_value, datetime):
+        sort_value = {"dt": sort_value.isoformat()}
+    raw = json.dumps([sort_value, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if isinstance(sort_value, dict):
+            sort_value = datetime.fromisoformat(sort_value["dt"])
+        return sort_value, int(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+def keyset_paginate(
+    query,
+    params: CursorParams,
+    id_column,
+    sort_column=None,
+    response: Optional[Response] = None,
+) -> List[Any]:
+    """
+    Page a query newest-first on (sort_column, id_column), or on id_column alone.
+    In cursor mode, seeks past the cursor instead of scanning skipped rows and
+    sets the next cursor header. In offset mode the query is used unchanged
+    with offset/limit, so existing clients see the same ordering as before.
+    """
+    if not params.is_cursor_mode:
+        return query.offset(params.skip).limit(params.limit).all()
+
+    query = query.order_by(None)
+    if sort_column is not None:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(id_column.desc())
+
+    if params.cursor:
+        sort_value, last_id = decode_cursor(params.cursor)
+        if sort_column is None:
+            query = query.filter(id_column < last_id)
+        elif sort_value is None:
+            # NULLs sort last in descending order, so only NULL rows with smaller ids remain
+            query = query.filter(sort_column.is_(None), id_column < last_id)
+        else:
+            query = query.filter(or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < last_id),
+                sort_column.is_(None),
+            ))
+
+    # Fetch one extra row to know whether another page exists
+    rows = query.limit(params.limit + 1).all()
+    items = rows[:params.limit]
+
+    if response is not None:
+        if len(rows) > params.limit and items:
+            last = items[-1]
+            last_sort = getattr(last, sort_column.key) if sort_column is not None else None
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last_sort, getattr(last, id_column.key))
+        else:
+            response.headers[NEXT_CURSOR_HEADER] = ""
+    return items
@@ -6,6 +6,8 @@ from app.models.user import User
 from app.models.student import StudentProfile
 from app.schemas import schemas
 from app.api import deps
+from app.core.denorm import sync_student_fields
+from app.core.stats import invalidate_application_stats, invalidate_department_stats
 import logging
 
 logger = logging.getLogger(__name__)
@@ -55,8 +57,12 @@ def create_user_profile(
             **profile_data
         )
         db.add(profile)
+        moved_departments = sync_student_fields(db, [current_user.id])
         db.commit()
         db.refresh(profile)
+        invalidate_department_stats([profile.department])
+        if moved_departments:
+            invalidate_application_stats(moved_departments)
         logger.info(f"Profile created for user {current_user.id}")
         return profile
     except Exception as e:
@@ -82,12 +88,18 @@ def update_user_profile(
         raise HTTPException(status_code=404, detail="Profile not found")
     
     try:
+        previous_department = profile.department
         for field, value in profile_in.dict(exclude_unset=True).items():
             setattr(profile, field, value)
         
         db.add(profile)
+        moved_departments = sync_student_fields(db, [current_user.id])
         db.commit()
         db.refresh(profile)
+        if profile.department != previous_department:
+            invalidate_department_stats({previous_department, profile.department})
+        if moved_departments:
+            invalidate_application_stats(moved_departments)
         logger.info(f"Profile updated for user {current_user.id}")
         return profile
     except Exception as e:
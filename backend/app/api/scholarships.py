@@ -1,25 +1,31 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.models.user import User, UserRole
 from app.models.scholarship import Scholarship, ScholarshipDocumentRequirement, DocumentFormat
 from app.schemas import schemas
 from app.api import deps
+from app.core.conflicts import invalidate_conflict_graph
+from app.core.stats import invalidate_admin_stats
+from app.core.eligibility import eligibility_clause, eligible_profiles_query
+from app.api.pagination import CursorParams, PaginationParams, keyset_paginate
 
 router = APIRouter()
 
 @router.get("/", response_model=List[schemas.ScholarshipResponse])
 def read_scholarships(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    pagination: CursorParams = Depends(),
     db: Session = Depends(get_db),
 ) -> Any:
     """
     Retrieve scholarships.
     """
-    scholarships = db.query(Scholarship).filter(Scholarship.is_active == True).offset(skip).limit(limit).all()
-    return scholarships
+    query = db.query(Scholarship).filter(Scholarship.is_active == True)
+    # Scholarships have no creation timestamp, so cursors are keyed on id alone
+    return keyset_paginate(query, pagination, Scholarship.id, response=response)
 
 @router.get("/public", response_model=List[schemas.ScholarshipResponse])
 def read_public_scholarships(
@@ -56,6 +62,38 @@ def check_scholarship_eligibility(
     result = check_eligibility(student_profile, scholarship)
     return result
 
+@router.get("/{scholarship_id}/eligible-students", response_model=List[schemas.StudentProfileResponse])
+def get_eligible_students(
+    scholarship_id: int,
+    pagination: PaginationParams = Depends(),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+) -> Any:
+    """
+    List student profiles eligible for the scholarship (evaluated in the database)
+    """
+    scholarship = db.query(Scholarship).filter(Scholarship.id == scholarship_id).first()
+    if not scholarship:
+        raise HTTPException(status_code=404, detail="Scholarship not found")
+
+    return eligible_profiles_query(db, scholarship).order_by(StudentProfile.id).offset(pagination.skip).limit(pagination.limit).all()
+
+@router.get("/{scholarship_id}/eligible-students/count")
+def count_eligible_students(
+    scholarship_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
+):
+    """
+    Count student profiles eligible for the scholarship
+    """
+    scholarship = db.query(Scholarship).filter(Scholarship.id == scholarship_id).first()
+    if not scholarship:
+        raise HTTPException(status_code=404, detail="Scholarship not found")
+
+    count = db.query(func.count(StudentProfile.id)).filter(eligibility_clause(scholarship)).scalar()
+    return {"scholarship_id": scholarship_id, "eligible_count": count}
+
 import logging
 
 # Configure logger
@@ -121,30 +159,24 @@ def create_scholarship(
         db.commit()
         db.refresh(scholarship)
         logger.info("Database commit successful")
+        invalidate_conflict_graph()
+        invalidate_admin_stats()
         
         # Email Notification: New Scholarship
         # Logic: Notify all students who match category/dept? Or just all?
         # Requirement: "Scholarship Added to all students"
         
-        # Get all students (This might be heavy, in prod use batching)
-        users = db.query(User).filter(User.role == UserRole.STUDENT).all()
-        recipients = [u.email for u in users]
-        
         try:
-            from app.tasks.email_tasks import send_notification_task
-            if recipients and scholarship_in.notify_students:
-                logger.info(f"Sending notifications to {len(recipients)} students")
-                send_notification_task.delay(
-                    notification_type="scholarship_added",
-                    recipients=recipients,
-                    data={
-                        "scholarship_name": scholarship.name,
-                        "category": scholarship.category,
-                        "last_date": str(scholarship.last_date)
-                    }
-                )
+            from app.tasks.email_tasks import notify_recipients_task
+            if scholarship_in.notify_students:
+                notify_recipients_task.delay("all", None, "scholarship_added", {
+                    "scholarship_name": scholarship.name,
+                    "category": scholarship.category,
+                    "last_date": str(scholarship.last_date)
+                })
+                logger.info("Queued notifications to all students")
             else:
-                logger.info("Notifications skipped (disabled or no recipients)")
+                logger.info("Notifications skipped (disabled)")
         except Exception as e:
             logger.error(f"Failed to send email notification: {e}")
             # Do not raise, just log
@@ -227,28 +259,18 @@ def update_scholarship(
             
     db.commit()
     db.refresh(scholarship)
+    invalidate_conflict_graph()
     
     # Email Notification: Scholarship Updated
     # Notify students who have applied? Or all? 
     # Requirement: "Call notify_scholarship_updated() for affected students"
-    from app.models.application import Application
-    
-    apps = db.query(Application).filter(Application.scholarship_id == scholarship.id).all()
-    user_ids = [app.student_id for app in apps]
-    users = db.query(User).filter(User.id.in_(user_ids)).all()
-    recipients = [u.email for u in users]
-    
     try:
-        from app.tasks.email_tasks import send_notification_task
-        if recipients and scholarship_in.notify_students:
-            send_notification_task.delay(
-                notification_type="scholarship_updated",
-                recipients=recipients,
-                data={
-                    "scholarship_name": scholarship.name,
-                    "changes_summary": "The scholarship details, eligibility criteria, or required documents have been updated by the administration."
-                }
-            )
+        from app.tasks.email_tasks import notify_recipients_task
+        if scholarship_in.notify_students:
+            notify_recipients_task.delay("scholarship", str(scholarship.id), "scholarship_updated", {
+                "scholarship_name": scholarship.name,
+                "changes_summary": "The scholarship details, eligibility criteria, or required documents have been updated by the administration."
+            })
     except Exception as e:
         logger.error(f"Failed to send email notification: {e}")
     
@@ -300,20 +322,12 @@ def create_announcement(
     # User said: "When admin or goffice posts a notice -> Call notify_new_notice() for all students"
     # But usually notices are specific. Let's follow requirement: ALL students.
     
-    users = db.query(User).filter(User.role == UserRole.STUDENT).all()
-    recipients = [u.email for u in users]
-    
     try:
-        from app.tasks.email_tasks import send_notification_task
-        if recipients:
-            send_notification_task.delay(
-                notification_type="notice_published",
-                recipients=recipients,
-                data={
-                    "title": announcement.title,
-                    "content": announcement.content
-                }
-            )
+        from app.tasks.email_tasks import notify_recipients_task
+        notify_recipients_task.delay("all", None, "notice_published", {
+            "title": announcement.title,
+            "content": announcement.content
+        })
     except Exception as e:
         logger.error(f"Failed to send email notification: {e}")
         
@@ -335,9 +349,6 @@ def get_scholarship_announcements(
 # --- Applications & Export ---
 from app.models.application import Application, ApplicationStatus
 from app.models.student import StudentProfile
-from fastapi.responses import StreamingResponse
-import csv
-import io
 
 @router.get("/{scholarship_id}/applications", response_model=List[schemas.ApplicationResponse])
 def get_scholarship_applications(
@@ -353,41 +364,38 @@ def get_scholarship_applications(
 @router.get("/{scholarship_id}/export")
 def export_scholarship_data(
     scholarship_id: int,
+    gzip: bool = False,
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.RoleChecker([UserRole.ADMIN, UserRole.GOFFICE])),
 ):
     """
-    Export scholarship applications as CSV
+    Export scholarship applications as CSV, streamed from a server-side cursor (optionally gzipped)
     """
-    scholarship = db.query(Scholarship).filter(Scholarship.id == scholarship_id).first()
+    from app.core.exports import csv_export_response
+
+    scholarship = db.query(Scholarship.id).filter(Scholarship.id == scholarship_id).first()
     if not scholarship:
         raise HTTPException(status_code=404, detail="Scholarship not found")
-        
-    applications = db.query(Application).filter(Application.scholarship_id == scholarship_id).all()
-    
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Header
-    writer.writerow(['Application ID', 'Student ID', 'Student Name', 'Status', 'Applied Date', 'Remarks'])
-    
-    for app in applications:
-        student_name = "N/A"
-        if app.student and app.student.full_name:
-            student_name = app.student.full_name
-            
-        writer.writerow([
-            app.id,
-            app.student_id,
-            student_name,
-            app.status.value,
-            app.created_at.strftime("%Y-%m-%d"),
-            app.remarks
-        ])
-        
-    output.seek(0)
-    
-    response = StreamingResponse(iter([output.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = f"attachment; filename=scholarship_{scholarship_id}_export.csv"
-    return response
+
+    header = ['Application ID', 'Student ID', 'Student Name', 'Status', 'Applied Date', 'Remarks']
+
+    def build_query(export_db):
+        # Student name is joined in rather than lazy-loaded per row
+        return export_db.query(
+            Application.id, Application.student_id, User.full_name, Application.status,
+            Application.created_at, Application.remarks
+        ).outerjoin(User, User.id == Application.student_id)\
+         .filter(Application.scholarship_id == scholarship_id)\
+         .order_by(Application.id)
+
+    def format_row(row):
+        return [
+            row.id,
+            row.student_id,
+            row.full_name or "N/A",
+            row.status.value,
+            row.created_at.strftime("%Y-%m-%d") if row.created_at else "",
+            row.remarks
+        ]
+
+    return csv_export_response(f"scholarship_{scholarship_id}_export.csv", header, build_query, format_row, gzip=gzip)
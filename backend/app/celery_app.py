@@ -1,16 +1,31 @@
 from celery import Celery
+from celery.schedules import crontab
 from app.core.config import settings
 
 celery_app = Celery(
     "worker",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
-    include=["app.tasks.pdf_tasks", "app.tasks.email_tasks"]
+    include=["app.tasks.pdf_tasks", "app.tasks.email_tasks", "app.tasks.export_tasks", "app.tasks.maintenance_tasks"]
 )
 
 celery_app.conf.task_routes = {
     "app.tasks.pdf_tasks.*": {"queue": "pdf_queue"},
     "app.tasks.email_tasks.*": {"queue": "email_queue"},
+    "app.tasks.export_tasks.*": {"queue": "export_queue"},
+    "app.tasks.maintenance_tasks.*": {"queue": "maintenance_queue"},
+}
+
+# Run with `celery -A app.celery_app beat`
+celery_app.conf.beat_schedule = {
+    "archive-audit-logs": {
+        "task": "app.tasks.maintenance_tasks.archive_audit_logs_task",
+        "schedule": crontab(hour=3, minute=0),
+    },
+    "resume-email-campaigns": {
+        "task": "app.tasks.email_tasks.resume_email_campaigns_task",
+        "schedule": crontab(minute="*/5"),
+    },
 }
 
 celery_app.conf.update(
@@ -20,3 +35,16 @@ celery_app.conf.update(
     timezone="Asia/Kolkata",
     enable_utc=True,
 )
+
+from celery.signals import worker_process_shutdown
+
+@worker_process_shutdown.connect
+def drain_audit_writer(**kwargs):
+    # Prefork children exit without running atexit hooks
+    from app.core.audit_writer import audit_writer
+    audit_writer.stop()
+
+@worker_process_shutdown.connect
+def close_smtp_connections(**kwargs):
+    from app.core.mailer import get_smtp_pool
+    get_smtp_pool().close_all()
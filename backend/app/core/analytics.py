@@ -0,0 +1,222 @@
+from typing import Dict, Iterable, List, Optional, Set
+from datetime import date, timedelta
+from collections import defaultdict
+from sqlalchemy import func, insert, select, literal
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from app.models.analytics import ApplicationRollup, StatusTransitionRollup
+from app.models.application import Application, ApplicationStatus
+from app.models.student import StudentProfile
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rollups are adjusted in the caller's transaction, next to the write they describe.
+# Dimensions are the student fields denormalized onto Application (app.core.denorm),
+# the same columns department listings filter on. When a profile edit changes them,
+# sync_student_fields() moves the student's current counts to the new bucket;
+# transitions stay attributed to the bucket the application was in when they happened.
+
+DIMENSIONS = ("day", "department", "category", "gender", "status", "scholarship_id")
+
+def _dimension_rows(db: Session, application_ids: Iterable[int]) -> list:
+    application_ids = list(set(application_ids))
+    if not application_ids:
+        return []
+    db.flush()
+    return db.query(
+        Application.id,
+        Application.created_at,
+        Application.status,
+        Application.scholarship_id,
+        Application.department,
+        Application.category,
+        Application.gender,
+    ).filter(Application.id.in_(application_ids)).all()
+
+def _key(row, day: date, status: ApplicationStatus) -> tuple:
+    return (day, row.department or "", row.category or "", row.gender or "", status, row.scholarship_id)
+
+def _created_day(row) -> date:
+    return row.created_at.date() if row.created_at else date.today()
+
+def _apply(db: Session, model, deltas: Dict[tuple, int]) -> None:
+    values = [dict(zip(DIMENSIONS, key), count=delta) for key, delta in deltas.items() if delta]
+    if not values:
+        return
+    table = model.__table__
+    if db.get_bind().dialect.name == "sqlite":
+        # Test database
+        stmt = sqlite_insert(table).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(DIMENSIONS), set_={"count": table.c.count + stmt.excluded["count"]}
+        )
+    else:
+        stmt = mysql_insert(table).values(values)
+        stmt = stmt.on_duplicate_key_update(count=table.c.count + stmt.inserted["count"])
+    db.execute(stmt)
+
+def record_applications_created(db: Session, application_ids: Iterable[int]) -> Set[str]:
+    """
+    Count newly created applications. Call before committing the insert.
+    Returns the departments whose counts changed.
+    """
+    current = defaultdict(int)
+    entered = defaultdict(int)
+    today = date.today()
+    rows = _dimension_rows(db, application_ids)
+    for row in rows:
+        current[_key(row, _created_day(row), row.status)] += 1
+        if row.status != ApplicationStatus.DRAFT:
+            entered[_key(row, today, row.status)] += 1
+    _apply(db, ApplicationRollup, current)
+    _apply(db, StatusTransitionRollup, entered)
+    return {row.department or "" for row in rows}
+
+def record_status_changes(db: Session, old_statuses: Dict[int, ApplicationStatus], new_status: ApplicationStatus) -> Set[str]:
+    """
+    Move applications from their old status bucket to new_status.
+    old_statuses maps application id to the status it had before the update.
+    Returns the departments whose counts changed.
+    """
+    current = defaultdict(int)
+    entered = defaultdict(int)
+    today = date.today()
+    rows = _dimension_rows(db, old_statuses)
+    for row in rows:
+        old_status = old_statuses[row.id]
+        if old_status == new_status:
+            continue
+        current[_key(row, _created_day(row), old_status)] -= 1
+        current[_key(row, _created_day(row), new_status)] += 1
+        entered[_key(row, today, new_status)] += 1
+    _apply(db, ApplicationRollup, current)
+    _apply(db, StatusTransitionRollup, entered)
+    return {row.department or "" for row in rows if old_statuses[row.id] != new_status}
+
+def record_applications_removed(db: Session, application_ids: Iterable[int]) -> Set[str]:
+    """
+    Uncount applications that are about to be deleted. Call before the delete.
+    Returns the departments whose counts changed.
+    """
+    current = defaultdict(int)
+    rows = _dimension_rows(db, application_ids)
+    for row in rows:
+        current[_key(row, _created_day(row), row.status)] -= 1
+    _apply(db, ApplicationRollup, current)
+    return {row.department or "" for row in rows}
+
+def record_profile_changes(db: Session, student_ids: Iterable[int]) -> Set[str]:
+    """
+    Move the students' applications from the bucket of their denormalized fields to
+    the bucket of their current profile. sync_student_fields() calls this before it
+    copies the profile onto the applications.
+    Returns the departments whose counts changed.
+    """
+    student_ids = list(set(student_ids))
+    if not student_ids:
+        return set()
+    db.flush()
+    rows = db.query(
+        Application.created_at,
+        Application.status,
+        Application.scholarship_id,
+        Application.department,
+        Application.category,
+        Application.gender,
+        StudentProfile.department.label("new_department"),
+        StudentProfile.category.label("new_category"),
+        StudentProfile.gender.label("new_gender"),
+    ).outerjoin(
+        StudentProfile, StudentProfile.user_id == Application.student_id
+    ).filter(Application.student_id.in_(student_ids)).all()
+
+    current = defaultdict(int)
+    departments = set()
+    for row in rows:
+        old_key = _key(row, _created_day(row), row.status)
+        new_key = (old_key[0], row.new_department or "", row.new_category or "", row.new_gender or "") + old_key[4:]
+        if new_key == old_key:
+            continue
+        current[old_key] -= 1
+        current[new_key] += 1
+        departments |= {old_key[1], new_key[1]}
+    _apply(db, ApplicationRollup, current)
+    return departments
+
+def rebuild_rollups(db: Session) -> None:
+    """
+    Recompute both rollup tables from the applications table and commit.
+    Transition history is not stored elsewhere, so each application is counted as
+    having entered its current status on its last update (or creation) day.
+    """
+    department = func.coalesce(Application.department, literal(""))
+    category = func.coalesce(Application.category, literal(""))
+    gender = func.coalesce(Application.gender, literal(""))
+
+    def grouped(day_expr, *conditions):
+        return select(
+            day_expr, department, category, gender,
+            Application.status, Application.scholarship_id, func.count(Application.id)
+        ).select_from(Application).where(*conditions).group_by(
+            day_expr, department, category, gender, Application.status, Application.scholarship_id
+        )
+
+    columns = list(DIMENSIONS) + ["count"]
+    try:
+        db.query(ApplicationRollup).delete(synchronize_session=False)
+        db.query(StatusTransitionRollup).delete(synchronize_session=False)
+        db.execute(insert(ApplicationRollup.__table__).from_select(
+            columns, grouped(func.date(Application.created_at))
+        ))
+        db.execute(insert(StatusTransitionRollup.__table__).from_select(
+            columns, grouped(
+                func.date(func.coalesce(Application.updated_at, Application.created_at)),
+                Application.status != ApplicationStatus.DRAFT
+            )
+        ))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+# --- Readers ---
+
+def status_counts(db: Session, department: Optional[str] = None) -> Dict[ApplicationStatus, int]:
+    query = db.query(ApplicationRollup.status, func.sum(ApplicationRollup.count))
+    if department is not None:
+        query = query.filter(ApplicationRollup.department == department)
+    return {status: int(total or 0) for status, total in query.group_by(ApplicationRollup.status).all()}
+
+def distribution(db: Session, column) -> List[dict]:
+    """
+    Current application counts grouped by one rollup column, in dashboard chart format.
+    """
+    rows = db.query(column, func.sum(ApplicationRollup.count)).group_by(column).all()
+    return [
+        {"name": (value.value if hasattr(value, "value") else value) or "Unknown", "value": int(total or 0)}
+        for value, total in rows if total
+    ]
+
+def applications_per_day(db: Session, days: int) -> List[dict]:
+    since = date.today() - timedelta(days=days - 1)
+    rows = db.query(ApplicationRollup.day, func.sum(ApplicationRollup.count)).filter(
+        ApplicationRollup.day >= since
+    ).group_by(ApplicationRollup.day).order_by(ApplicationRollup.day).all()
+    return [{"date": day.isoformat(), "value": int(total or 0)} for day, total in rows]
+
+def transitions_per_week(db: Session, status: ApplicationStatus, weeks: int) -> List[dict]:
+    """
+    Applications entering status per ISO week (weeks start on Monday).
+    """
+    today = date.today()
+    since = today - timedelta(days=today.weekday(), weeks=weeks - 1)
+    rows = db.query(StatusTransitionRollup.day, func.sum(StatusTransitionRollup.count)).filter(
+        StatusTransitionRollup.status == status,
+        StatusTransitionRollup.day >= since
+    ).group_by(StatusTransitionRollup.day).all()
+    totals = defaultdict(int)
+    for day, total in rows:
+        totals[day - timedelta(days=day.weekday())] += int(total or 0)
+    return [{"week_start": week.isoformat(), "value": totals[week]} for week in sorted(totals)]
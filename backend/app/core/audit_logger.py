@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Session
 from app.models.audit import AuditLog
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List
 import json
 import logging
 
@@ -20,6 +20,9 @@ def sanitize_for_json(data: Any) -> Any:
         return data.isoformat()
     return data
 
+# Actions that are always written synchronously, even when buffering is enabled
+DURABLE_ACTIONS = {"DELETE_USER", "UPDATE_ROLE", "DELETE_DEPARTMENT", "DELETE_SESSION"}
+
 def log_action(
     db: Session,
     action: str,
@@ -27,11 +30,34 @@ def log_action(
     target_type: Optional[str] = None,
     target_id: Optional[str] = None,
     details: Optional[Dict[str, Any]] = None,
-    ip_address: Optional[str] = None
+    ip_address: Optional[str] = None,
+    durable: bool = False
 ):
     """
-    Log an action to the audit trail.
+    Log an action to the audit trail. Call after committing the change it records.
+    By default the entry is handed to the background audit writer and inserted with
+    the next batch. durable=True (or an action in DURABLE_ACTIONS) inserts and
+    commits it before returning, as does a full buffer or AUDIT_ASYNC=False.
+    Either way the entry is written outside the caller's transaction: db is only
+    used for its engine and is never committed or rolled back here.
     """
+    from app.core.config import settings
+
+    if settings.AUDIT_ASYNC and not durable and action not in DURABLE_ACTIONS:
+        from app.core.audit_writer import audit_writer
+        queued = audit_writer.submit({
+            "action": action,
+            "user_id": user_id,
+            "target_type": target_type,
+            "target_id": target_id,
+            # Shallow copy: the caller may keep mutating its dict after we return
+            "details": dict(details) if details else None,
+            "ip_address": ip_address,
+        })
+        if queued:
+            return
+
+    session = Session(bind=db.get_bind())
     try:
         audit_log = AuditLog(
             user_id=user_id,
@@ -41,9 +67,40 @@ def log_action(
             details=sanitize_for_json(details) if details else None,
             ip_address=ip_address
         )
-        db.add(audit_log)
-        db.commit()
+        session.add(audit_log)
+        session.commit()
     except Exception as e:
         logger.error(f"Failed to create audit log: {e}")
-        db.rollback()
+        session.rollback()
         # Don't raise exception to avoid breaking the main flow
+    finally:
+        session.close()
+
+def build_audit_row(
+    action: str,
+    user_id: Optional[int] = None,
+    target_type: Optional[str] = None,
+    target_id: Optional[str] = None,
+    details: Optional[Dict[str, Any]] = None,
+    ip_address: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build an audit_logs row mapping, as log_action would store it.
+    """
+    return {
+        "user_id": user_id,
+        "action": action,
+        "target_type": target_type,
+        "target_id": str(target_id) if target_id else None,
+        "details": sanitize_for_json(details) if details else None,
+        "ip_address": ip_address,
+    }
+
+def log_actions_bulk(db: Session, rows: List[Dict[str, Any]]):
+    """
+    Insert many audit rows (from build_audit_row) with a single executemany.
+    Does not commit: the rows join the caller's transaction.
+    """
+    if not rows:
+        return
+    db.execute(AuditLog.__table__.insert(), rows)
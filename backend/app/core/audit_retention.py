@@ -0,0 +1,84 @@
+from typing import Dict, List
+from collections import defaultdict
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.audit import AuditLog
+import gzip
+import json
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Old audit rows are moved out of the hot table into one gzipped JSONL file per
+# month (audit_logs_YYYY_MM.jsonl.gz). Each batch is appended as its own gzip
+# member, which gzip readers (zcat, gzip.open) concatenate transparently.
+# A batch is deleted only after its file write is flushed to disk, so a crash in
+# between can duplicate rows in the archive but never lose them; dedupe on "id".
+
+def archive_path(year: int, month: int) -> str:
+    return os.path.join(settings.AUDIT_ARCHIVE_DIR, f"audit_logs_{year:04d}_{month:02d}.jsonl.gz")
+
+def _row_dict(log: AuditLog) -> dict:
+    return {
+        "id": log.id,
+        "user_id": log.user_id,
+        "action": log.action,
+        "target_type": log.target_type,
+        "target_id": log.target_id,
+        "details": log.details,
+        "ip_address": log.ip_address,
+        "timestamp": log.timestamp.isoformat() if log.timestamp else None,
+    }
+
+def _append(path: str, rows: List[dict]) -> None:
+    with open(path, "ab") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb") as f:
+            for row in rows:
+                f.write(json.dumps(row, default=str).encode("utf-8") + b"\n")
+        raw.flush()
+        os.fsync(raw.fileno())
+
+def archive_audit_logs(db: Session, older_than_days: int = None, batch_size: int = None) -> Dict[str, int]:
+    """
+    Move audit rows older than older_than_days (default AUDIT_RETENTION_DAYS) into
+    the monthly archive files, oldest first, batch_size rows per transaction.
+    Returns the number of rows archived per file.
+    """
+    older_than_days = older_than_days or settings.AUDIT_RETENTION_DAYS
+    batch_size = batch_size or settings.AUDIT_ARCHIVE_BATCH_SIZE
+    cutoff = datetime.now() - timedelta(days=older_than_days)
+    os.makedirs(settings.AUDIT_ARCHIVE_DIR, exist_ok=True)
+
+    archived: Dict[str, int] = defaultdict(int)
+    while True:
+        # Served by ix_audit_logs_timestamp_id
+        batch = db.query(AuditLog).filter(
+            AuditLog.timestamp < cutoff
+        ).order_by(AuditLog.timestamp, AuditLog.id).limit(batch_size).all()
+        if not batch:
+            break
+
+        by_month = defaultdict(list)
+        for log in batch:
+            by_month[(log.timestamp.year, log.timestamp.month)].append(_row_dict(log))
+        for (year, month), rows in by_month.items():
+            path = archive_path(year, month)
+            _append(path, rows)
+            archived[os.path.basename(path)] += len(rows)
+
+        try:
+            db.query(AuditLog).filter(
+                AuditLog.id.in_([log.id for log in batch])
+            ).delete(synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        db.expunge_all()
+        logger.info(f"Archived {len(batch)} audit rows older than {cutoff:%Y-%m-%d}")
+
+        if len(batch) < batch_size:
+            break
+    return dict(archived)
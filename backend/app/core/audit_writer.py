@@ -0,0 +1,145 @@
+from typing import Any, Dict, List, Optional
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class AuditWriter:
+    """
+    Buffers audit rows in an in-process queue and bulk-inserts them from a
+    background thread, every flush_interval_ms or batch_size rows, whichever
+    comes first. Rows are sanitized for JSON on the flusher thread.
+
+    Buffered rows are lost if the process is killed outright; callers that must
+    not lose an entry write synchronously instead (see log_action's durable flag).
+    """
+    def __init__(self, batch_size: int, flush_interval_ms: int, max_queue: int):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stats = {"enqueued": 0, "written": 0, "batches": 0, "failed": 0, "flush_seconds": 0.0}
+
+    def _ensure_started(self) -> None:
+        # Threads do not survive fork (gunicorn/celery prefork), so start per process
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            if self._pid != os.getpid():
+                # Entries queued in the parent belong to the parent's flusher
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+                atexit.register(self.stop)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def submit(self, row: Dict[str, Any]) -> bool:
+        """
+        Queue a row (raw build_audit_row arguments). Returns False if the queue is
+        full, in which case the caller should write it synchronously.
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            return False
+        self._stats["enqueued"] += 1
+        return True
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: List[Dict[str, Any]] = []
+            deadline = None
+            while len(batch) < self.batch_size:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            if stopping:
+                # Drain whatever is still queued behind the stop marker
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        batch.append(item)
+            if batch:
+                self._flush(batch)
+
+    def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        from app.core.audit_logger import build_audit_row, log_actions_bulk
+        from app.db.database import SessionLocal
+
+        started = time.perf_counter()
+        rows = [build_audit_row(**item) for item in batch]
+        for attempt in (1, 2):
+            db = SessionLocal()
+            try:
+                log_actions_bulk(db, rows)
+                db.commit()
+                self._stats["written"] += len(rows)
+                self._stats["batches"] += 1
+                self._stats["flush_seconds"] += time.perf_counter() - started
+                return
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Audit batch of {len(rows)} rows failed (attempt {attempt}): {e}")
+            finally:
+                db.close()
+        # Keep the entries recoverable from the application logs
+        self._stats["failed"] += len(rows)
+        for row in rows:
+            logger.error(f"Dropped audit entry: {json.dumps(row, default=str)}")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Flush everything queued so far and stop the flusher thread.
+        """
+        thread = self._thread
+        if thread is None or self._pid != os.getpid() or not thread.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning(f"Audit writer did not drain within {timeout}s; {self._queue.qsize()} entries pending")
+        self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        batches = stats["batches"]
+        stats["pending"] = self._queue.qsize()
+        stats["avg_batch_size"] = round(stats["written"] / batches, 1) if batches else 0
+        stats["rows_per_second"] = round(stats["written"] / stats["flush_seconds"], 1) if stats["flush_seconds"] else 0
+        stats["flush_seconds"] = round(stats["flush_seconds"], 3)
+        return stats
+
+def _create_writer() -> AuditWriter:
+    from app.core.config import settings
+    return AuditWriter(
+        batch_size=settings.AUDIT_BATCH_SIZE,
+        flush_interval_ms=settings.AUDIT_FLUSH_INTERVAL_MS,
+        max_queue=settings.AUDIT_QUEUE_MAX,
+    )
+
+audit_writer = _create_writer()
@@ -0,0 +1,157 @@
+from typing import Any, Callable, Dict, Iterable, Optional
+from app.core.config import settings
+import json
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Short-lived JSON cache shared by all API workers through Redis.
+# If Redis is unreachable each worker falls back to its own in-process copy,
+# so a Redis outage costs freshness across workers, never availability.
+
+KEY_PREFIX = "scholar:cache:"
+STATS_PREFIX = "scholar:cache-stats:"
+GENERATION_PREFIX = "scholar:cache-gen:"
+# After a Redis error, stay on the local fallback for this long before retrying
+REDIS_RETRY_SECONDS = 30
+
+_redis_client = None
+_redis_down_until = 0.0
+_local_lock = threading.Lock()
+_local_values: Dict[str, tuple] = {}
+_local_counters: Dict[str, Dict[str, int]] = {}
+_local_generations: Dict[str, int] = {}
+
+def _get_redis():
+    global _redis_client, _redis_down_until
+    if time.monotonic() < _redis_down_until:
+        return None
+    if _redis_client is None:
+        try:
+            import redis
+            _redis_client = redis.Redis.from_url(settings.REDIS_URL, socket_timeout=0.2, socket_connect_timeout=0.2)
+        except Exception as e:
+            logger.warning(f"Redis cache unavailable, using in-process cache: {e}")
+            _redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+            return None
+    return _redis_client
+
+def _redis_failed(e: Exception) -> None:
+    global _redis_down_until
+    logger.warning(f"Redis cache error, using in-process cache for {REDIS_RETRY_SECONDS}s: {e}")
+    _redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+
+def _count(key: str, outcome: str) -> None:
+    client = _get_redis()
+    if client is not None:
+        try:
+            client.hincrby(STATS_PREFIX + key, outcome, 1)
+            return
+        except Exception as e:
+            _redis_failed(e)
+    with _local_lock:
+        counters = _local_counters.setdefault(key, {"hits": 0, "misses": 0})
+        counters[outcome] += 1
+
+def _read(key: str) -> Optional[str]:
+    client = _get_redis()
+    if client is not None:
+        try:
+            return client.get(KEY_PREFIX + key)
+        except Exception as e:
+            _redis_failed(e)
+    with _local_lock:
+        entry = _local_values.get(key)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+    return None
+
+def _write(key: str, raw: str, ttl: int) -> None:
+    client = _get_redis()
+    if client is not None:
+        try:
+            client.set(KEY_PREFIX + key, raw, ex=ttl)
+            return
+        except Exception as e:
+            _redis_failed(e)
+    with _local_lock:
+        _local_values[key] = (raw, time.monotonic() + ttl)
+
+def get_or_set(key: str, ttl: int, loader: Callable[[], Any]) -> Any:
+    """
+    Return the cached JSON value for key, calling loader() and caching its result on a miss.
+    """
+    raw = _read(key)
+    if raw is not None:
+        _count(key, "hits")
+        return json.loads(raw)
+    _count(key, "misses")
+    value = loader()
+    _write(key, json.dumps(value, default=str), ttl)
+    return value
+
+def invalidate(*keys: str) -> None:
+    """
+    Drop cached values in every worker. Call after commits that change the underlying data.
+    """
+    with _local_lock:
+        for key in keys:
+            _local_values.pop(key, None)
+    client = _get_redis()
+    if client is not None and keys:
+        try:
+            client.delete(*[KEY_PREFIX + key for key in keys])
+        except Exception as e:
+            _redis_failed(e)
+
+def get_generation(name: str) -> int:
+    """
+    Current generation of a named dataset, shared by all workers through Redis.
+    Per-process caches compare it with the generation they were built at.
+    """
+    client = _get_redis()
+    if client is not None:
+        try:
+            return int(client.get(GENERATION_PREFIX + name) or 0)
+        except Exception as e:
+            _redis_failed(e)
+    with _local_lock:
+        return _local_generations.get(name, 0)
+
+def bump_generation(name: str) -> int:
+    """
+    Advance a dataset's generation so every worker discards copies built before now.
+    """
+    with _local_lock:
+        _local_generations[name] = _local_generations.get(name, 0) + 1
+        generation = _local_generations[name]
+    client = _get_redis()
+    if client is not None:
+        try:
+            return int(client.incr(GENERATION_PREFIX + name))
+        except Exception as e:
+            _redis_failed(e)
+    return generation
+
+def get_counters(keys: Iterable[str]) -> Dict[str, Dict[str, int]]:
+    """
+    Hit/miss counters per key, aggregated across workers when Redis is available.
+    """
+    result = {}
+    client = _get_redis()
+    for key in keys:
+        counters = {"hits": 0, "misses": 0}
+        if client is not None:
+            try:
+                stored = client.hgetall(STATS_PREFIX + key)
+                for outcome in counters:
+                    counters[outcome] += int(stored.get(outcome.encode(), 0))
+            except Exception as e:
+                _redis_failed(e)
+        with _local_lock:
+            for outcome, value in _local_counters.get(key, {}).items():
+                counters[outcome] += value
+        result[key] = counters
+    return result
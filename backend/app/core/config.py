@@ -23,6 +23,50 @@ class Settings(BaseSettings):
     
     # Media
     MEDIA_DIR: str = "media"
+    # Export job output; kept outside MEDIA_DIR because /media is served publicly
+    EXPORT_DIR: str = "exports"
+
+    # Structured JSON logs, rotated by size; rotated files are indexed for /admin/logs/query
+    LOG_DIR: str = "logs"
+    LOG_FILE_PREFIX: str = "app"
+    LOG_LEVEL: str = "INFO"
+    LOG_MAX_BYTES: int = 20 * 1024 * 1024
+    LOG_BACKUP_COUNT: int = 20
+
+    # Audit log writer: entries are buffered and bulk-inserted every
+    # AUDIT_FLUSH_INTERVAL_MS or AUDIT_BATCH_SIZE entries
+    AUDIT_ASYNC: bool = True
+    AUDIT_BATCH_SIZE: int = 200
+    AUDIT_FLUSH_INTERVAL_MS: int = 250
+    AUDIT_QUEUE_MAX: int = 10000
+    # Rows older than this are moved to monthly gzipped JSONL files in AUDIT_ARCHIVE_DIR
+    AUDIT_RETENTION_DAYS: int = 180
+    AUDIT_ARCHIVE_DIR: str = "audit_archive"
+    AUDIT_ARCHIVE_BATCH_SIZE: int = 5000
+
+    # Dashboard stats cache (shared through Redis)
+    STATS_CACHE_TTL_SECONDS: int = 30
+
+    # Verifier work queue
+    WORK_QUEUE_LEASE_MINUTES: int = 15
+    WORK_QUEUE_MAX_CLAIM: int = 50
+
+    # Rendered notification bodies memoized per (type, payload)
+    EMAIL_RENDER_CACHE_SIZE: int = 256
+
+    # Email campaigns: recipients per persisted chunk, and the sending rate limit
+    EMAIL_CAMPAIGN_CHUNK_SIZE: int = 100
+    EMAIL_CAMPAIGN_RATE_PER_SECOND: float = 5.0
+    EMAIL_CAMPAIGN_BURST: int = 10
+    # A running campaign without progress for this long is resumed by the sweep
+    EMAIL_CAMPAIGN_STALE_MINUTES: int = 10
+
+    # Worker SMTP connection pool
+    SMTP_POOL_SIZE: int = 4
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
+    SMTP_KEEPALIVE_SECONDS: int = 60 # NOOP-check connections idle longer than this before reuse
+    SMTP_IDLE_TIMEOUT_SECONDS: int = 300 # Close connections idle longer than this
+    SMTP_POOL_ACQUIRE_TIMEOUT_SECONDS: int = 30 # Wait this long for a free connection, then raise SmtpPoolTimeout
 
     # Email Configuration (SMTP)
     MAIL_USERNAME: str = ""
@@ -0,0 +1,95 @@
+from typing import Dict, FrozenSet, Iterable, List, Optional
+from sqlalchemy.orm import Session
+from app.core.cache import bump_generation, get_generation
+from app.models.scholarship import Scholarship
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Each worker keeps its own copy, tagged with the shared generation it was built
+# at; invalidation bumps the generation so every worker rebuilds on its next read.
+# The TTL only bounds staleness while Redis is unreachable.
+CONFLICT_GRAPH_TTL_SECONDS = 60
+GENERATION_KEY = "conflict_graph"
+
+class ConflictGraph:
+    """
+    Symmetric mutual-exclusion index built from Scholarship.mutually_exclusive_ids.
+    If A lists B as exclusive, B also conflicts with A.
+    """
+    def __init__(self, edges: Dict[int, FrozenSet[int]]):
+        self._edges = edges
+
+    @classmethod
+    def build(cls, rows: Iterable) -> "ConflictGraph":
+        adjacency: Dict[int, set] = {}
+        for scholarship_id, exclusive_ids in rows:
+            for other_id in exclusive_ids or []:
+                try:
+                    other_id = int(other_id)
+                except (TypeError, ValueError):
+                    continue
+                if other_id == scholarship_id:
+                    continue
+                adjacency.setdefault(scholarship_id, set()).add(other_id)
+                adjacency.setdefault(other_id, set()).add(scholarship_id)
+        return cls({k: frozenset(v) for k, v in adjacency.items()})
+
+    def neighbours(self, scholarship_id: int) -> FrozenSet[int]:
+        return self._edges.get(scholarship_id, frozenset())
+
+    def conflicting_applications(self, scholarship_id: int, applications_by_scholarship: Dict[int, list]) -> List:
+        """
+        Return the applications (grouped by scholarship id) that conflict with scholarship_id.
+        """
+        result = []
+        for other_id in self.neighbours(scholarship_id):
+            result.extend(applications_by_scholarship.get(other_id, []))
+        return result
+
+_lock = threading.Lock()
+_cached_graph: Optional[ConflictGraph] = None
+_cached_generation = -1
+_cached_at = 0.0
+
+def get_conflict_graph(db: Session) -> ConflictGraph:
+    """
+    Return the cached conflict graph, rebuilding it when stale or invalidated.
+    """
+    global _cached_graph, _cached_generation, _cached_at
+    generation = get_generation(GENERATION_KEY)
+    with _lock:
+        if (
+            _cached_graph is not None
+            and _cached_generation == generation
+            and time.monotonic() - _cached_at < CONFLICT_GRAPH_TTL_SECONDS
+        ):
+            return _cached_graph
+
+    # Read in a transaction of its own: the caller's may hold a snapshot taken
+    # before the commit that the generation just read reflects
+    with Session(bind=db.get_bind()) as session:
+        rows = session.query(Scholarship.id, Scholarship.mutually_exclusive_ids).all()
+    graph = ConflictGraph.build(rows)
+    logger.debug(f"Rebuilt scholarship conflict graph from {len(rows)} scholarships")
+
+    # An invalidation during the rebuild means the rows read may predate it; serve
+    # them to this caller but do not cache them
+    if get_generation(GENERATION_KEY) == generation:
+        with _lock:
+            _cached_graph = graph
+            _cached_generation = generation
+            _cached_at = time.monotonic()
+    return graph
+
+def invalidate_conflict_graph() -> None:
+    """
+    Drop the cached graph in every worker. Call after committing any change to
+    mutually_exclusive_ids.
+    """
+    global _cached_graph
+    with _lock:
+        _cached_graph = None
+    bump_generation(GENERATION_KEY)
@@ -0,0 +1,92 @@
+from typing import Iterable, Set
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.models.application import Application, ApplicationDocument
+from app.models.student import StudentProfile
+from app.models.user import User
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Application carries copies of a few student fields and document counters so that
+# listings and department filters read a single table. These helpers keep them in
+# sync; they issue one UPDATE each and leave committing to the caller.
+
+# Profile columns copied onto each application under the same name
+PROFILE_FIELDS = ("department", "branch", "category", "gender")
+
+def refresh_document_counts(db: Session, application_ids: Iterable[int]) -> None:
+    """
+    Recompute total_docs/verified_docs for the given applications.
+    Call after adding, replacing or (un)verifying application documents.
+    """
+    application_ids = list(set(application_ids))
+    if not application_ids:
+        return
+    db.flush()
+    total = select(func.count(ApplicationDocument.id)).where(
+        ApplicationDocument.application_id == Application.id
+    ).scalar_subquery()
+    verified = select(func.count(ApplicationDocument.id)).where(
+        ApplicationDocument.application_id == Application.id,
+        ApplicationDocument.is_verified == True
+    ).scalar_subquery()
+    db.query(Application).filter(Application.id.in_(application_ids)).update(
+        {Application.total_docs: total, Application.verified_docs: verified},
+        synchronize_session=False
+    )
+
+def sync_student_fields(db: Session, student_ids: Iterable[int], move_rollups: bool = True) -> Set[str]:
+    """
+    Copy the student's name, department, branch, category and gender onto all of
+    their applications. Call after creating an application or editing a user's
+    name or profile.
+
+    Analytics rollups are keyed on the copied fields, so counts of applications
+    whose fields change are moved to their new bucket in the same transaction.
+    Pass move_rollups=False when the only applications out of sync are ones not yet
+    counted (just created, before record_applications_created) or during a backfill.
+    Returns the departments whose rollup counts changed.
+    """
+    student_ids = list(set(student_ids))
+    if not student_ids:
+        return set()
+    db.flush()
+    departments: Set[str] = set()
+    if move_rollups:
+        from app.core.analytics import record_profile_changes
+        departments = record_profile_changes(db, student_ids)
+
+    name = select(User.full_name).where(User.id == Application.student_id).scalar_subquery()
+    values = {Application.student_name: name}
+    for field in PROFILE_FIELDS:
+        values[getattr(Application, field)] = select(getattr(StudentProfile, field)).where(
+            StudentProfile.user_id == Application.student_id
+        ).scalar_subquery()
+    db.query(Application).filter(Application.student_id.in_(student_ids)).update(
+        values, synchronize_session=False
+    )
+    return departments
+
+def backfill_denormalized_fields(db: Session, batch_size: int = 1000) -> int:
+    """
+    Populate the denormalized columns for every application, one id range per transaction.
+    Rollups are not adjusted; run rebuild_rollups() afterwards.
+    Returns the number of applications processed.
+    """
+    processed = 0
+    last_id = 0
+    while True:
+        rows = db.query(Application.id, Application.student_id).filter(
+            Application.id > last_id
+        ).order_by(Application.id).limit(batch_size).all()
+        if not rows:
+            break
+        application_ids = [r.id for r in rows]
+        refresh_document_counts(db, application_ids)
+        sync_student_fields(db, {r.student_id for r in rows}, move_rollups=False)
+        db.commit()
+        processed += len(rows)
+        last_id = application_ids[-1]
+        logger.info(f"Backfilled denormalized fields up to application {last_id}")
+    return processed
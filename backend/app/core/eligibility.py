@@ -1,53 +1,105 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Tuple
+from sqlalchemy import and_, func, or_, true
+from sqlalchemy.orm import Session, Query
 from app.models.student import StudentProfile
 from app.models.scholarship import Scholarship
 
-def check_eligibility(student: StudentProfile, scholarship: Scholarship) -> Dict[str, Any]:
+# Both the Python evaluator and the SQL compiler are driven by _active_rules,
+# so a criterion added here is automatically enforced in both places.
+# Each rule is (criterion, profile_field, operator, limit).
+Rule = Tuple[str, str, str, Any]
+
+def _active_rules(scholarship: Scholarship) -> Iterator[Rule]:
     """
-    Check if a student is eligible for a scholarship.
-    Returns: {"eligible": bool, "reasons": List[str]}
+    Yield the eligibility rules that are switched on for a scholarship.
     """
-    reasons = []
-    eligible = True
-
-    # 1. Income Check
     if scholarship.max_family_income:
-        if student.annual_family_income > scholarship.max_family_income:
-            eligible = False
-            reasons.append(f"Family income ({student.annual_family_income}) exceeds limit ({scholarship.max_family_income})")
-
-    # 2. Percentage Check
+        yield ("max_family_income", "annual_family_income", "max", scholarship.max_family_income)
     if scholarship.min_percentage:
-        if student.previous_exam_percentage < scholarship.min_percentage:
-            eligible = False
-            reasons.append(f"Percentage ({student.previous_exam_percentage}%) is below minimum required ({scholarship.min_percentage}%)")
-
-    # 3. Category Check
+        yield ("min_percentage", "previous_exam_percentage", "min", scholarship.min_percentage)
     if scholarship.allowed_categories:
-        # Assuming allowed_categories is a list of strings stored as JSON
-        if student.category not in scholarship.allowed_categories:
-            eligible = False
-            reasons.append(f"Category '{student.category}' is not eligible. Allowed: {', '.join(scholarship.allowed_categories)}")
-
-    # 4. Department Check
+        yield ("allowed_categories", "category", "in", scholarship.allowed_categories)
     if scholarship.allowed_departments:
-        if student.department not in scholarship.allowed_departments:
-            eligible = False
-            reasons.append(f"Department '{student.department}' is not eligible.")
-
-    # 5. Year/Semester Check
+        yield ("allowed_departments", "department", "in", scholarship.allowed_departments)
     if scholarship.allowed_years:
-        if student.current_year_or_semester not in scholarship.allowed_years:
-            eligible = False
-            reasons.append(f"Year/Semester '{student.current_year_or_semester}' is not eligible.")
-
-    # 6. Government Job Check
+        yield ("allowed_years", "current_year_or_semester", "in", scholarship.allowed_years)
     if not scholarship.govt_job_allowed:
-        if student.parents_govt_job:
-            eligible = False
-            reasons.append("Students with parents in government jobs are not eligible.")
+        yield ("govt_job_allowed", "parents_govt_job", "not_set", None)
+
+def _fold(value: Any) -> Any:
+    # MySQL compares strings case-insensitively, so list matches ignore case on both sides
+    return value.lower() if isinstance(value, str) else value
+
+def _passes(value: Any, op: str, limit: Any) -> bool:
+    # Missing numeric values fail thresholds, mirroring SQL where NULL comparisons are never true
+    if op == "max":
+        return value is not None and value <= limit
+    if op == "min":
+        return value is not None and value >= limit
+    if op == "in":
+        return value is not None and _fold(value) in {_fold(item) for item in limit}
+    if op == "not_set":
+        return not value
+    raise ValueError(f"Unknown eligibility operator: {op}")
+
+def _reason(criterion: str, value: Any, limit: Any) -> str:
+    if criterion == "max_family_income":
+        if value is None:
+            return "Family income is not provided in profile"
+        return f"Family income ({value}) exceeds limit ({limit})"
+    if criterion == "min_percentage":
+        if value is None:
+            return "Previous exam percentage is not provided in profile"
+        return f"Percentage ({value}%) is below minimum required ({limit}%)"
+    if criterion == "allowed_categories":
+        return f"Category '{value}' is not eligible. Allowed: {', '.join(limit)}"
+    if criterion == "allowed_departments":
+        return f"Department '{value}' is not eligible."
+    if criterion == "allowed_years":
+        return f"Year/Semester '{value}' is not eligible."
+    if criterion == "govt_job_allowed":
+        return "Students with parents in government jobs are not eligible."
+    return f"Criterion '{criterion}' not met."
+
+def check_eligibility(student: StudentProfile, scholarship: Scholarship) -> Dict[str, Any]:
+    """
+    Check if a student is eligible for a scholarship.
+    Returns: {"eligible": bool, "reasons": List[str]}
+    """
+    reasons: List[str] = []
+
+    for criterion, field, op, limit in _active_rules(scholarship):
+        value = getattr(student, field)
+        if not _passes(value, op, limit):
+            reasons.append(_reason(criterion, value, limit))
 
     return {
-        "eligible": eligible,
+        "eligible": not reasons,
         "reasons": reasons
     }
+
+def _compile_rule(field: str, op: str, limit: Any):
+    column = getattr(StudentProfile, field)
+    if op == "max":
+        return and_(column.isnot(None), column <= limit)
+    if op == "min":
+        return and_(column.isnot(None), column >= limit)
+    if op == "in":
+        return func.lower(column).in_([_fold(item) for item in limit])
+    if op == "not_set":
+        return or_(column.is_(None), column == False)
+    raise ValueError(f"Unknown eligibility operator: {op}")
+
+def eligibility_clause(scholarship: Scholarship):
+    """
+    Compile a scholarship's criteria into a WHERE clause over StudentProfile.
+    Selects exactly the profiles for which check_eligibility() returns eligible.
+    """
+    clauses = [_compile_rule(field, op, limit) for _, field, op, limit in _active_rules(scholarship)]
+    return and_(true(), *clauses)
+
+def eligible_profiles_query(db: Session, scholarship: Scholarship) -> Query:
+    """
+    Query of StudentProfile rows eligible for the scholarship, evaluated in the database.
+    """
+    return db.query(StudentProfile).filter(eligibility_clause(scholarship))
@@ -0,0 +1,211 @@
+from typing import Iterator, List
+from datetime import datetime, timedelta
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.recipients import count_recipients, stream_recipients
+from app.db.database import SessionLocal
+from app.models.email_campaign import EmailCampaign, EmailCampaignChunk, EmailCampaignStatus, EmailChunkStatus
+import logging
+
+logger = logging.getLogger(__name__)
+
+def count_campaign_recipients(db: Session, campaign: EmailCampaign) -> int:
+    if campaign.target_group == "custom":
+        return len(set(campaign.custom_recipients or []))
+    return count_recipients(db, campaign.target_group, campaign.target_id)
+
+def _stream_recipients(db: Session, campaign: EmailCampaign) -> Iterator[str]:
+    if campaign.target_group == "custom":
+        yield from dict.fromkeys(campaign.custom_recipients or [])
+        return
+    yield from stream_recipients(db, campaign.target_group, campaign.target_id)
+
+def _plan_chunks(status_db: Session, data_db: Session, campaign: EmailCampaign) -> None:
+    """
+    Resolve recipients and persist them as chunks, so a restarted run resumes
+    from the first chunk that has not been sent.
+    """
+    total = 0
+    index = 0
+    chunk: List[str] = []
+
+    def add_chunk() -> None:
+        row = EmailCampaignChunk(campaign_id=campaign.id, chunk_index=index, recipients=chunk, recipient_count=len(chunk))
+        status_db.add(row)
+        # Planned in one transaction, without keeping every chunk in the session
+        status_db.flush()
+        status_db.expunge(row)
+
+    for email in _stream_recipients(data_db, campaign):
+        if not email:
+            continue
+        chunk.append(email)
+        if len(chunk) >= campaign.chunk_size:
+            add_chunk()
+            total += len(chunk)
+            index += 1
+            chunk = []
+    if chunk:
+        add_chunk()
+        total += len(chunk)
+        index += 1
+    campaign.total_recipients = total
+    campaign.total_chunks = index
+    status_db.commit()
+
+def _stale_before() -> datetime:
+    return datetime.utcnow() - timedelta(minutes=settings.EMAIL_CAMPAIGN_STALE_MINUTES)
+
+def _claim(db: Session, campaign_id: int) -> bool:
+    """
+    Mark the campaign RUNNING for this worker. Succeeds for a queued campaign, or
+    for a running one whose worker stopped sending (stale heartbeat), so that two
+    workers never send the same campaign at once.
+    """
+    claimed = db.query(EmailCampaign).filter(
+        EmailCampaign.id == campaign_id,
+        or_(
+            EmailCampaign.status == EmailCampaignStatus.QUEUED,
+            and_(
+                EmailCampaign.status == EmailCampaignStatus.RUNNING,
+                or_(EmailCampaign.heartbeat_at.is_(None), EmailCampaign.heartbeat_at < _stale_before())
+            )
+        )
+    ).update({
+        EmailCampaign.status: EmailCampaignStatus.RUNNING,
+        EmailCampaign.started_at: func.coalesce(EmailCampaign.started_at, func.now()),
+        EmailCampaign.heartbeat_at: datetime.utcnow(),
+    }, synchronize_session=False)
+    db.commit()
+    return claimed == 1
+
+def run_email_campaign(campaign_id: int) -> None:
+    """
+    Send a queued (or interrupted) campaign: one message per recipient over a
+    pooled SMTP connection checked out per chunk, paced by a token bucket.
+    Progress is committed after every recipient, so a run that dies resends at
+    most the message in flight; a restarted run continues at the first
+    unhandled recipient. If no pooled connection frees up in time the campaign
+    goes back to QUEUED and SmtpPoolTimeout propagates, for the task to retry.
+    """
+    from app.core.email import get_email_template
+    from app.core.mailer import SmtpPoolTimeout, get_smtp_pool
+    from app.core.rate_limit import TokenBucket
+
+    # Progress counters are kept in memory between per-recipient commits
+    status_db = SessionLocal(expire_on_commit=False)
+    # Recipients are streamed on a separate connection while chunks are committed
+    data_db = SessionLocal()
+    campaign = None
+    try:
+        if not _claim(status_db, campaign_id):
+            logger.warning(f"Email campaign {campaign_id} is not runnable or is running elsewhere; skipping")
+            return
+        campaign = status_db.get(EmailCampaign, campaign_id)
+        if campaign.total_chunks is None:
+            _plan_chunks(status_db, data_db, campaign)
+        data_db.close()
+
+        html = get_email_template("custom_message", {"body": campaign.body})
+        bucket = TokenBucket(settings.EMAIL_CAMPAIGN_RATE_PER_SECOND, settings.EMAIL_CAMPAIGN_BURST)
+        pending_ids = [chunk_id for (chunk_id,) in status_db.query(EmailCampaignChunk.id).filter(
+            EmailCampaignChunk.campaign_id == campaign.id,
+            EmailCampaignChunk.status == EmailChunkStatus.PENDING
+        ).order_by(EmailCampaignChunk.chunk_index)]
+
+        for chunk_id in pending_ids:
+            # One pooled connection per chunk, so a long campaign does not starve other senders
+            with get_smtp_pool().connection() as sender:
+                chunk = status_db.get(EmailCampaignChunk, chunk_id)
+                chunk_index = chunk.chunk_index
+                failures = list(chunk.failures or [])
+                failed_before = len(failures)
+                for offset in range(chunk.sent_offset or 0, len(chunk.recipients)):
+                    email = chunk.recipients[offset]
+                    bucket.acquire()
+                    try:
+                        sender.send(email, campaign.subject, html)
+                        chunk.sent_count = (chunk.sent_count or 0) + 1
+                        campaign.sent_count = (campaign.sent_count or 0) + 1
+                    except Exception as e:
+                        failures.append({"email": email, "error": str(e)})
+                        chunk.failures = list(failures)
+                        campaign.failed_count = (campaign.failed_count or 0) + 1
+                    chunk.sent_offset = offset + 1
+                    campaign.heartbeat_at = datetime.utcnow()
+                    status_db.commit()
+                chunk.status = EmailChunkStatus.SENT if chunk.sent_count else EmailChunkStatus.FAILED
+                chunk.sent_at = func.now()
+                campaign.completed_chunks = (campaign.completed_chunks or 0) + 1
+                status_db.commit()
+                status_db.expunge(chunk)
+                if len(failures) > failed_before:
+                    logger.warning(f"Email campaign {campaign_id} chunk {chunk_index}: {len(failures) - failed_before} failed")
+
+        campaign.status = EmailCampaignStatus.COMPLETED
+        campaign.finished_at = func.now()
+        status_db.commit()
+        logger.info(f"Email campaign {campaign_id} completed: {campaign.sent_count} sent, {campaign.failed_count} failed")
+    except SmtpPoolTimeout:
+        # Hand the campaign back; the task retries and resumes at the next recipient
+        logger.warning(f"Email campaign {campaign_id} is waiting for an SMTP connection; requeued")
+        status_db.rollback()
+        if campaign is not None:
+            campaign.status = EmailCampaignStatus.QUEUED
+            status_db.commit()
+        raise
+    except Exception as e:
+        logger.error(f"Email campaign {campaign_id} failed: {e}", exc_info=True)
+        status_db.rollback()
+        if campaign is not None:
+            campaign.status = EmailCampaignStatus.FAILED
+            campaign.error = str(e)
+            campaign.finished_at = func.now()
+            status_db.commit()
+    finally:
+        data_db.close()
+        status_db.close()
+
+def enqueue_campaign(campaign_id: int, background_tasks=None) -> None:
+    """
+    Hand a campaign to a Celery worker; if the broker is unavailable, run it in
+    FastAPI background_tasks (after the response) when given.
+    """
+    try:
+        from app.tasks.email_tasks import run_email_campaign_task
+        run_email_campaign_task.delay(campaign_id)
+    except Exception as e:
+        if background_tasks is None:
+            raise
+        logger.error(f"Failed to enqueue email campaign {campaign_id}, sending in background: {e}")
+        background_tasks.add_task(run_email_campaign, campaign_id)
+
+def requeue_campaign(db: Session, campaign: EmailCampaign) -> bool:
+    """
+    Make a failed campaign, or a running one that lost its worker, runnable again.
+    Sent recipients are not sent again. Returns False if it is neither.
+    Does not commit.
+    """
+    if campaign.status == EmailCampaignStatus.FAILED:
+        campaign.status = EmailCampaignStatus.QUEUED
+        campaign.error = None
+        campaign.finished_at = None
+        return True
+    if campaign.status == EmailCampaignStatus.RUNNING:
+        return campaign.heartbeat_at is None or campaign.heartbeat_at < _stale_before()
+    return False
+
+def resume_stalled_campaigns(db: Session) -> List[int]:
+    """
+    Re-enqueue running campaigns whose worker died (no heartbeat within
+    EMAIL_CAMPAIGN_STALE_MINUTES). Returns their ids.
+    """
+    stalled = [campaign_id for (campaign_id,) in db.query(EmailCampaign.id).filter(
+        EmailCampaign.status == EmailCampaignStatus.RUNNING,
+        or_(EmailCampaign.heartbeat_at.is_(None), EmailCampaign.heartbeat_at < _stale_before())
+    )]
+    for campaign_id in stalled:
+        logger.warning(f"Email campaign {campaign_id} stalled; resuming")
+        enqueue_campaign(campaign_id)
+    return stalled
@@ -0,0 +1,263 @@
+from typing import Any, Dict, List, Optional
+from datetime import date, datetime, time
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.application import Application, ApplicationStatus
+from app.models.export_job import ExportJob, ExportFormat, ExportJobStatus
+from app.models.scholarship import Scholarship
+from app.models.student import StudentProfile
+from app.models.user import User
+import csv
+import gzip
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rows held in memory at once: fetched per cursor round trip and written per chunk
+EXPORT_JOB_CHUNK_SIZE = 2000
+
+# --- Entities ---
+# Each column is (expression, kind); kind drives the Parquet schema.
+
+_STUDENT_COLUMNS = {
+    "student_id": (User.id, "int"),
+    "student_name": (User.full_name, "str"),
+    "email": (User.email, "str"),
+    "enrollment_no": (StudentProfile.enrollment_no, "str"),
+    "department": (StudentProfile.department, "str"),
+    "branch": (StudentProfile.branch, "str"),
+    "current_year_or_semester": (StudentProfile.current_year_or_semester, "str"),
+    "category": (StudentProfile.category, "str"),
+    "gender": (StudentProfile.gender, "str"),
+    "date_of_birth": (StudentProfile.date_of_birth, "date"),
+    "mobile_number": (StudentProfile.mobile_number, "str"),
+    "father_name": (StudentProfile.father_name, "str"),
+    "mother_name": (StudentProfile.mother_name, "str"),
+    "state": (StudentProfile.state, "str"),
+    "district": (StudentProfile.district, "str"),
+    "permanent_address": (StudentProfile.permanent_address, "str"),
+    "annual_family_income": (StudentProfile.annual_family_income, "float"),
+    "income_certificate_number": (StudentProfile.income_certificate_number, "str"),
+    "income_certificate_validity_date": (StudentProfile.income_certificate_validity_date, "date"),
+    "percentage_12th": (StudentProfile.percentage_12th, "float"),
+    "previous_exam_percentage": (StudentProfile.previous_exam_percentage, "float"),
+    "account_holder_name": (StudentProfile.account_holder_name, "str"),
+    "bank_name": (StudentProfile.bank_name, "str"),
+    "account_number": (StudentProfile.account_number, "str"),
+    "ifsc_code": (StudentProfile.ifsc_code, "str"),
+    "bank_branch_name": (StudentProfile.branch_name, "str"),
+}
+
+_APPLICATION_COLUMNS = {
+    "application_id": (Application.id, "int"),
+    "status": (Application.status, "str"),
+    "remarks": (Application.remarks, "str"),
+    "applied_at": (Application.created_at, "datetime"),
+    "updated_at": (Application.updated_at, "datetime"),
+    "scholarship_id": (Application.scholarship_id, "int"),
+    "scholarship_name": (Scholarship.name, "str"),
+    "total_docs": (Application.total_docs, "int"),
+    "verified_docs": (Application.verified_docs, "int"),
+    **_STUDENT_COLUMNS,
+}
+
+def _date_bound(value: str, end: bool) -> datetime:
+    return datetime.combine(date.fromisoformat(value), time.max if end else time.min)
+
+ENTITIES = {
+    "applications": {
+        "columns": _APPLICATION_COLUMNS,
+        "key": Application.id,
+        "base": lambda db, cols: db.query(*cols)
+            .select_from(Application)
+            .join(User, User.id == Application.student_id)
+            .join(Scholarship, Scholarship.id == Application.scholarship_id)
+            .outerjoin(StudentProfile, StudentProfile.user_id == Application.student_id),
+        "filters": {
+            "status": lambda q, v: q.filter(Application.status.in_([ApplicationStatus(s) for s in (v if isinstance(v, list) else [v])])),
+            "department": lambda q, v: q.filter(Application.department == v),
+            "scholarship_id": lambda q, v: q.filter(Application.scholarship_id == int(v)),
+            "created_from": lambda q, v: q.filter(Application.created_at >= _date_bound(v, end=False)),
+            "created_to": lambda q, v: q.filter(Application.created_at <= _date_bound(v, end=True)),
+        },
+    },
+    "students": {
+        "columns": _STUDENT_COLUMNS,
+        "key": StudentProfile.id,
+        "base": lambda db, cols: db.query(*cols)
+            .select_from(StudentProfile)
+            .join(User, User.id == StudentProfile.user_id),
+        "filters": {
+            "department": lambda q, v: q.filter(StudentProfile.department == v),
+            "category": lambda q, v: q.filter(StudentProfile.category == v),
+        },
+    },
+}
+
+def validate_export_spec(entity: str, columns: List[str], filters: Optional[Dict[str, Any]]) -> None:
+    """
+    Raise ValueError if the spec names an unknown entity, column or filter.
+    """
+    spec = ENTITIES.get(entity)
+    if not spec:
+        raise ValueError(f"Unknown entity '{entity}'. Available: {', '.join(ENTITIES)}")
+    if not columns:
+        raise ValueError("At least one column is required")
+    unknown = [c for c in columns if c not in spec["columns"]]
+    if unknown:
+        raise ValueError(f"Unknown columns for {entity}: {', '.join(unknown)}")
+    unknown = [f for f in (filters or {}) if f not in spec["filters"]]
+    if unknown:
+        raise ValueError(f"Unknown filters for {entity}: {', '.join(unknown)}")
+
+def build_export_query(db: Session, entity: str, columns: List[str], filters: Optional[Dict[str, Any]]):
+    spec = ENTITIES[entity]
+    query = spec["base"](db, [spec["columns"][c][0].label(c) for c in columns])
+    for name, value in (filters or {}).items():
+        if value not in (None, "", []):
+            query = spec["filters"][name](query, value)
+    return query.order_by(spec["key"])
+
+# --- Writers ---
+# Each writer receives rows in chunks and never holds more than one chunk.
+
+class _CsvGzWriter:
+    def __init__(self, path: str, columns: List[str], kinds: List[str]):
+        self._file = gzip.open(path, "wt", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write_rows(self, rows: List[list]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+class _ParquetWriter:
+    def __init__(self, path: str, columns: List[str], kinds: List[str]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        types = {"int": pa.int64(), "float": pa.float64(), "str": pa.string(),
+                 "date": pa.date32(), "datetime": pa.timestamp("us")}
+        self._pa = pa
+        self._columns = columns
+        self._schema = pa.schema([(c, types[k]) for c, k in zip(columns, kinds)])
+        self._writer = pq.ParquetWriter(path, self._schema, compression="snappy")
+
+    def write_rows(self, rows: List[list]) -> None:
+        arrays = [
+            self._pa.array([row[i] for row in rows], type=self._schema.field(i).type)
+            for i in range(len(self._columns))
+        ]
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+class _XlsxWriter:
+    def __init__(self, path: str, columns: List[str], kinds: List[str]):
+        from openpyxl import Workbook
+        # Write-only workbooks stream rows to disk instead of building the sheet in memory
+        self._path = path
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet("Export")
+        self._sheet.append(columns)
+
+    def write_rows(self, rows: List[list]) -> None:
+        for row in rows:
+            self._sheet.append(row)
+
+    def close(self) -> None:
+        self._workbook.save(self._path)
+
+WRITERS = {
+    ExportFormat.CSV_GZ: (_CsvGzWriter, "csv.gz"),
+    ExportFormat.PARQUET: (_ParquetWriter, "parquet"),
+    ExportFormat.XLSX: (_XlsxWriter, "xlsx"),
+}
+
+def check_format_available(export_format: ExportFormat) -> None:
+    """
+    Raise ValueError if the library needed for export_format is not installed.
+    """
+    module = {ExportFormat.PARQUET: "pyarrow", ExportFormat.XLSX: "openpyxl"}.get(export_format)
+    if module:
+        try:
+            __import__(module)
+        except ImportError:
+            raise ValueError(f"{export_format.value} exports require the '{module}' package")
+
+def _plain(value):
+    return value.value if hasattr(value, "value") else value
+
+# --- Runner ---
+
+def run_export_job(job_id: int) -> None:
+    """
+    Execute a queued export job, streaming rows from a server-side cursor into the
+    output file chunk by chunk and recording progress after each chunk.
+    """
+    # Progress is committed on its own connection while the data cursor is open
+    status_db = SessionLocal()
+    data_db = SessionLocal()
+    path = None
+    job = None
+    try:
+        job = status_db.query(ExportJob).filter(ExportJob.id == job_id).first()
+        if not job or job.status != ExportJobStatus.QUEUED:
+            logger.warning(f"Export job {job_id} is not queued; skipping")
+            return
+        job.status = ExportJobStatus.RUNNING
+        job.started_at = func.now()
+        status_db.commit()
+
+        columns = list(job.columns)
+        kinds = [ENTITIES[job.entity]["columns"][c][1] for c in columns]
+        query = build_export_query(data_db, job.entity, columns, job.filters)
+        job.total_rows = query.order_by(None).count()
+        status_db.commit()
+
+        writer_class, extension = WRITERS[job.format]
+        os.makedirs(settings.EXPORT_DIR, exist_ok=True)
+        path = os.path.join(settings.EXPORT_DIR, f"export_{job.id}_{job.entity}.{extension}")
+        writer = writer_class(path, columns, kinds)
+
+        processed = 0
+        chunk = []
+        try:
+            for row in query.execution_options(yield_per=EXPORT_JOB_CHUNK_SIZE):
+                chunk.append([_plain(v) for v in row])
+                if len(chunk) >= EXPORT_JOB_CHUNK_SIZE:
+                    writer.write_rows(chunk)
+                    processed += len(chunk)
+                    chunk = []
+                    job.processed_rows = processed
+                    status_db.commit()
+            if chunk:
+                writer.write_rows(chunk)
+                processed += len(chunk)
+        finally:
+            writer.close()
+
+        job.processed_rows = processed
+        job.file_path = path
+        job.status = ExportJobStatus.COMPLETED
+        job.finished_at = func.now()
+        status_db.commit()
+        logger.info(f"Export job {job_id} completed: {processed} rows -> {path}")
+    except Exception as e:
+        logger.error(f"Export job {job_id} failed: {e}", exc_info=True)
+        status_db.rollback()
+        if job is not None:
+            job.status = ExportJobStatus.FAILED
+            job.error = str(e)
+            job.finished_at = func.now()
+            status_db.commit()
+        if path and os.path.exists(path):
+            os.remove(path)
+    finally:
+        data_db.close()
+        status_db.close()
@@ -0,0 +1,78 @@
+from typing import Callable, Iterable, Iterator, List
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal
+import csv
+import io
+import zlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 1000
+# Flush the CSV buffer to the client once it reaches this many characters
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+def csv_chunks(header: List[str], rows: Iterable[Iterable]) -> Iterator[str]:
+    """
+    Encode rows as CSV, yielding text chunks of roughly EXPORT_CHUNK_SIZE.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def gzip_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)  # gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+def stream_query_rows(build_query: Callable[[Session], object], format_row: Callable) -> Iterator:
+    """
+    Run build_query(db) on a server-side cursor and yield formatted rows.
+    Uses its own session: the request's session is closed before a
+    StreamingResponse body is iterated.
+    """
+    db = SessionLocal()
+    try:
+        query = build_query(db).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        for row in query:
+            yield format_row(row)
+    except Exception as e:
+        logger.error(f"Export stream failed: {e}", exc_info=True)
+        raise
+    finally:
+        db.close()
+
+def csv_export_response(
+    filename: str,
+    header: List[str],
+    build_query: Callable[[Session], object],
+    format_row: Callable,
+    gzip: bool = False,
+) -> StreamingResponse:
+    """
+    Stream a query as a CSV (or gzipped CSV) attachment without buffering the whole file.
+    """
+    chunks = csv_chunks(header, stream_query_rows(build_query, format_row))
+    if gzip:
+        response = StreamingResponse(gzip_chunks(chunks), media_type="application/gzip")
+        filename = f"{filename}.gz"
+    else:
+        response = StreamingResponse(chunks, media_type="text/csv")
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
+    return response
+
+def enum_value(value):
+    return value.value if hasattr(value, "value") else value
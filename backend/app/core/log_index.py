@@ -0,0 +1,192 @@
+from typing import Dict, List, Optional
+from collections import Counter
+from datetime import datetime
+from app.core.config import settings
+import glob
+import heapq
+import json
+import os
+
+# Structured log files are JSON lines. When a file is rotated out, a small index is
+# written next to it so queries can skip whole files, or seek straight to the
+# first relevant byte, instead of parsing every line.
+
+INDEX_SUFFIX = ".idx.json"
+# One time -> byte offset checkpoint per this many records
+INDEX_CHECKPOINT_EVERY = 500
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+def format_ts(dt: datetime) -> str:
+    """
+    UTC timestamp as written to structured logs; string order is time order.
+    """
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}Z"
+
+def build_index(path: str) -> dict:
+    """
+    Scan a finished log file once and write its index.
+    """
+    first_ts = last_ts = None
+    checkpoints: List[list] = []
+    request_ids: Dict[str, int] = {}
+    levels: Counter = Counter()
+    error_routes: Counter = Counter()
+    offset = 0
+    records = 0
+    with open(path, "rb") as f:
+        for raw in f:
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                offset += len(raw)
+                continue
+            ts = record.get("ts")
+            if records % INDEX_CHECKPOINT_EVERY == 0:
+                checkpoints.append([ts, offset])
+            first_ts = first_ts or ts
+            last_ts = ts or last_ts
+            request_id = record.get("request_id")
+            if request_id and request_id not in request_ids:
+                request_ids[request_id] = offset
+            level = record.get("level") or ""
+            levels[level] += 1
+            if level in ("ERROR", "CRITICAL"):
+                error_routes[record.get("route") or ""] += 1
+            offset += len(raw)
+            records += 1
+
+    index = {
+        "first_ts": first_ts,
+        "last_ts": last_ts,
+        "records": records,
+        "levels": dict(levels),
+        "error_routes": dict(error_routes),
+        "checkpoints": checkpoints,
+        "request_ids": request_ids,
+    }
+    with open(path + INDEX_SUFFIX, "w") as f:
+        json.dump(index, f, separators=(",", ":"))
+    return index
+
+def _load_index(path: str) -> Optional[dict]:
+    try:
+        with open(path + INDEX_SUFFIX) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def list_log_files() -> List[str]:
+    """
+    Structured log files (active and rotated), newest first by modification time.
+    """
+    pattern = os.path.join(settings.LOG_DIR, f"{settings.LOG_FILE_PREFIX}*.log*")
+    files = [p for p in glob.glob(pattern) if not p.endswith(INDEX_SUFFIX)]
+    return sorted(files, key=os.path.getmtime, reverse=True)
+
+def _start_offset(index: dict, since: Optional[str], request_id: Optional[str]) -> int:
+    if request_id:
+        return index["request_ids"][request_id]
+    offset = 0
+    if since:
+        for ts, checkpoint_offset in index["checkpoints"]:
+            if ts and ts >= since:
+                break
+            offset = checkpoint_offset
+    return offset
+
+def _can_skip(index: dict, min_rank: Optional[int], route: Optional[str], since: Optional[str],
+              until: Optional[str], request_id: Optional[str]) -> bool:
+    if since and index["last_ts"] and index["last_ts"] < since:
+        return True
+    if until and index["first_ts"] and index["first_ts"] > until:
+        return True
+    if request_id and request_id not in index["request_ids"]:
+        return True
+    if min_rank is not None:
+        levels_present = [lvl for lvl, n in index["levels"].items() if n and lvl in LOG_LEVELS and LOG_LEVELS.index(lvl) >= min_rank]
+        if not levels_present:
+            return True
+        # Error-level queries for one route only need files with errors on that route
+        if route and min_rank >= LOG_LEVELS.index("ERROR") and not index["error_routes"].get(route):
+            return True
+    return False
+
+def query_logs(
+    level: Optional[str] = None,
+    route: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    request_id: Optional[str] = None,
+    user_id: Optional[int] = None,
+    contains: Optional[str] = None,
+    limit: int = 200,
+) -> List[dict]:
+    """
+    The limit newest structured log records matching every given filter, newest first.
+    level is a minimum level; since/until are timestamps in format_ts() form.
+    Once limit matches are held, rotated files older than all of them are not read.
+    """
+    min_rank = LOG_LEVELS.index(level.upper()) if level else None
+    needle = contains.lower() if contains else None
+    if limit <= 0:
+        return []
+
+    unindexed: List[str] = []
+    indexed: List[tuple] = []
+    for path in list_log_files():
+        index = _load_index(path)
+        if index is None:
+            # Active files (one per live process) may hold the newest records
+            unindexed.append(path)
+        elif not _can_skip(index, min_rank, route, since, until, request_id):
+            indexed.append((path, index))
+    indexed.sort(key=lambda item: item[1]["last_ts"] or "", reverse=True)
+
+    # The limit newest matches so far, as a min-heap of (ts, seq, record)
+    newest: List[tuple] = []
+    seq = 0
+    for path, index in [(p, None) for p in unindexed] + indexed:
+        floor = newest[0][0] if len(newest) >= limit else None
+        if index is not None:
+            if floor and index["last_ts"] and index["last_ts"] < floor:
+                # Files are in last_ts order, so every remaining one is older than all kept matches
+                break
+            start = _start_offset(index, max(since or "", floor or "") or None, request_id)
+        else:
+            start = 0
+
+        with open(path, "rb") as f:
+            f.seek(start)
+            for raw in f:
+                try:
+                    record = json.loads(raw)
+                except ValueError:
+                    continue
+                ts = record.get("ts") or ""
+                if since and ts < since:
+                    continue
+                if until and ts > until:
+                    # Records are appended in time order
+                    break
+                if len(newest) >= limit and ts <= newest[0][0]:
+                    continue
+                if request_id and record.get("request_id") != request_id:
+                    continue
+                if route and record.get("route") != route:
+                    continue
+                if user_id is not None and record.get("user_id") != user_id:
+                    continue
+                if min_rank is not None:
+                    record_level = record.get("level")
+                    if record_level not in LOG_LEVELS or LOG_LEVELS.index(record_level) < min_rank:
+                        continue
+                if needle and needle not in raw.decode("utf-8", errors="replace").lower():
+                    continue
+                seq += 1
+                if len(newest) < limit:
+                    heapq.heappush(newest, (ts, seq, record))
+                else:
+                    heapq.heapreplace(newest, (ts, seq, record))
+
+    return [record for _, _, record in sorted(newest, reverse=True)]
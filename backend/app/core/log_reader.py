@@ -0,0 +1,104 @@
+from typing import AsyncIterator, Callable, List, Optional
+import asyncio
+import os
+import re
+
+SERVER_LOG_CANDIDATES = ("server.log", "backend/server.log", "../server.log")
+
+# Bytes read per backwards seek
+TAIL_BLOCK_SIZE = 64 * 1024
+# Stop scanning backwards after this much when a filter matches rarely
+TAIL_MAX_SCAN_BYTES = 64 * 1024 * 1024
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_LEVEL_RE = re.compile(r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b")
+
+def find_server_log() -> Optional[str]:
+    for path in SERVER_LOG_CANDIDATES:
+        if os.path.exists(path):
+            return path
+    return None
+
+def line_filter(level: Optional[str] = None, contains: Optional[str] = None) -> Optional[Callable[[str], bool]]:
+    """
+    Build a predicate keeping lines at or above level (by the first level name on the line)
+    and containing the given substring (case-insensitive). Returns None if nothing is filtered.
+    """
+    if not level and not contains:
+        return None
+    min_rank = LOG_LEVELS.index(level.upper()) if level else None
+    needle = contains.lower() if contains else None
+
+    def matches(line: str) -> bool:
+        if needle and needle not in line.lower():
+            return False
+        if min_rank is not None:
+            found = _LEVEL_RE.search(line)
+            if not found or LOG_LEVELS.index(found.group(1)) < min_rank:
+                return False
+        return True
+    return matches
+
+def tail_lines(path: str, count: int, predicate: Optional[Callable[[str], bool]] = None) -> List[str]:
+    """
+    Return the last count lines (matching predicate, if given) by reading the file
+    backwards in blocks, so cost depends on the lines returned rather than file size.
+    """
+    matched: List[str] = []
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        scanned = 0
+        # Bytes of a line that started before the current block
+        remainder = b""
+        while position > 0 and len(matched) < count and scanned < TAIL_MAX_SCAN_BYTES:
+            read_size = min(TAIL_BLOCK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size) + remainder
+            scanned += read_size
+            parts = block.split(b"\n")
+            # The first part may be incomplete unless we reached the start of the file
+            remainder = parts.pop(0) if position > 0 else b""
+            for raw in reversed(parts):
+                if not raw:
+                    continue
+                line = raw.decode("utf-8", errors="replace") + "\n"
+                if predicate is None or predicate(line):
+                    matched.append(line)
+                    if len(matched) >= count:
+                        break
+    matched.reverse()
+    return matched
+
+async def follow_lines(
+    path: str,
+    predicate: Optional[Callable[[str], bool]] = None,
+    poll_interval: float = 1.0,
+    is_disconnected: Optional[Callable] = None,
+) -> AsyncIterator[Optional[str]]:
+    """
+    Yield lines appended to path after the call, starting at the current end of file.
+    Yields None on idle polls so callers can send keep-alives. Handles truncation
+    (e.g. the server restarting with a fresh log) by starting over from the beginning.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        partial = b""
+        while True:
+            if is_disconnected is not None and await is_disconnected():
+                return
+            if os.path.getsize(path) < f.tell():
+                f.seek(0)
+                partial = b""
+            data = f.read()
+            if not data:
+                yield None
+                await asyncio.sleep(poll_interval)
+                continue
+            parts = (partial + data).split(b"\n")
+            partial = parts.pop()
+            for raw in parts:
+                line = raw.decode("utf-8", errors="replace")
+                if raw and (predicate is None or predicate(line)):
+                    yield line
@@ -0,0 +1,225 @@
+from typing import List, Optional, Union
+from contextlib import contextmanager
+from email.message import EmailMessage
+from email.utils import formataddr
+from app.core.config import settings
+import os
+import smtplib
+import ssl
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Errors after which the connection is unusable and a reconnect is worth one retry
+_CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError)
+
+class SmtpPoolTimeout(Exception):
+    """
+    No pooled SMTP connection became free in time. Nothing was sent, so the
+    task can be retried as is.
+    """
+
+def build_message(to: Union[str, List[str]], subject: str, html: str, bcc: Optional[List[str]] = None) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = formataddr((settings.MAIL_FROM_NAME, settings.MAIL_FROM))
+    message["To"] = to if isinstance(to, str) else ", ".join(to)
+    if bcc:
+        message["Bcc"] = ", ".join(bcc)
+    message["Subject"] = subject
+    message.set_content(html, subtype="html")
+    return message
+
+class SmtpSender:
+    """
+    One SMTP connection (TLS and AUTH done once) reused for many messages.
+    Reconnects once if the server drops it, and after max_messages messages
+    (servers such as Gmail cap messages per connection).
+
+        with SmtpSender() as sender:
+            sender.send(email, subject, html)
+    """
+    # Connections opened by this process, including reconnects
+    connections_opened = 0
+
+    def __init__(self, timeout: float = 30, max_messages: Optional[int] = None):
+        self.timeout = timeout
+        self.max_messages = max_messages or settings.SMTP_MAX_MESSAGES_PER_CONNECTION
+        self.messages_sent = 0
+        self.last_used = 0.0
+        self._smtp = None
+
+    @property
+    def connected(self) -> bool:
+        return self._smtp is not None
+
+    def connect(self) -> None:
+        context = ssl.create_default_context()
+        if not settings.VALIDATE_CERTS:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        if settings.MAIL_SSL_TLS:
+            smtp = smtplib.SMTP_SSL(settings.MAIL_SERVER, settings.MAIL_PORT, timeout=self.timeout, context=context)
+        else:
+            smtp = smtplib.SMTP(settings.MAIL_SERVER, settings.MAIL_PORT, timeout=self.timeout)
+            if settings.MAIL_STARTTLS:
+                smtp.starttls(context=context)
+        if settings.USE_CREDENTIALS:
+            smtp.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
+        self._smtp = smtp
+        SmtpSender.connections_opened += 1
+        self.messages_sent = 0
+        self.last_used = time.monotonic()
+
+    def is_alive(self) -> bool:
+        if self._smtp is None:
+            return False
+        try:
+            return self._smtp.noop()[0] == 250
+        except Exception:
+            return False
+
+    def send(self, to: Union[str, List[str]], subject: str, html: str, bcc: Optional[List[str]] = None) -> None:
+        """
+        With bcc, the message is delivered only to the bcc addresses; smtplib
+        strips the Bcc header, so recipients never see each other.
+        """
+        self.send_message(build_message(to, subject, html, bcc), to_addrs=bcc)
+
+    def send_message(self, message: EmailMessage, to_addrs: Optional[List[str]] = None) -> None:
+        if self._smtp is not None and self.messages_sent >= self.max_messages:
+            self.close()
+        if self._smtp is None:
+            self.connect()
+        try:
+            self._smtp.send_message(message, to_addrs=to_addrs)
+        except _CONNECTION_ERRORS as e:
+            logger.warning(f"SMTP connection lost ({e}); reconnecting")
+            self.close()
+            self.connect()
+            self._smtp.send_message(message, to_addrs=to_addrs)
+        self.messages_sent += 1
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            pass
+        self._smtp = None
+
+    def __enter__(self) -> "SmtpSender":
+        self.connect()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+class SmtpPool:
+    """
+    Process-wide pool of persistent SMTP connections, shared by all tasks a
+    worker runs. Connections idle longer than keepalive_seconds are checked with
+    NOOP before reuse and replaced if dead; ones idle past idle_timeout_seconds
+    are closed rather than reused. At most `size` connections exist at once;
+    a checkout waits up to acquire_timeout_seconds for one, then raises
+    SmtpPoolTimeout.
+    """
+    def __init__(self, size: int, keepalive_seconds: float, idle_timeout_seconds: float, acquire_timeout_seconds: float):
+        self.size = size
+        self.keepalive_seconds = keepalive_seconds
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+        self._idle: List[SmtpSender] = []
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self.stats = {"checkouts": 0, "new_connections": 0, "timeouts": 0}
+
+    def _checkout(self) -> SmtpSender:
+        if not self._slots.acquire(timeout=self.acquire_timeout_seconds):
+            self.stats["timeouts"] += 1
+            raise SmtpPoolTimeout(f"No SMTP connection free after {self.acquire_timeout_seconds}s (pool size {self.size})")
+        try:
+            while True:
+                with self._lock:
+                    sender = self._idle.pop() if self._idle else None
+                if sender is None:
+                    sender = SmtpSender()
+                    sender.connect()
+                    self.stats["new_connections"] += 1
+                    self.stats["checkouts"] += 1
+                    return sender
+                idle_for = time.monotonic() - sender.last_used
+                if idle_for > self.idle_timeout_seconds:
+                    sender.close()
+                    continue
+                if idle_for > self.keepalive_seconds and not sender.is_alive():
+                    sender.close()
+                    continue
+                self.stats["checkouts"] += 1
+                return sender
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _checkin(self, sender: SmtpSender, broken: bool) -> None:
+        try:
+            if broken or not sender.connected:
+                sender.close()
+            else:
+                with self._lock:
+                    self._idle.append(sender)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        sender = self._checkout()
+        broken = False
+        try:
+            yield sender
+        except _CONNECTION_ERRORS:
+            broken = True
+            raise
+        finally:
+            self._checkin(sender, broken)
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for sender in idle:
+            sender.close()
+
+_pool: Optional[SmtpPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+def get_smtp_pool() -> SmtpPool:
+    """
+    The current process's pool; a forked worker child gets its own.
+    """
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = SmtpPool(
+                    size=settings.SMTP_POOL_SIZE,
+                    keepalive_seconds=settings.SMTP_KEEPALIVE_SECONDS,
+                    idle_timeout_seconds=settings.SMTP_IDLE_TIMEOUT_SECONDS,
+                    acquire_timeout_seconds=settings.SMTP_POOL_ACQUIRE_TIMEOUT_SECONDS,
+                )
+                _pool_pid = os.getpid()
+    return _pool
+
+def send_email(subject: str, email_to: List[str], body: str) -> None:
+    """
+    Synchronous counterpart of send_email_async for workers, over a pooled connection.
+    Several recipients are sent one message in Bcc, addressed To the sender.
+    """
+    with get_smtp_pool().connection() as sender:
+        if len(email_to) > 1:
+            sender.send(formataddr((settings.MAIL_FROM_NAME, settings.MAIL_FROM)), subject, body, bcc=email_to)
+        else:
+            sender.send(email_to, subject, body)
@@ -1,43 +1,71 @@
 import time
+import uuid
 import logging
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.routing import Match
+from app.core.structured_logging import configure_logging, request_context
 
-logging.basicConfig(level=logging.DEBUG)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Reduce noise from some libraries if needed, but for now keep full debug
 logging.getLogger("uvicorn.access").setLevel(logging.INFO) # Keep access logs clean
 logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO) # Log SQL queries
 
+def _route_template(request: Request) -> str:
+    """
+    Path template of the matching route (e.g. /api/v1/admin/applications/{application_id}),
+    resolved up front so records logged inside the endpoint carry it too.
+    """
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, "path", request.url.path)
+    return request.url.path
+
 class LoggingMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         start_time = time.time()
-        
+        request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+        context = {"request_id": request_id, "user_id": None, "route": _route_template(request)}
+        token = request_context.set(context)
+
         # Log request
         logger.info(
             f"{request.method} {request.url.path} - "
-            f"Client: {request.client.host if request.client else 'unknown'}"
+            f"Client: {request.client.host if request.client else 'unknown'}",
+            extra={"method": request.method},
         )
-        
+
         try:
             response = await call_next(request)
         except Exception as e:
             process_time = time.time() - start_time
             logger.error(
                 f"{request.method} {request.url.path} - "
-                f"Error after {process_time:.3f}s: {str(e)}"
+                f"Error after {process_time:.3f}s: {str(e)}",
+                extra={"method": request.method, "status": 500, "latency_ms": round(process_time * 1000, 1)},
             )
+            request_context.reset(token)
             raise
-        
+
         process_time = time.time() - start_time
-        
+
         # Log response
-        log_level = logger.warning if response.status_code >= 400 else logger.info
+        if response.status_code >= 500:
+            log_level = logger.error
+        elif response.status_code >= 400:
+            log_level = logger.warning
+        else:
+            log_level = logger.info
         log_level(
             f"{request.method} {request.url.path} - "
             f"Status: {response.status_code} - "
-            f"Time: {process_time:.3f}s"
+            f"Time: {process_time:.3f}s",
+            extra={"method": request.method, "status": response.status_code, "latency_ms": round(process_time * 1000, 1)},
         )
-        
+        request_context.reset(token)
+
+        response.headers["X-Request-ID"] = request_id
         return response
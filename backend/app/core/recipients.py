@@ -0,0 +1,94 @@
+from typing import Iterator, List, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.application import Application
+from app.models.scholarship import Scholarship
+from app.models.student import StudentProfile
+from app.models.user import User, UserRole
+
+# Each target group resolves to one joined, DISTINCT, email-only query, streamed
+# from a server-side cursor: no ORM objects and no IN lists built in Python.
+
+# Rows fetched per server-side cursor round trip
+RECIPIENT_FETCH_SIZE = 1000
+
+TARGET_GROUPS = ("all", "department", "branch", "scholarship", "eligible", "custom")
+
+def validate_target(target_group: str, target_id: Optional[str], custom_recipients: Optional[List[str]] = None) -> None:
+    """
+    Raise ValueError if the target cannot be resolved.
+    "scholarship" targets the scholarship's applicants, "eligible" every student
+    whose profile meets its eligibility criteria; both take a scholarship id.
+    """
+    if target_group not in TARGET_GROUPS:
+        raise ValueError(f"target_group must be one of: {', '.join(TARGET_GROUPS)}")
+    if target_group in ("department", "branch", "scholarship", "eligible") and not target_id:
+        raise ValueError(f"target_id is required for target_group '{target_group}'")
+    if target_group in ("scholarship", "eligible") and not str(target_id).isdigit():
+        raise ValueError("target_id must be a scholarship id")
+    if target_group == "custom" and not custom_recipients:
+        raise ValueError("custom_recipients is required for target_group 'custom'")
+
+def recipient_query(db: Session, target_group: str, target_id: Optional[str] = None):
+    """
+    Query of distinct recipient email addresses (one column) for a target group.
+    """
+    query = db.query(User.email)
+    if target_group == "all":
+        query = query.filter(User.role == UserRole.STUDENT)
+    elif target_group in ("department", "branch"):
+        column = StudentProfile.department if target_group == "department" else StudentProfile.branch
+        query = query.join(StudentProfile, StudentProfile.user_id == User.id).filter(column == target_id)
+    elif target_group == "scholarship":
+        query = query.join(Application, Application.student_id == User.id).filter(
+            Application.scholarship_id == int(target_id)
+        )
+    elif target_group == "eligible":
+        from app.core.eligibility import eligibility_clause
+        scholarship = db.query(Scholarship).filter(Scholarship.id == int(target_id)).first()
+        if not scholarship:
+            raise ValueError(f"Scholarship {target_id} not found")
+        query = query.join(StudentProfile, StudentProfile.user_id == User.id).filter(
+            User.role == UserRole.STUDENT, eligibility_clause(scholarship)
+        )
+    else:
+        raise ValueError(f"No recipient query for target_group '{target_group}'")
+    return query.filter(User.email.isnot(None)).distinct()
+
+def count_recipients(db: Session, target_group: str, target_id: Optional[str] = None) -> int:
+    subquery = recipient_query(db, target_group, target_id).subquery()
+    return db.query(func.count()).select_from(subquery).scalar() or 0
+
+def stream_recipients(db: Session, target_group: str, target_id: Optional[str] = None) -> Iterator[str]:
+    query = recipient_query(db, target_group, target_id).execution_options(yield_per=RECIPIENT_FETCH_SIZE)
+    for (email,) in query:
+        yield email
+
+def recipient_chunks(db: Session, target_group: str, target_id: Optional[str] = None, size: int = 100) -> Iterator[List[str]]:
+    """
+    Stream recipients in lists of at most size addresses.
+    """
+    chunk: List[str] = []
+    for email in stream_recipients(db, target_group, target_id):
+        chunk.append(email)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def notify_recipients(db: Session, target_group: str, target_id: Optional[str], notification_type: str, data: dict) -> int:
+    """
+    Queue a templated notification for every recipient of a target group, one
+    task per EMAIL_CAMPAIGN_CHUNK_SIZE addresses. Returns the number of recipients.
+    Runs in the worker (notify_recipients_task): db is held open for the whole
+    fan-out, so never pass a request session.
+    """
+    from app.core.config import settings
+    from app.tasks.email_tasks import send_notification_task
+
+    total = 0
+    for chunk in recipient_chunks(db, target_group, target_id, settings.EMAIL_CAMPAIGN_CHUNK_SIZE):
+        send_notification_task.delay(notification_type=notification_type, recipients=chunk, data=data)
+        total += len(chunk)
+    return total
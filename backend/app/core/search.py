@@ -0,0 +1,74 @@
+from typing import List
+from sqlalchemy import or_, and_
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+from app.models.user import User
+from app.models.student import StudentProfile
+from app.models.scholarship import Scholarship
+from app.models.application import Application
+import re
+
+# InnoDB ignores FULLTEXT tokens shorter than innodb_ft_min_token_size (default 3)
+FULLTEXT_MIN_TOKEN = 3
+MAX_SEARCH_TOKENS = 5
+
+def tokenize(q: str) -> List[str]:
+    """
+    Split a free-text query into lowercase word tokens.
+    Punctuation (including FULLTEXT boolean operators) is dropped.
+    """
+    return re.findall(r"\w+", (q or "").lower())[:MAX_SEARCH_TOKENS]
+
+def _like_prefix(token: str) -> str:
+    """
+    LIKE pattern matching values that start with token; use with escape="\\".
+    """
+    escaped = token.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+def _like_word(column, token: str):
+    """
+    Match values with a word starting with token: at the start of the value or
+    after a space, as the FULLTEXT prefix search does for longer tokens.
+    """
+    pattern = _like_prefix(token)
+    return or_(column.like(pattern, escape="\\"), column.like(f"% {pattern}", escape="\\"))
+
+def _user_ids_matching(db: Session, token: str):
+    if len(token) >= FULLTEXT_MIN_TOKEN:
+        name_or_email = match(User.full_name, User.email, against=f"{token}*").in_boolean_mode()
+    else:
+        name_or_email = or_(
+            _like_word(User.full_name, token),
+            User.email.like(_like_prefix(token), escape="\\"),
+        )
+    by_user = db.query(User.id).filter(name_or_email)
+    # enrollment_no has a unique (B-tree) index, so a prefix LIKE is a range scan
+    by_enrollment = db.query(StudentProfile.user_id).filter(StudentProfile.enrollment_no.like(_like_prefix(token), escape="\\"))
+    return by_user.union(by_enrollment)
+
+def _scholarship_ids_matching(db: Session, token: str):
+    if len(token) >= FULLTEXT_MIN_TOKEN:
+        condition = match(Scholarship.name, against=f"{token}*").in_boolean_mode()
+    else:
+        condition = _like_word(Scholarship.name, token)
+    return db.query(Scholarship.id).filter(condition)
+
+def application_search_clause(db: Session, q: str):
+    """
+    Filter clause matching applications where every token in q starts a word of
+    the student name or scholarship name, or starts the email or enrollment number.
+    Each token is resolved against the FULLTEXT/B-tree indexes of its own table first,
+    so the applications table is only probed by student_id/scholarship_id.
+    Returns None when q has no searchable tokens.
+    """
+    tokens = tokenize(q)
+    if not tokens:
+        return None
+    return and_(*[
+        or_(
+            Application.student_id.in_(_user_ids_matching(db, token)),
+            Application.scholarship_id.in_(_scholarship_ids_matching(db, token)),
+        )
+        for token in tokens
+    ])
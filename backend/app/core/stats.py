@@ -0,0 +1,114 @@
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import case, func, literal, select
+from sqlalchemy.orm import Session
+from app.core import cache
+from app.core.config import settings
+from app.models.user import User
+from app.models.application import Application, ApplicationStatus
+from app.models.scholarship import Scholarship
+
+ADMIN_STATS_KEY = "admin-stats"
+
+def _count(model, *conditions):
+    return select(func.count()).select_from(model).where(*conditions).scalar_subquery()
+
+def compute_admin_stats(db: Session) -> dict:
+    """
+    Super admin dashboard counters in one round trip.
+    """
+    row = db.query(
+        _count(User).label("total_users"),
+        _count(Application).label("total_applications"),
+        _count(Application, Application.status == ApplicationStatus.UNDER_VERIFICATION).label("pending_verifications"),
+        _count(Scholarship).label("total_scholarships"),
+    ).one()
+    return dict(row._mapping)
+
+def get_admin_stats(db: Session) -> dict:
+    return cache.get_or_set(ADMIN_STATS_KEY, settings.STATS_CACHE_TTL_SECONDS, lambda: compute_admin_stats(db))
+
+def invalidate_admin_stats() -> None:
+    """
+    Call after committing changes to users, applications or scholarships.
+    """
+    cache.invalidate(ADMIN_STATS_KEY)
+
+# --- Department stats ---
+
+DEPT_STATS_KEY = "dept-stats:{}"
+ALL_DEPT_STATS_KEY = "dept-stats:all"
+
+DEPT_STATUS_FIELDS = {
+    "pending_applications": ApplicationStatus.SUBMITTED,
+    "approved_applications": ApplicationStatus.APPROVED,
+    "rejected_applications": ApplicationStatus.REJECTED,
+    "docs_required_applications": ApplicationStatus.DOCS_REQUIRED,
+}
+
+def _empty_dept_stats(department: str) -> dict:
+    stats = {"department": department or None, "total_students": 0, "total_applications": 0}
+    stats.update({field: 0 for field in DEPT_STATUS_FIELDS})
+    return stats
+
+def compute_department_stats(db: Session, department: Optional[str] = None) -> Dict[str, dict]:
+    """
+    Application and student counters keyed by department ("" for students without one).
+    Applications come from one grouped query over the rollup table, students from one over profiles.
+    """
+    from app.models.analytics import ApplicationRollup
+    from app.models.student import StudentProfile
+
+    app_query = db.query(
+        ApplicationRollup.department,
+        func.sum(ApplicationRollup.count).label("total_applications"),
+        *[
+            func.sum(case((ApplicationRollup.status == status, ApplicationRollup.count), else_=0)).label(field)
+            for field, status in DEPT_STATUS_FIELDS.items()
+        ]
+    )
+    student_department = func.coalesce(StudentProfile.department, literal(""))
+    student_query = db.query(student_department, func.count(StudentProfile.id))
+    if department is not None:
+        app_query = app_query.filter(ApplicationRollup.department == department)
+        student_query = student_query.filter(student_department == department)
+
+    result = {}
+    for row in app_query.group_by(ApplicationRollup.department).all():
+        stats = result.setdefault(row.department, _empty_dept_stats(row.department))
+        stats["total_applications"] = int(row.total_applications or 0)
+        for field in DEPT_STATUS_FIELDS:
+            stats[field] = int(getattr(row, field) or 0)
+    for dept, total in student_query.group_by(student_department).all():
+        result.setdefault(dept, _empty_dept_stats(dept))["total_students"] = total
+    return result
+
+def get_department_stats(db: Session, department: str) -> dict:
+    def load():
+        return compute_department_stats(db, department).get(department, _empty_dept_stats(department))
+    return cache.get_or_set(DEPT_STATS_KEY.format(department), settings.STATS_CACHE_TTL_SECONDS, load)
+
+def get_all_department_stats(db: Session) -> List[dict]:
+    def load():
+        return sorted(compute_department_stats(db).values(), key=lambda s: s["department"] or "")
+    return cache.get_or_set(ALL_DEPT_STATS_KEY, settings.STATS_CACHE_TTL_SECONDS, load)
+
+def combine_department_stats(per_department: Iterable[dict]) -> dict:
+    totals = _empty_dept_stats("")
+    del totals["department"]
+    for stats in per_department:
+        for field in totals:
+            totals[field] += stats[field]
+    return totals
+
+def invalidate_department_stats(departments: Iterable[Optional[str]]) -> None:
+    """
+    Call after committing changes to applications or student departments.
+    """
+    cache.invalidate(ALL_DEPT_STATS_KEY, *[DEPT_STATS_KEY.format(d or "") for d in set(departments)])
+
+def invalidate_application_stats(departments: Iterable[Optional[str]]) -> None:
+    """
+    Invalidate everything derived from application counts: admin and department stats.
+    """
+    invalidate_admin_stats()
+    invalidate_department_stats(departments)
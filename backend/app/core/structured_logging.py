@@ -0,0 +1,153 @@
+from typing import Optional
+from contextvars import ContextVar
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from app.core.config import settings
+from app.core.log_index import INDEX_SUFFIX, build_index, format_ts
+import glob
+import json
+import logging
+import os
+import re
+
+# Per-request fields attached to every record logged while the request runs.
+# The value is a mutable dict so that dependencies executed in a worker thread
+# (which run on a copy of the context) can still fill in e.g. the user id.
+request_context: ContextVar[Optional[dict]] = ContextVar("request_context", default=None)
+
+# Attributes every LogRecord has; anything else was passed through extra=
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        # os.kill would terminate the process; Windows refuses to rename a file that
+        # another process holds open, so adopting a live worker's file just fails
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def set_request_user(user_id: int) -> None:
+    context = request_context.get()
+    if context is not None:
+        context["user_id"] = user_id
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line: ts, level, logger, message, the request context
+    (request_id, user_id, route) and any extra= fields such as status or latency_ms.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": format_ts(datetime.utcfromtimestamp(record.created)),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        context = request_context.get()
+        if context:
+            entry.update(context)
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class IndexedRotatingFileHandler(RotatingFileHandler):
+    """
+    Size-rotated log file. Rotated files get a unique timestamped name (instead of
+    the usual .1/.2 shifting, which would invalidate indexes) and an index sidecar.
+    """
+    def _rotated_name(self) -> str:
+        while True:
+            rotated = f"{self.baseFilename}.{datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')}"
+            if not os.path.exists(rotated):
+                return rotated
+
+    def _index(self, path: str) -> None:
+        try:
+            build_index(path)
+        except Exception:
+            # Unindexed files are still queryable, just by a full scan
+            pass
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename):
+            rotated = self._rotated_name()
+            os.rename(self.baseFilename, rotated)
+            self._index(rotated)
+            self._prune()
+        if not self.delay:
+            self.stream = self._open()
+
+    def adopt_orphans(self, prefix: str) -> None:
+        """
+        Take over the log files of processes that have exited. Their active file is
+        rotated and indexed, and their rotated files are renamed into this
+        handler's series, so that retention pruning covers them.
+        """
+        directory = os.path.dirname(self.baseFilename)
+        pattern = re.compile(rf"^{re.escape(prefix)}\.(\d+)\.log(\.\d{{8}}T\d+)?$")
+        for name in sorted(os.listdir(directory)):
+            found = pattern.match(name)
+            if not found or int(found.group(1)) == os.getpid() or _pid_alive(int(found.group(1))):
+                continue
+            path = os.path.join(directory, name)
+            suffix = found.group(2)
+            target = f"{self.baseFilename}{suffix}" if suffix else self._rotated_name()
+            if os.path.exists(target):
+                continue
+            try:
+                if not suffix and os.path.getsize(path) == 0:
+                    os.remove(path)
+                    continue
+                os.rename(path, target)
+                if suffix and os.path.exists(path + INDEX_SUFFIX):
+                    os.rename(path + INDEX_SUFFIX, target + INDEX_SUFFIX)
+            except OSError:
+                # Another process adopted it first, or (on Windows) its owner is alive
+                continue
+            if not os.path.exists(target + INDEX_SUFFIX):
+                self._index(target)
+        self._prune()
+
+    def _prune(self) -> None:
+        rotated = sorted(
+            p for p in glob.glob(f"{glob.escape(self.baseFilename)}.*") if not p.endswith(INDEX_SUFFIX)
+        )
+        for path in rotated[:-self.backupCount] if self.backupCount else []:
+            for stale in (path, path + INDEX_SUFFIX):
+                if os.path.exists(stale):
+                    os.remove(stale)
+
+def configure_logging() -> None:
+    """
+    Console output as before, plus JSON lines in LOG_DIR. Each process writes its
+    own file so that multiple workers never rotate the same file, and on startup
+    takes over the files left by exited processes.
+    """
+    root = logging.getLogger()
+    if any(isinstance(h, IndexedRotatingFileHandler) for h in root.handlers):
+        return
+    logging.basicConfig(level=logging.DEBUG)
+
+    os.makedirs(settings.LOG_DIR, exist_ok=True)
+    path = os.path.join(settings.LOG_DIR, f"{settings.LOG_FILE_PREFIX}.{os.getpid()}.log")
+    handler = IndexedRotatingFileHandler(
+        path, maxBytes=settings.LOG_MAX_BYTES, backupCount=settings.LOG_BACKUP_COUNT, encoding="utf-8"
+    )
+    handler.setLevel(getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO))
+    handler.setFormatter(JsonFormatter())
+    root.addHandler(handler)
+    try:
+        handler.adopt_orphans(settings.LOG_FILE_PREFIX)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Could not adopt log files of exited processes: {e}")
@@ -0,0 +1,98 @@
+from typing import Any, Dict, Iterable, List
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models.application import Application, ApplicationDocument
+from app.models.audit import AuditLog
+from app.models.email_campaign import EmailCampaign
+from app.models.export_job import ExportJob
+from app.models.notice import Notice
+from app.models.student import StudentProfile, StudentDocument
+from app.models.user import User
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Users purged per transaction by the bulk purge
+PURGE_BATCH_SIZE = 200
+
+def purge_users(db: Session, user_ids: Iterable[int]) -> Dict[str, Any]:
+    """
+    Delete users and everything they own with one statement per table instead of
+    loading rows into the session. References that must outlive the user (audit
+    entries, notices, export jobs, email campaigns, work queue claims) are unlinked.
+
+    Does not commit, and does not touch the filesystem: the returned "file_paths"
+    should be removed after the commit (see delete_files_later). Also returns the
+    departments whose stats changed and the number of users deleted.
+    """
+    from app.core.analytics import record_applications_removed
+
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return {"deleted": 0, "file_paths": [], "departments": set()}
+
+    application_ids = select(Application.id).where(Application.student_id.in_(user_ids))
+    file_paths: List[str] = [
+        path for (path,) in db.query(ApplicationDocument.file_path).filter(
+            ApplicationDocument.application_id.in_(application_ids)
+        )
+    ]
+    file_paths += [
+        path for (path,) in db.query(StudentDocument.file_path).filter(StudentDocument.student_id.in_(user_ids))
+    ]
+    departments = {
+        department for (department,) in db.query(StudentProfile.department).filter(
+            StudentProfile.user_id.in_(user_ids)
+        ).distinct()
+    }
+    departments |= record_applications_removed(
+        db, [app_id for (app_id,) in db.execute(application_ids)]
+    )
+
+    db.query(AuditLog).filter(AuditLog.user_id.in_(user_ids)).update(
+        {AuditLog.user_id: None}, synchronize_session=False
+    )
+    db.query(Notice).filter(Notice.created_by.in_(user_ids)).update(
+        {Notice.created_by: None}, synchronize_session=False
+    )
+    db.query(ExportJob).filter(ExportJob.created_by.in_(user_ids)).update(
+        {ExportJob.created_by: None}, synchronize_session=False
+    )
+    db.query(EmailCampaign).filter(EmailCampaign.created_by.in_(user_ids)).update(
+        {EmailCampaign.created_by: None}, synchronize_session=False
+    )
+    db.query(Application).filter(Application.claimed_by.in_(user_ids)).update(
+        {Application.claimed_by: None, Application.claimed_until: None}, synchronize_session=False
+    )
+
+    # Children first, so foreign keys hold at every step
+    db.query(ApplicationDocument).filter(
+        ApplicationDocument.application_id.in_(application_ids)
+    ).delete(synchronize_session=False)
+    db.query(Application).filter(Application.student_id.in_(user_ids)).delete(synchronize_session=False)
+    db.query(StudentDocument).filter(StudentDocument.student_id.in_(user_ids)).delete(synchronize_session=False)
+    db.query(StudentProfile).filter(StudentProfile.user_id.in_(user_ids)).delete(synchronize_session=False)
+    deleted = db.query(User).filter(User.id.in_(user_ids)).delete(synchronize_session=False)
+
+    # Objects loaded earlier in this session may refer to the deleted rows
+    db.expire_all()
+    return {"deleted": deleted, "file_paths": file_paths, "departments": departments}
+
+def delete_files(paths: List[str]) -> int:
+    from app.core.storage import delete_file
+    return sum(1 for path in paths if delete_file(path))
+
+def delete_files_later(paths: List[str], background_tasks=None) -> None:
+    """
+    Remove files on a Celery worker; if the broker is unavailable, fall back to
+    FastAPI background_tasks (after the response) when given.
+    """
+    if not paths:
+        return
+    try:
+        from app.tasks.maintenance_tasks import delete_files_task
+        delete_files_task.delay(paths)
+    except Exception as e:
+        logger.error(f"Failed to enqueue deletion of {len(paths)} files: {e}")
+        if background_tasks is not None:
+            background_tasks.add_task(delete_files, paths)
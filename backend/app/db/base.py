@@ -6,4 +6,7 @@ from app.models.scholarship import Scholarship, ScholarshipDocumentRequirement,
 from app.models.application import Application, ApplicationDocument  # noqa
 from app.models.student import StudentProfile, StudentDocument  # noqa
 from app.models.notice import Notice  # noqa
+from app.models.analytics import ApplicationRollup, StatusTransitionRollup  # noqa
+from app.models.export_job import ExportJob  # noqa
+from app.models.email_campaign import EmailCampaign, EmailCampaignChunk  # noqa
 from app.models.university import Department, SessionYear  # noqa
@@ -17,6 +17,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Request-ID"],
 )
 
 from app.core.middleware import LoggingMiddleware
@@ -31,6 +32,11 @@ if not os.path.exists(settings.MEDIA_DIR):
     os.makedirs(settings.MEDIA_DIR)
 app.mount("/media", StaticFiles(directory=settings.MEDIA_DIR), name="media")
 
+@app.on_event("shutdown")
+def drain_audit_writer():
+    from app.core.audit_writer import audit_writer
+    audit_writer.stop()
+
 @app.get("/")
 def root():
     return {"message": "Welcome to Unified Scholarship Portal API"}
@@ -0,0 +1,46 @@
+from sqlalchemy import Column, Integer, String, Date, Enum, UniqueConstraint, Index
+from app.db.database import Base
+from app.models.application import ApplicationStatus
+
+# Rollups are keyed on plain values rather than foreign keys so they survive
+# deletes; unknown dimensions are stored as "" so the unique key stays effective.
+
+class ApplicationRollup(Base):
+    """
+    Current number of applications per creation day and dimensions, by present status.
+    """
+    __tablename__ = "application_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)
+    department = Column(String(100), nullable=False, default="")
+    category = Column(String(50), nullable=False, default="")
+    gender = Column(String(10), nullable=False, default="")
+    status = Column(Enum(ApplicationStatus), nullable=False)
+    scholarship_id = Column(Integer, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("day", "department", "category", "gender", "status", "scholarship_id", name="uq_application_rollups_key"),
+        Index("ix_application_rollups_department_status", "department", "status"),
+    )
+
+class StatusTransitionRollup(Base):
+    """
+    Number of applications that entered each status on each day.
+    """
+    __tablename__ = "status_transition_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)
+    department = Column(String(100), nullable=False, default="")
+    category = Column(String(50), nullable=False, default="")
+    gender = Column(String(10), nullable=False, default="")
+    status = Column(Enum(ApplicationStatus), nullable=False)
+    scholarship_id = Column(Integer, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("day", "department", "category", "gender", "status", "scholarship_id", name="uq_status_transition_rollups_key"),
+        Index("ix_status_transition_rollups_status_day", "status", "day"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Enum, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Enum, Boolean, Index
 from sqlalchemy.orm import relationship, backref
 from sqlalchemy.sql import func
 from app.db.database import Base
@@ -12,6 +12,17 @@ class ApplicationStatus(str, enum.Enum):
     APPROVED = "approved"
     REJECTED = "rejected"
 
+# Status changes staff may make. Drafts belong to the student until submitted,
+# and decided applications can only be reopened for verification.
+STAFF_STATUS_TRANSITIONS = {
+    ApplicationStatus.DRAFT: set(),
+    ApplicationStatus.SUBMITTED: {ApplicationStatus.UNDER_VERIFICATION, ApplicationStatus.DOCS_REQUIRED, ApplicationStatus.APPROVED, ApplicationStatus.REJECTED},
+    ApplicationStatus.UNDER_VERIFICATION: {ApplicationStatus.SUBMITTED, ApplicationStatus.DOCS_REQUIRED, ApplicationStatus.APPROVED, ApplicationStatus.REJECTED},
+    ApplicationStatus.DOCS_REQUIRED: {ApplicationStatus.UNDER_VERIFICATION, ApplicationStatus.APPROVED, ApplicationStatus.REJECTED},
+    ApplicationStatus.APPROVED: {ApplicationStatus.UNDER_VERIFICATION},
+    ApplicationStatus.REJECTED: {ApplicationStatus.UNDER_VERIFICATION},
+}
+
 class Application(Base):
     __tablename__ = "applications"
 
@@ -22,10 +33,31 @@ class Application(Base):
     remarks = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # Denormalized for listings; kept in sync by app.core.denorm
+    student_name = Column(String(255), nullable=True)
+    department = Column(String(100), nullable=True)
+    branch = Column(String(100), nullable=True)
+    category = Column(String(50), nullable=True)
+    gender = Column(String(10), nullable=True)
+    total_docs = Column(Integer, nullable=False, default=0, server_default="0")
+    verified_docs = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Verifier work queue lease
+    claimed_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    claimed_until = Column(DateTime, nullable=True)
     
-    student = relationship("app.models.user.User", backref="applications")
+    student = relationship("app.models.user.User", backref="applications", foreign_keys=[student_id])
     scholarship = relationship("app.models.scholarship.Scholarship")
 
+    __table_args__ = (
+        Index("ix_applications_created_at_id", "created_at", "id"),
+        Index("ix_applications_status_claimed_until", "status", "claimed_until"),
+        Index("ix_applications_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_applications_department_created_at_id", "department", "created_at", "id"),
+        Index("ix_applications_department_status", "department", "status"),
+    )
+
 class ApplicationDocument(Base):
     __tablename__ = "application_documents"
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text, Index
 from sqlalchemy.sql import func
 from app.db.database import Base
 
@@ -13,3 +13,11 @@ class AuditLog(Base):
     details = Column(JSON, nullable=True) # Changed fields, remarks, etc.
     ip_address = Column(String(50), nullable=True)
     timestamp = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_audit_logs_timestamp_id", "timestamp", "id"),
+        # Filtered listings seek on (filter, timestamp, id) in newest-first order
+        Index("ix_audit_logs_user_timestamp_id", "user_id", "timestamp", "id"),
+        Index("ix_audit_logs_action_timestamp_id", "action", "timestamp", "id"),
+        Index("ix_audit_logs_target_timestamp_id", "target_type", "target_id", "timestamp", "id"),
+    )
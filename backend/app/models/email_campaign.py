@@ -0,0 +1,66 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text, Enum, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from app.db.database import Base
+import enum
+
+class EmailCampaignStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class EmailChunkStatus(str, enum.Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+class EmailCampaign(Base):
+    __tablename__ = "email_campaigns"
+
+    id = Column(Integer, primary_key=True, index=True)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False) # Raw message; wrapped in the custom_message template when sent
+    target_group = Column(String(50), nullable=False) # "all", "department", "branch", "scholarship", "custom"
+    target_id = Column(String(100), nullable=True)
+    custom_recipients = Column(JSON, nullable=True)
+    status = Column(Enum(EmailCampaignStatus), default=EmailCampaignStatus.QUEUED, nullable=False)
+
+    # Progress
+    chunk_size = Column(Integer, nullable=False)
+    total_recipients = Column(Integer, nullable=True)
+    total_chunks = Column(Integer, nullable=True)
+    completed_chunks = Column(Integer, default=0)
+    sent_count = Column(Integer, default=0)
+    failed_count = Column(Integer, default=0)
+
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    # UTC; refreshed with every progress commit. A RUNNING campaign whose heartbeat
+    # is older than EMAIL_CAMPAIGN_STALE_MINUTES has lost its worker and is resumed.
+    heartbeat_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_email_campaigns_created_at_id", "created_at", "id"),
+    )
+
+class EmailCampaignChunk(Base):
+    __tablename__ = "email_campaign_chunks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    campaign_id = Column(Integer, ForeignKey("email_campaigns.id", ondelete="CASCADE"), nullable=False)
+    chunk_index = Column(Integer, nullable=False)
+    recipients = Column(JSON, nullable=False) # List of email addresses
+    recipient_count = Column(Integer, nullable=False, default=0, server_default="0") # len(recipients), for status reads
+    status = Column(Enum(EmailChunkStatus), default=EmailChunkStatus.PENDING, nullable=False)
+    sent_count = Column(Integer, default=0)
+    # Recipients handled (sent or failed) so far; a resumed run starts from here
+    sent_offset = Column(Integer, nullable=False, default=0, server_default="0")
+    failures = Column(JSON, nullable=True) # [{"email": ..., "error": ...}]
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("campaign_id", "chunk_index", name="uq_email_campaign_chunks_campaign_chunk"),
+    )
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text, Enum, Index
+from sqlalchemy.sql import func
+from app.db.database import Base
+import enum
+
+class ExportFormat(str, enum.Enum):
+    CSV_GZ = "csv_gz"
+    PARQUET = "parquet"
+    XLSX = "xlsx"
+
+class ExportJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class ExportJob(Base):
+    __tablename__ = "export_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    entity = Column(String(50), nullable=False) # e.g., "applications", "students"
+    columns = Column(JSON, nullable=False)
+    filters = Column(JSON, nullable=True)
+    format = Column(Enum(ExportFormat), nullable=False)
+    status = Column(Enum(ExportJobStatus), default=ExportJobStatus.QUEUED, nullable=False)
+
+    # Progress
+    total_rows = Column(Integer, nullable=True)
+    processed_rows = Column(Integer, default=0)
+
+    file_path = Column(String(500), nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_export_jobs_created_by_created_at", "created_by", "created_at"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
@@ -14,3 +14,7 @@ class Notice(Base):
     created_by = Column(Integer, ForeignKey("users.id"))
     
     creator = relationship("User", back_populates="notices")
+
+    __table_args__ = (
+        Index("ix_notices_created_at_id", "created_at", "id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Date, Boolean, ForeignKey, JSON, Float
+from sqlalchemy import Column, Integer, String, Text, Date, Boolean, ForeignKey, JSON, Float, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
@@ -34,6 +34,10 @@ class Scholarship(Base):
     
     required_documents = relationship("ScholarshipDocumentRequirement", back_populates="scholarship", order_by="ScholarshipDocumentRequirement.order_index")
 
+    __table_args__ = (
+        Index("ix_scholarships_fulltext_name", "name", mysql_prefix="FULLTEXT"),
+    )
+
 class DocumentCategory(Base):
     __tablename__ = "document_categories"
     
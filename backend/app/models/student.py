@@ -11,7 +11,7 @@ class StudentProfile(Base):
     
     # Personal
     enrollment_no = Column(String(50), unique=True)
-    department = Column(String(100))
+    department = Column(String(100), index=True)
     branch = Column(String(100))
     mobile_number = Column(String(15))
     date_of_birth = Column(Date)
@@ -20,7 +20,7 @@ class StudentProfile(Base):
     mother_name = Column(String(100))
     
     # Category
-    category = Column(String(50)) # General, OBC, SC, ST
+    category = Column(String(50), index=True) # General, OBC, SC, ST
     minority_status = Column(Boolean, default=False)
     disability = Column(Boolean, default=False)
     disability_percentage = Column(Float, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, Enum, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
@@ -25,3 +25,8 @@ class User(Base):
     
     notices = relationship("Notice", back_populates="creator")
     # Relationships will be added in respective files or here if circular imports allow
+
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_fulltext_name_email", "full_name", "email", mysql_prefix="FULLTEXT"),
+    )
@@ -1,8 +1,10 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict
 from datetime import date, datetime
 from app.models.user import UserRole
 from app.models.application import ApplicationStatus
+from app.models.export_job import ExportFormat, ExportJobStatus
+from app.models.email_campaign import EmailCampaignStatus, EmailChunkStatus
 
 # User Schemas
 class UserBase(BaseModel):
@@ -265,12 +267,105 @@ class ApplicationResponse(BaseModel):
     remarks: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
+    student_name: Optional[str] = None
+    department: Optional[str] = None
+    branch: Optional[str] = None
+    total_docs: int = 0
+    verified_docs: int = 0
     student: Optional[UserResponse] = None
     documents: List[ApplicationDocumentResponse] = []
     
     class Config:
         from_attributes = True
 
+class ApplicationListItem(BaseModel):
+    id: int
+    student_id: int
+    student_name: Optional[str] = None
+    enrollment_no: Optional[str] = None
+    department: Optional[str] = None
+    scholarship_id: int
+    scholarship_name: Optional[str] = None
+    status: ApplicationStatus
+    total_docs: int = 0
+    verified_docs: int = 0
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    class Config:
+        from_attributes = True
+
+class ScholarshipSummary(BaseModel):
+    id: int
+    name: str
+    category: Optional[str] = None
+    last_date: Optional[date] = None
+    application_link: Optional[str] = None
+    is_renewable: Optional[bool] = False
+    is_active: bool = True
+    class Config:
+        from_attributes = True
+
+class ApplicationWithScholarshipResponse(ApplicationResponse):
+    scholarship: Optional[ScholarshipSummary] = None
+
+    class Config:
+        from_attributes = True
+
+# --- Export Job Schemas ---
+class ExportJobCreate(BaseModel):
+    entity: str
+    columns: List[str]
+    filters: Optional[Dict[str, Any]] = None
+    format: ExportFormat = ExportFormat.CSV_GZ
+
+class ExportJobResponse(BaseModel):
+    id: int
+    entity: str
+    columns: List[str]
+    filters: Optional[Dict[str, Any]] = None
+    format: ExportFormat
+    status: ExportJobStatus
+    total_rows: Optional[int] = None
+    processed_rows: Optional[int] = 0
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    class Config:
+        from_attributes = True
+
+class EmailCampaignResponse(BaseModel):
+    id: int
+    subject: str
+    target_group: str
+    target_id: Optional[str] = None
+    status: EmailCampaignStatus
+    chunk_size: int
+    total_recipients: Optional[int] = None
+    total_chunks: Optional[int] = None
+    completed_chunks: Optional[int] = 0
+    sent_count: Optional[int] = 0
+    failed_count: Optional[int] = 0
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None
+    class Config:
+        from_attributes = True
+
+class EmailCampaignChunkResponse(BaseModel):
+    chunk_index: int
+    status: EmailChunkStatus
+    recipient_count: int
+    sent_count: Optional[int] = 0
+    sent_offset: Optional[int] = 0
+    failures: Optional[List[Dict[str, str]]] = None
+    sent_at: Optional[datetime] = None
+
+class EmailCampaignDetail(EmailCampaignResponse):
+    chunks: List[EmailCampaignChunkResponse] = []
+
 # --- Notice Schemas ---
 class NoticeBase(BaseModel):
     title: str
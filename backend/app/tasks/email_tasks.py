@@ -1,39 +1,29 @@
 from app.celery_app import celery_app
-from app.core.email import send_email_async, get_email_template
-from typing import List, Dict, Any
-import asyncio
-
-# Wrapper to run async function in sync Celery task
-def run_async(coro):
-    loop = asyncio.get_event_loop()
-    if loop.is_running():
-        return loop.create_task(coro)
-    else:
-        return loop.run_until_complete(coro)
+from app.core.email import get_email_template, render_personalized
+from app.core.mailer import SmtpPoolTimeout, get_smtp_pool, send_email
+from typing import List, Dict, Any, Optional
+from collections import defaultdict
+import logging
 
-@celery_app.task
+logger = logging.getLogger(__name__)
+
+# Tasks that send through the SMTP pool back off and retry when it stays exhausted
+POOL_RETRY = dict(autoretry_for=(SmtpPoolTimeout,), retry_backoff=True, retry_jitter=True, max_retries=5)
+
+@celery_app.task(**POOL_RETRY)
 def send_email_task(subject: str, recipients: List[str], body: str):
     """
     Generic Celery task to send emails.
     """
-    # Since Celery runs in a separate process/thread, we need to handle async properly
-    # For simplicity in this environment, we'll use asyncio.run or similar
-    # But fastapi-mail is async. 
-    # Best practice: Use an async-compatible worker or run_until_complete.
-    
     # Wrap the raw body in our professional template
     # We treat it as a "custom_message"
     final_body = get_email_template("custom_message", {"body": body})
     
-    asyncio.run(send_email_async(subject, recipients, final_body))
+    # Sent over the worker's pooled SMTP connection
+    send_email(subject, recipients, final_body)
     return f"Email sent to {len(recipients)} recipients"
 
-@celery_app.task
-def send_notification_task(notification_type: str, recipients: List[str], data: Dict[str, Any]):
-    """
-    Task to generate email body from template and send it.
-    """
-    body = get_email_template(notification_type, data)
+def get_notification_subject(notification_type: str, data: Dict[str, Any]) -> str:
     subject_map = {
         "application_submitted": "Application Submitted Successfully",
         "application_approved": "Scholarship Application Approved",
@@ -44,7 +34,90 @@ def send_notification_task(notification_type: str, recipients: List[str], data:
         "notice_published": f"Notice: {data.get('title')}",
         "custom_message": data.get('subject', "Message from Scholarship Cell")
     }
-    subject = subject_map.get(notification_type, "Notification")
+    return subject_map.get(notification_type, "Notification")
+
+@celery_app.task(**POOL_RETRY)
+def send_notification_task(notification_type: str, recipients: List[str], data: Dict[str, Any]):
+    """
+    Task to generate email body from template and send it.
+    """
+    body = get_email_template(notification_type, data)
+    subject = get_notification_subject(notification_type, data)
     
-    asyncio.run(send_email_async(subject, recipients, body))
+    send_email(subject, recipients, body)
     return f"Notification '{notification_type}' sent to {len(recipients)} recipients"
+
+@celery_app.task
+def notify_recipients_task(target_group: str, target_id: Optional[str], notification_type: str, data: Dict[str, Any]):
+    """
+    Resolve a target group's recipients and queue its notification in chunks,
+    so API requests never stream recipients or talk to the broker per chunk.
+    """
+    from app.core.recipients import notify_recipients
+    from app.db.database import SessionLocal
+    db = SessionLocal()
+    try:
+        count = notify_recipients(db, target_group, target_id, notification_type, data)
+    finally:
+        db.close()
+    return f"Notification '{notification_type}' queued for {count} recipients"
+
+@celery_app.task(**POOL_RETRY)
+def send_notification_batch_task(notifications: List[Dict[str, Any]]):
+    """
+    Send many personalised notifications in one job.
+    Each item is {"notification_type": str, "recipients": [str], "data": {...}}.
+    A failure on one message is logged and does not stop the rest.
+    """
+    # Render each notification type once per batch, sharing the layout
+    bodies = [None] * len(notifications)
+    by_type = defaultdict(list)
+    for i, item in enumerate(notifications):
+        by_type[item["notification_type"]].append(i)
+    for notification_type, indexes in by_type.items():
+        try:
+            rendered = render_personalized(notification_type, {}, [notifications[i].get("data", {}) for i in indexes])
+        except Exception as e:
+            logger.error(f"Rendering '{notification_type}' notifications failed: {e}")
+            continue
+        for i, body in zip(indexes, rendered):
+            bodies[i] = body
+
+    sent, failed = 0, 0
+    with get_smtp_pool().connection() as sender:
+        for item, body in zip(notifications, bodies):
+            if body is None:
+                failed += 1
+                continue
+            try:
+                subject = get_notification_subject(item["notification_type"], item.get("data", {}))
+                sender.send(item["recipients"], subject, body)
+                sent += 1
+            except Exception as e:
+                failed += 1
+                logger.error(f"Batch notification to {item.get('recipients')} failed: {e}")
+
+    return f"Batch notifications: {sent} sent, {failed} failed"
+
+@celery_app.task(**POOL_RETRY)
+def run_email_campaign_task(campaign_id: int):
+    """
+    Send a mass-mail campaign chunk by chunk.
+    """
+    from app.core.email_campaigns import run_email_campaign
+    run_email_campaign(campaign_id)
+    return f"Email campaign {campaign_id} finished"
+
+@celery_app.task
+def resume_email_campaigns_task():
+    """
+    Periodic sweep: resume campaigns whose worker died mid-run.
+    """
+    from app.core.email_campaigns import resume_stalled_campaigns
+    from app.db.database import SessionLocal
+    db = SessionLocal()
+    try:
+        resumed = resume_stalled_campaigns(db)
+    finally:
+        db.close()
+    return f"Resumed {len(resumed)} stalled email campaigns"
@@ -0,0 +1,13 @@
+from app.celery_app import celery_app
+from app.core.export_jobs import run_export_job
+import logging
+
+logger = logging.getLogger(__name__)
+
+@celery_app.task
+def run_export_job_task(job_id: int):
+    """
+    Build the output file for a queued export job.
+    """
+    run_export_job(job_id)
+    return f"Export job {job_id} finished"
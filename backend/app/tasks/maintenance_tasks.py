@@ -0,0 +1,27 @@
+from app.celery_app import celery_app
+from app.core.audit_retention import archive_audit_logs
+from app.db.database import SessionLocal
+import logging
+
+logger = logging.getLogger(__name__)
+
+@celery_app.task
+def archive_audit_logs_task():
+    """
+    Move audit rows past the retention age into the monthly archive files.
+    """
+    db = SessionLocal()
+    try:
+        archived = archive_audit_logs(db)
+    finally:
+        db.close()
+    return f"Archived {sum(archived.values())} audit rows"
+
+@celery_app.task
+def delete_files_task(paths: list):
+    """
+    Remove stored files whose database rows have already been deleted.
+    """
+    from app.core.user_deletion import delete_files
+    removed = delete_files(paths)
+    return f"Removed {removed} of {len(paths)} files"
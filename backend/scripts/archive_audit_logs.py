@@ -0,0 +1,28 @@
+import sys
+import os
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+# Import models so relationships resolve
+from app.models.user import User
+from app.models.audit import AuditLog
+from app.core.audit_retention import archive_audit_logs
+from app.core.config import settings
+
+def archive(older_than_days: int):
+    db = SessionLocal()
+    print(f"🗄️  Archiving audit logs older than {older_than_days} days to {settings.AUDIT_ARCHIVE_DIR}/ ...")
+    try:
+        archived = archive_audit_logs(db, older_than_days=older_than_days)
+        for filename, count in sorted(archived.items()):
+            print(f"   {filename}: {count} rows")
+        print(f"✅ Archived {sum(archived.values())} rows; {db.query(AuditLog).count()} remain in audit_logs.")
+    except Exception as e:
+        print(f"❌ Archiving failed: {e}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    archive(int(sys.argv[1]) if len(sys.argv) > 1 else settings.AUDIT_RETENTION_DAYS)
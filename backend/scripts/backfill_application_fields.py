@@ -0,0 +1,29 @@
+import sys
+import os
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+# Import models so relationships resolve
+from app.models.user import User
+from app.models.student import StudentProfile, StudentDocument
+from app.models.scholarship import Scholarship, DocumentFormat
+from app.models.application import Application, ApplicationDocument
+from app.core.denorm import backfill_denormalized_fields
+
+def backfill(batch_size: int = 1000):
+    db = SessionLocal()
+    print("🔄 Backfilling denormalized application fields...")
+    try:
+        processed = backfill_denormalized_fields(db, batch_size=batch_size)
+        print(f"✅ Backfilled {processed} applications.")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Backfill failed: {e}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    backfill(batch_size)
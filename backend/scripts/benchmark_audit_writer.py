@@ -0,0 +1,56 @@
+import sys
+import os
+import time
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+from app.models.audit import AuditLog
+from app.core.audit_logger import log_action
+from app.core.audit_writer import audit_writer
+
+BENCHMARK_ACTION = "BENCHMARK_AUDIT"
+
+def _details(i):
+    return {"index": i, "remarks": "benchmark entry", "changes": {"status": ["pending", "approved"]}}
+
+def benchmark(events: int = 2000):
+    """
+    Compare per-call commit (durable=True) with the buffered writer, then remove
+    the benchmark rows.
+    """
+    db = SessionLocal()
+    try:
+        print(f"⏱️  Writing {events} audit entries with one commit per entry...")
+        started = time.perf_counter()
+        for i in range(events):
+            log_action(db, action=BENCHMARK_ACTION, target_type="Benchmark", target_id=str(i),
+                       details=_details(i), durable=True)
+        sync_seconds = time.perf_counter() - started
+
+        print(f"⏱️  Writing {events} audit entries through the buffered writer...")
+        started = time.perf_counter()
+        for i in range(events):
+            log_action(db, action=BENCHMARK_ACTION, target_type="Benchmark", target_id=str(i),
+                       details=_details(i))
+        enqueue_seconds = time.perf_counter() - started
+        audit_writer.stop(timeout=60)
+        buffered_seconds = time.perf_counter() - started
+
+        stats = audit_writer.stats()
+        print(f"📊 Per-call commit: {events / sync_seconds:,.0f} entries/s ({sync_seconds:.2f}s)")
+        print(f"📊 Buffered: {events / buffered_seconds:,.0f} entries/s end to end ({buffered_seconds:.2f}s), "
+              f"{enqueue_seconds / events * 1e6:.1f}µs per call on the request path, "
+              f"{stats['batches']} batches averaging {stats['avg_batch_size']} rows")
+        if stats["failed"]:
+            print(f"❌ {stats['failed']} buffered entries failed to insert")
+        print(f"🚀 Speedup: {sync_seconds / buffered_seconds:.1f}x")
+    finally:
+        deleted = db.query(AuditLog).filter(AuditLog.action == BENCHMARK_ACTION).delete(synchronize_session=False)
+        db.commit()
+        print(f"🧹 Removed {deleted} benchmark rows.")
+        db.close()
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
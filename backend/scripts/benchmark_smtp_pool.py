@@ -0,0 +1,90 @@
+import sys
+import os
+import time
+import asyncio
+import argparse
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+
+# Compares a fresh SMTP connection per message (what FastMail does) with the
+# pooled worker connections, against a local aiosmtpd sink:
+#   pip install aiosmtpd
+#   python scripts/benchmark_smtp_pool.py --messages 500 --handshake-ms 40
+# The sink has no TLS or AUTH; --handshake-ms delays EHLO to stand in for the
+# network round trips and TLS/AUTH work a real server adds to each connection.
+
+class _SinkHandler:
+    def __init__(self, handshake_delay: float):
+        self.handshake_delay = handshake_delay
+        self.received = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        if self.handshake_delay:
+            await asyncio.sleep(self.handshake_delay)
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 OK"
+
+def _per_message(messages: int) -> float:
+    from app.core.mailer import SmtpSender
+    started = time.perf_counter()
+    for i in range(messages):
+        with SmtpSender() as sender:
+            sender.send(f"student{i}@example.com", "Benchmark", "<p>Hello</p>")
+    return time.perf_counter() - started
+
+def _pooled(messages: int) -> float:
+    from app.core.mailer import send_email
+    started = time.perf_counter()
+    for i in range(messages):
+        send_email("Benchmark", [f"student{i}@example.com"], "<p>Hello</p>")
+    return time.perf_counter() - started
+
+def benchmark(messages: int, handshake_ms: int, port: int):
+    try:
+        from aiosmtpd.controller import Controller
+    except ImportError:
+        print("❌ aiosmtpd is not installed (pip install aiosmtpd)")
+        return
+
+    handler = _SinkHandler(handshake_ms / 1000)
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    # Point the mailer at the sink
+    settings.MAIL_SERVER = "127.0.0.1"
+    settings.MAIL_PORT = port
+    settings.MAIL_STARTTLS = False
+    settings.MAIL_SSL_TLS = False
+    settings.USE_CREDENTIALS = False
+    settings.MAIL_FROM = settings.MAIL_FROM or "benchmark@example.com"
+    try:
+        print(f"📨 Sending {messages} messages to the sink (EHLO delay {handshake_ms}ms)...")
+        from app.core.mailer import SmtpSender, get_smtp_pool
+        per_message = _per_message(messages)
+        opened_before = SmtpSender.connections_opened
+        pooled = _pooled(messages)
+        pooled_connections = SmtpSender.connections_opened - opened_before
+
+        pool = get_smtp_pool()
+        print(f"📊 New connection per message: {messages / per_message:,.0f} msg/s ({per_message:.2f}s)")
+        print(f"📊 Pooled connections: {messages / pooled:,.0f} msg/s ({pooled:.2f}s), "
+              f"{pooled_connections} connections opened "
+              f"(max {settings.SMTP_MAX_MESSAGES_PER_CONNECTION} messages per connection)")
+        print(f"🚀 Speedup: {per_message / pooled:.1f}x; sink received {handler.received} messages")
+        pool.close_all()
+    finally:
+        controller.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark pooled SMTP connections against a local sink")
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--handshake-ms", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8025)
+    args = parser.parse_args()
+    benchmark(args.messages, args.handshake_ms, args.port)
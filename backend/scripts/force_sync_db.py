@@ -14,6 +14,9 @@ from app.models.scholarship import Scholarship, DocumentCategory, DocumentFormat
 from app.models.application import Application, ApplicationDocument
 from app.models.university import Department, Branch, SessionYear
 from app.models.notice import Notice
+from app.models.analytics import ApplicationRollup, StatusTransitionRollup
+from app.models.export_job import ExportJob
+from app.models.email_campaign import EmailCampaign, EmailCampaignChunk
 # Import any other models if missed
 
 def force_create_tables():
@@ -0,0 +1,29 @@
+import sys
+import os
+
+# Add parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+# Import models so relationships resolve
+from app.models.user import User
+from app.models.student import StudentProfile, StudentDocument
+from app.models.scholarship import Scholarship, DocumentFormat
+from app.models.application import Application, ApplicationDocument
+from app.models.analytics import ApplicationRollup, StatusTransitionRollup
+from app.core.analytics import rebuild_rollups
+
+def rebuild():
+    db = SessionLocal()
+    print("🔄 Rebuilding analytics rollup tables...")
+    try:
+        rebuild_rollups(db)
+        print(f"✅ Rebuilt {db.query(ApplicationRollup).count()} application rollup rows "
+              f"and {db.query(StatusTransitionRollup).count()} status transition rows.")
+    except Exception as e:
+        print(f"❌ Rebuild failed: {e}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    rebuild()
@@ -0,0 +1,27 @@
+import os
+import tempfile
+
+import pytest
+
+# The app engine is created at import time from settings; point it at a throwaway
+# SQLite file so importing app modules never needs a MySQL driver.
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.gettempdir(), 'scholarship_tests.db')}")
+os.environ.setdefault("MAIL_FROM", "noreply@example.com")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
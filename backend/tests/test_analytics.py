@@ -0,0 +1,79 @@
+from app.core.analytics import record_applications_created, record_status_changes, rebuild_rollups
+from app.core.denorm import sync_student_fields
+from app.models.analytics import ApplicationRollup
+from app.models.application import Application, ApplicationStatus
+from app.models.scholarship import Scholarship
+from app.models.student import StudentProfile
+from app.models.user import User, UserRole
+
+
+def _rollup_counts(db):
+    rows = db.query(ApplicationRollup).all()
+    return {
+        (r.day, r.department, r.category, r.gender, r.status, r.scholarship_id): r.count
+        for r in rows if r.count
+    }
+
+
+def _apply(db, student_id, scholarship_id, status=ApplicationStatus.SUBMITTED):
+    application = Application(student_id=student_id, scholarship_id=scholarship_id, status=status)
+    db.add(application)
+    db.flush()
+    sync_student_fields(db, [student_id], move_rollups=False)
+    record_applications_created(db, [application.id])
+    db.commit()
+    return application
+
+
+def _edit_profile(db, student_id, **changes):
+    db.query(StudentProfile).filter(StudentProfile.user_id == student_id).update(changes)
+    sync_student_fields(db, [student_id])
+    db.commit()
+
+
+def test_profile_edit_moves_rollups_and_matches_rebuild(db):
+    db.add_all([
+        User(id=1, email="a@example.com", full_name="A", role=UserRole.STUDENT),
+        User(id=2, email="b@example.com", full_name="B", role=UserRole.STUDENT),
+        StudentProfile(user_id=1, department="CSE", category="General", gender="F"),
+        StudentProfile(user_id=2, department="CSE", category="OBC", gender="M"),
+        Scholarship(id=1, name="Merit"),
+        Scholarship(id=2, name="Need"),
+    ])
+    db.commit()
+    first = _apply(db, 1, 1)
+    _apply(db, 1, 2, status=ApplicationStatus.DRAFT)
+    _apply(db, 2, 1)
+
+    moved = sync_student_fields(db, [1])
+    assert moved == set()
+
+    _edit_profile(db, 1, department="ECE", category="SC")
+
+    first.status = ApplicationStatus.UNDER_VERIFICATION
+    departments = record_status_changes(db, {first.id: ApplicationStatus.SUBMITTED}, ApplicationStatus.UNDER_VERIFICATION)
+    db.commit()
+    assert departments == {"ECE"}
+
+    incremental = _rollup_counts(db)
+    assert all(count > 0 for count in incremental.values())
+    assert {key[1] for key in incremental} == {"ECE", "CSE"}
+
+    rebuild_rollups(db)
+    assert _rollup_counts(db) == incremental
+
+
+def test_dept_rollups_agree_with_application_department(db):
+    db.add_all([
+        User(id=1, email="a@example.com", full_name="A", role=UserRole.STUDENT),
+        StudentProfile(user_id=1, department="CSE"),
+        Scholarship(id=1, name="Merit"),
+    ])
+    db.commit()
+    _apply(db, 1, 1)
+    _edit_profile(db, 1, department="ME")
+
+    listed = db.query(Application).filter(Application.department == "ME").count()
+    counted = sum(count for key, count in _rollup_counts(db).items() if key[1] == "ME")
+    assert listed == counted == 1
+    assert not any(key[1] == "CSE" for key in _rollup_counts(db))
@@ -0,0 +1,26 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.audit_logger import log_action
+from app.core.config import settings
+from app.db.base import Base
+from app.models.audit import AuditLog
+from app.models.scholarship import Scholarship
+
+
+def test_synchronous_entry_does_not_commit_callers_transaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "AUDIT_ASYNC", False)
+    # A file database, so the audit session gets a connection of its own
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = Session(bind=engine)
+    try:
+        db.add(Scholarship(id=1, name="Pending"))
+        log_action(db, action="DELETE_USER", target_type="User", target_id="7")
+        db.rollback()
+
+        assert db.query(Scholarship).count() == 0
+        assert [(e.action, e.target_id) for e in db.query(AuditLog)] == [("DELETE_USER", "7")]
+    finally:
+        db.close()
+        engine.dispose()
@@ -0,0 +1,42 @@
+from app.core import conflicts
+from app.models.scholarship import Scholarship
+
+
+def _add(db, scholarship_id, exclusive_ids=None):
+    db.add(Scholarship(id=scholarship_id, name=f"S{scholarship_id}", mutually_exclusive_ids=exclusive_ids))
+    db.commit()
+
+
+def test_invalidation_rebuilds_graph(db, monkeypatch):
+    monkeypatch.setattr("app.core.cache._get_redis", lambda: None)
+    conflicts.invalidate_conflict_graph()
+    _add(db, 1)
+    _add(db, 2)
+    assert conflicts.get_conflict_graph(db).neighbours(1) == frozenset()
+
+    db.query(Scholarship).filter(Scholarship.id == 1).update({Scholarship.mutually_exclusive_ids: [2]})
+    db.commit()
+    assert conflicts.get_conflict_graph(db).neighbours(1) == frozenset()  # still cached
+
+    conflicts.invalidate_conflict_graph()
+    assert conflicts.get_conflict_graph(db).neighbours(2) == frozenset({1})
+
+
+def test_rebuild_racing_an_invalidation_is_not_cached(db, monkeypatch):
+    monkeypatch.setattr("app.core.cache._get_redis", lambda: None)
+    conflicts.invalidate_conflict_graph()
+    _add(db, 1, [2])
+    _add(db, 2)
+
+    build = conflicts.ConflictGraph.build
+
+    def build_then_invalidate(rows):
+        graph = build(rows)
+        conflicts.invalidate_conflict_graph()
+        return graph
+
+    monkeypatch.setattr(conflicts.ConflictGraph, "build", build_then_invalidate)
+    conflicts.get_conflict_graph(db)
+    monkeypatch.setattr(conflicts.ConflictGraph, "build", build)
+
+    assert conflicts._cached_graph is None
@@ -0,0 +1,79 @@
+import pytest
+
+from app.core.eligibility import check_eligibility, eligible_profiles_query
+from app.models.scholarship import Scholarship
+from app.models.student import StudentProfile
+
+PROFILES = [
+    dict(department="CSE", category="General", current_year_or_semester="2nd Year",
+         annual_family_income=250000.0, previous_exam_percentage=82.5, percentage_12th=70.0, parents_govt_job=False),
+    dict(department="cse", category="obc", current_year_or_semester="2nd year",
+         annual_family_income=800000.0, previous_exam_percentage=60.0, percentage_12th=95.0, parents_govt_job=True),
+    dict(department="ECE", category="SC", current_year_or_semester="1st Year",
+         annual_family_income=600000.0, previous_exam_percentage=75.0, percentage_12th=None, parents_govt_job=None),
+    dict(department="Mechanical", category="ST", current_year_or_semester="3rd Year",
+         annual_family_income=None, previous_exam_percentage=None, percentage_12th=None, parents_govt_job=False),
+    dict(department=None, category=None, current_year_or_semester=None,
+         annual_family_income=100000.0, previous_exam_percentage=90.0, percentage_12th=None, parents_govt_job=False),
+]
+
+SCHOLARSHIPS = {
+    "open": dict(),
+    "income_limit": dict(max_family_income=600000.0),
+    "min_percentage": dict(min_percentage=75.0),
+    "categories": dict(allowed_categories=["OBC", "SC"]),
+    "departments": dict(allowed_departments=["CSE", "ECE"]),
+    "years": dict(allowed_years=["2nd Year"]),
+    "no_govt_job": dict(govt_job_allowed=False),
+    "combined": dict(max_family_income=700000.0, min_percentage=70.0,
+                     allowed_departments=["cse", "ece"], govt_job_allowed=False),
+    # Not part of the eligibility rule set; must not affect the outcome
+    "unchecked_fields": dict(min_12th_percentage=99.0, min_cgpa=9.5),
+}
+
+
+@pytest.fixture
+def profiles(db):
+    rows = [StudentProfile(user_id=i + 1, **values) for i, values in enumerate(PROFILES)]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+def _scholarship(criteria: dict) -> Scholarship:
+    return Scholarship(name="Test", **{"govt_job_allowed": True, **criteria})
+
+
+@pytest.mark.parametrize("name", sorted(SCHOLARSHIPS))
+def test_sql_clause_matches_python_evaluator(db, profiles, name):
+    scholarship = _scholarship(SCHOLARSHIPS[name])
+
+    in_python = {p.id for p in profiles if check_eligibility(p, scholarship)["eligible"]}
+    in_sql = {p.id for p in eligible_profiles_query(db, scholarship)}
+
+    assert in_sql == in_python
+
+
+def test_list_criteria_ignore_case(profiles):
+    scholarship = _scholarship(dict(allowed_departments=["CSE"], allowed_categories=["general", "OBC"]))
+
+    assert check_eligibility(profiles[0], scholarship)["eligible"]
+    assert check_eligibility(profiles[1], scholarship)["eligible"]
+
+
+def test_missing_values_fail_thresholds_with_reasons(profiles):
+    scholarship = _scholarship(dict(max_family_income=500000.0, min_percentage=50.0))
+
+    result = check_eligibility(profiles[3], scholarship)
+
+    assert not result["eligible"]
+    assert result["reasons"] == [
+        "Family income is not provided in profile",
+        "Previous exam percentage is not provided in profile",
+    ]
+
+
+def test_unchecked_fields_do_not_restrict(profiles):
+    scholarship = _scholarship(SCHOLARSHIPS["unchecked_fields"])
+
+    assert all(check_eligibility(p, scholarship)["eligible"] for p in profiles)
@@ -0,0 +1,174 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import email_campaigns
+from app.core.config import settings
+from app.core.mailer import SmtpPoolTimeout
+from app.db.base import Base
+from app.models.email_campaign import EmailCampaign, EmailCampaignChunk, EmailCampaignStatus, EmailChunkStatus
+
+RECIPIENTS = [f"student{i}@example.com" for i in range(7)]
+
+
+class WorkerDied(BaseException):
+    pass
+
+
+class FakeSender:
+    def __init__(self, delivered, die_after=None):
+        self.delivered = delivered
+        self.die_after = die_after
+
+    def send(self, to, subject, html):
+        if self.die_after is not None and len(self.delivered) >= self.die_after:
+            raise WorkerDied()
+        self.delivered.append(to)
+
+
+class FakePool:
+    def __init__(self, sender, free_checkouts=None):
+        self.sender = sender
+        self.free_checkouts = free_checkouts
+        self.checkouts = 0
+
+    @contextmanager
+    def connection(self):
+        if self.free_checkouts is not None and self.checkouts >= self.free_checkouts:
+            raise SmtpPoolTimeout("pool exhausted")
+        self.checkouts += 1
+        yield self.sender
+
+
+@pytest.fixture
+def sessions(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'campaigns.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(email_campaigns, "SessionLocal", factory)
+    monkeypatch.setattr(settings, "EMAIL_CAMPAIGN_RATE_PER_SECOND", 1000.0)
+    monkeypatch.setattr(settings, "EMAIL_CAMPAIGN_BURST", 1000)
+    yield factory
+    engine.dispose()
+
+
+def _use_sender(monkeypatch, sender, free_checkouts=None):
+    pool = FakePool(sender, free_checkouts)
+    monkeypatch.setattr("app.core.mailer.get_smtp_pool", lambda: pool)
+    return pool
+
+
+def _create_campaign(factory) -> int:
+    db = factory()
+    campaign = EmailCampaign(subject="Hello", body="Body", target_group="custom",
+                             custom_recipients=RECIPIENTS, chunk_size=3)
+    db.add(campaign)
+    db.commit()
+    campaign_id = campaign.id
+    db.close()
+    return campaign_id
+
+
+def test_interrupted_campaign_resumes_without_resending(sessions, monkeypatch):
+    campaign_id = _create_campaign(sessions)
+    delivered = []
+
+    _use_sender(monkeypatch, FakeSender(delivered, die_after=4))
+    with pytest.raises(WorkerDied):
+        email_campaigns.run_email_campaign(campaign_id)
+    assert delivered == RECIPIENTS[:4]
+
+    db = sessions()
+    campaign = db.get(EmailCampaign, campaign_id)
+    assert campaign.status == EmailCampaignStatus.RUNNING
+    # A live worker's campaign is not taken over
+    assert email_campaigns.resume_stalled_campaigns(db) == []
+    campaign.heartbeat_at = datetime.utcnow() - timedelta(minutes=settings.EMAIL_CAMPAIGN_STALE_MINUTES + 1)
+    db.commit()
+    db.close()
+
+    _use_sender(monkeypatch, FakeSender(delivered))
+    email_campaigns.run_email_campaign(campaign_id)
+
+    assert delivered == RECIPIENTS
+    db = sessions()
+    campaign = db.get(EmailCampaign, campaign_id)
+    assert campaign.status == EmailCampaignStatus.COMPLETED
+    assert (campaign.sent_count, campaign.failed_count, campaign.completed_chunks) == (7, 0, 3)
+    chunks = db.query(EmailCampaignChunk).order_by(EmailCampaignChunk.chunk_index).all()
+    assert [(c.status, c.sent_offset, c.sent_count) for c in chunks] == [
+        (EmailChunkStatus.SENT, 3, 3), (EmailChunkStatus.SENT, 3, 3), (EmailChunkStatus.SENT, 1, 1)
+    ]
+    db.close()
+
+
+def test_running_campaign_is_not_claimed_twice(sessions, monkeypatch):
+    campaign_id = _create_campaign(sessions)
+    db = sessions()
+    assert email_campaigns._claim(db, campaign_id)
+    assert not email_campaigns._claim(db, campaign_id)
+    db.close()
+
+
+def test_pool_timeout_requeues_campaign_for_retry(sessions, monkeypatch):
+    campaign_id = _create_campaign(sessions)
+    delivered = []
+
+    # Only the first chunk gets a connection
+    pool = _use_sender(monkeypatch, FakeSender(delivered), free_checkouts=1)
+    with pytest.raises(SmtpPoolTimeout):
+        email_campaigns.run_email_campaign(campaign_id)
+    assert delivered == RECIPIENTS[:3]
+    assert pool.checkouts == 1
+
+    db = sessions()
+    campaign = db.get(EmailCampaign, campaign_id)
+    assert campaign.status == EmailCampaignStatus.QUEUED
+    assert campaign.error is None
+    db.close()
+
+    _use_sender(monkeypatch, FakeSender(delivered))
+    email_campaigns.run_email_campaign(campaign_id)
+
+    assert delivered == RECIPIENTS
+    db = sessions()
+    assert db.get(EmailCampaign, campaign_id).status == EmailCampaignStatus.COMPLETED
+    db.close()
+
+
+def test_status_endpoint_reports_chunk_progress(sessions, monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.api import admin_routes, deps
+    from app.db.database import get_db
+    from app.models.user import User, UserRole
+
+    campaign_id = _create_campaign(sessions)
+    delivered = []
+    _use_sender(monkeypatch, FakeSender(delivered, die_after=4))
+    with pytest.raises(WorkerDied):
+        email_campaigns.run_email_campaign(campaign_id)
+
+    def override_db():
+        db = sessions()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(admin_routes.router, prefix="/admin")
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[deps.get_current_user] = lambda: User(id=1, email="admin@example.com", role=UserRole.ADMIN)
+
+    response = TestClient(app).get(f"/admin/communications/campaigns/{campaign_id}")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "running"
+    assert [(c["recipient_count"], c["sent_offset"], c["status"]) for c in body["chunks"]] == [
+        (3, 3, "sent"), (3, 1, "pending"), (1, 0, "pending")
+    ]
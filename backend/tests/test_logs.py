@@ -0,0 +1,86 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.core import log_index
+from app.core.config import settings
+from app.core.structured_logging import IndexedRotatingFileHandler
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "LOG_FILE_PREFIX", "app")
+    return tmp_path
+
+
+def _dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def _write(path, minutes, route="/x"):
+    with open(path, "w") as f:
+        for minute in minutes:
+            f.write(json.dumps({"ts": f"2026-10-20T10:{minute:02d}:00.000Z", "level": "INFO", "route": route}) + "\n")
+
+
+def test_orphaned_files_are_rotated_indexed_and_pruned(log_dir):
+    pid = _dead_pid()
+    _write(log_dir / f"app.{pid}.log", [5, 6])
+    for i in range(3):
+        _write(log_dir / f"app.{pid}.log.20261019T00000{i}000000", [i])
+
+    handler = IndexedRotatingFileHandler(str(log_dir / f"app.{os.getpid()}.log"), backupCount=2)
+    try:
+        handler.adopt_orphans("app")
+    finally:
+        handler.close()
+
+    names = sorted(os.listdir(log_dir))
+    assert not any(name.startswith(f"app.{pid}.") for name in names)
+    rotated = [n for n in names if n.startswith(f"app.{os.getpid()}.log.") and not n.endswith(log_index.INDEX_SUFFIX)]
+    assert len(rotated) == 2
+    assert all(os.path.exists(log_dir / (n + log_index.INDEX_SUFFIX)) for n in rotated)
+    # The newest orphan data (the dead process's active file) is kept
+    assert any(log_index._load_index(str(log_dir / n))["last_ts"] == "2026-10-20T10:06:00.000Z" for n in rotated)
+
+
+def test_live_process_files_are_left_alone(log_dir):
+    own_parent = log_dir / f"app.{os.getppid()}.log"
+    _write(own_parent, [1])
+
+    handler = IndexedRotatingFileHandler(str(log_dir / f"app.{os.getpid()}.log"), backupCount=2)
+    try:
+        handler.adopt_orphans("app")
+    finally:
+        handler.close()
+
+    assert own_parent.exists()
+
+
+def test_query_returns_newest_matches_and_skips_older_files(log_dir, monkeypatch):
+    old = log_dir / "app.1.log.20261020T100000000000"
+    newer = log_dir / "app.2.log.20261020T103000000000"
+    _write(old, range(0, 20))
+    _write(newer, range(20, 40))
+    log_index.build_index(str(old))
+    log_index.build_index(str(newer))
+    _write(log_dir / "app.3.log", [41, 42])
+
+    opened = []
+    real_open = open
+
+    def tracking_open(path, *args, **kwargs):
+        opened.append(os.path.basename(str(path)))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    records = log_index.query_logs(limit=5)
+
+    assert [r["ts"][14:16] for r in records] == ["42", "41", "39", "38", "37"]
+    assert old.name not in opened
@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+
+from app.core import mailer
+from app.core.config import settings
+from app.core.mailer import SmtpPool, SmtpPoolTimeout, SmtpSender
+
+
+class FakeSmtp:
+    def __init__(self):
+        self.sent = []
+
+    def send_message(self, message, to_addrs=None):
+        self.sent.append((message, to_addrs))
+
+    def noop(self):
+        return (250, b"OK")
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_connect(monkeypatch):
+    def connect(self):
+        self._smtp = FakeSmtp()
+        self.messages_sent = 0
+        self.last_used = time.monotonic()
+    monkeypatch.setattr(SmtpSender, "connect", connect)
+
+
+def _pool(size=1):
+    return SmtpPool(size=size, keepalive_seconds=60, idle_timeout_seconds=300, acquire_timeout_seconds=0.05)
+
+
+def test_checkout_times_out_when_pool_is_exhausted():
+    pool = _pool()
+    with pool.connection():
+        with pytest.raises(SmtpPoolTimeout):
+            with pool.connection():
+                pass
+    assert pool.stats["timeouts"] == 1
+
+    # The held connection went back to the pool and is reused
+    with pool.connection():
+        pass
+    assert pool.stats == {"checkouts": 2, "new_connections": 1, "timeouts": 1}
+
+
+def test_waiting_checkout_gets_released_connection():
+    pool = _pool()
+    pool.acquire_timeout_seconds = 5
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with pool.connection():
+            held.set()
+            release.wait()
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    held.wait()
+    threading.Timer(0.05, release.set).start()
+    with pool.connection():
+        pass
+    thread.join()
+    assert pool.stats["timeouts"] == 0
+    assert pool.stats["new_connections"] == 1
+
+
+def test_several_recipients_are_hidden_in_bcc(monkeypatch):
+    pool = _pool()
+    monkeypatch.setattr(mailer, "get_smtp_pool", lambda: pool)
+    monkeypatch.setattr(settings, "MAIL_FROM", "cell@example.com")
+    students = ["a@example.com", "b@example.com"]
+
+    mailer.send_email("Notice", students, "<p>Hi</p>")
+    mailer.send_email("Notice", ["c@example.com"], "<p>Hi</p>")
+
+    with pool.connection() as sender:
+        (bulk, bulk_to), (single, single_to) = sender._smtp.sent
+    assert "cell@example.com" in bulk["To"]
+    assert "a@example.com" not in bulk["To"]
+    # smtplib drops the Bcc header and delivers only to the envelope addresses
+    assert bulk_to == students
+    assert single["To"] == "c@example.com"
+    assert single["Bcc"] is None and single_to is None
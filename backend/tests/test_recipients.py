@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+pytest.importorskip("celery")
+
+from app.core.config import settings
+from app.db.base import Base
+from app.models.user import User, UserRole
+from app.tasks import email_tasks
+
+
+@pytest.fixture
+def factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'recipients.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr("app.db.database.SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+def test_notify_task_resolves_on_its_own_session_and_closes_it(factory, monkeypatch):
+    db = factory()
+    db.add_all([User(email=f"student{i}@example.com", role=UserRole.STUDENT) for i in range(5)])
+    db.add(User(email="office@example.com", role=UserRole.GOFFICE))
+    db.commit()
+    db.close()
+
+    queued = []
+    monkeypatch.setattr(email_tasks.send_notification_task, "delay",
+                        lambda **kwargs: queued.append(kwargs["recipients"]))
+    monkeypatch.setattr(settings, "EMAIL_CAMPAIGN_CHUNK_SIZE", 2)
+    closed = []
+    close = Session.close
+
+    def tracking_close(self):
+        closed.append(self)
+        close(self)
+
+    monkeypatch.setattr(Session, "close", tracking_close)
+
+    result = email_tasks.notify_recipients_task("all", None, "notice_published", {"title": "T", "content": "C"})
+
+    assert [len(chunk) for chunk in queued] == [2, 2, 1]
+    assert sorted(sum(queued, [])) == [f"student{i}@example.com" for i in range(5)]
+    assert result == "Notification 'notice_published' queued for 5 recipients"
+    assert len(closed) == 1
@@ -0,0 +1,39 @@
+from app.core.search import _like_prefix, _user_ids_matching, tokenize
+from app.models.student import StudentProfile
+from app.models.user import User, UserRole
+
+
+def test_like_prefix_escapes_wildcards():
+    assert _like_prefix("a_b") == "a\\_b%"
+    assert _like_prefix("50%") == "50\\%%"
+    assert _like_prefix("a\\b") == "a\\\\b%"
+
+
+def test_underscore_in_short_token_is_literal(db):
+    db.add_all([
+        User(id=1, email="one@example.com", full_name="Student One", role=UserRole.STUDENT),
+        User(id=2, email="two@example.com", full_name="Student Two", role=UserRole.STUDENT),
+        StudentProfile(user_id=1, enrollment_no="a_123"),
+        StudentProfile(user_id=2, enrollment_no="ab123"),
+    ])
+    db.commit()
+
+    (token,) = tokenize("a_")
+    matched = {user_id for (user_id,) in _user_ids_matching(db, token)}
+
+    assert matched == {1}
+
+
+def test_short_token_matches_later_words_of_names(db):
+    db.add_all([
+        User(id=1, email="ayan@example.com", full_name="Ayan Khan", role=UserRole.STUDENT),
+        User(id=2, email="kh@example.com", full_name="Student Two", role=UserRole.STUDENT),
+        User(id=3, email="three@example.com", full_name="Mikhail Three", role=UserRole.STUDENT),
+    ])
+    db.commit()
+
+    (token,) = tokenize("kh")
+    matched = {user_id for (user_id,) in _user_ids_matching(db, token)}
+
+    # A word inside the name, or the start of the email; never the middle of a word
+    assert matched == {1, 2}
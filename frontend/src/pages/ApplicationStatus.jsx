@@ -43,14 +43,10 @@ const ApplicationStatus = () => {
     useEffect(() => {
         const fetchApp = async () => {
             try {
-                const res = await api.get('/applications/');
+                const res = await api.get('/applications/', { params: { expand: 'scholarship' } });
                 const app = res.data.find(a => a.id === parseInt(id));
                 setApplication(app);
-
-                if (app?.scholarship_id) {
-                    const schRes = await api.get(`/scholarships/${app.scholarship_id}`);
-                    setScholarship(schRes.data);
-                }
+                setScholarship(app?.scholarship || null);
             } catch (e) { console.error(e); }
             finally { setLoading(false); }
         };
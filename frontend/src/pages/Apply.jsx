@@ -185,31 +185,23 @@ const Apply = () => {
 
         setSubmissionMessage('');
         try {
-            const profilePromise = api.get('/profile/me').catch((err) => {
-                // Profile not found is OK - user can create one
-                if (err.response?.status === 404 || err.response?.status === 500) {
-                    return { data: null };
-                }
-                throw err;
-            });
-
-            const userInfoPromise = api.get('/auth/me').catch(() => ({ data: null }));
-
             const scholarshipId = parseInt(id);
             if (isNaN(scholarshipId)) {
                 throw new Error("Invalid scholarship ID");
             }
 
-            const [schRes, docsRes, profileRes, userRes, deptRes, appsRes] = await Promise.all([
-                api.get(`/scholarships/${scholarshipId}`),
-                api.get('/documents/'),
-                profilePromise,
-                userInfoPromise,
-                api.get('/university/departments').catch(() => ({ data: [] })),
-                api.get('/applications/').catch(() => ({ data: [] })),
-            ]);
-
-            setDepartments(deptRes.data || []);
+            // Single round-trip: profile, user, scholarship, vault, departments and applications
+            const { data: context } = await api.get(`/applications/apply-context/${scholarshipId}`);
+            const schRes = { data: context.scholarship };
+            const docsRes = { data: context.documents };
+            const profileRes = { data: context.profile };
+            const userRes = { data: context.user };
+            const appsRes = { data: context.applications };
+
+            setDepartments(context.departments || []);
+            if (context.branches?.length) {
+                setBranches(context.branches);
+            }
 
             if (!schRes.data) {
                 throw new Error("Scholarship not found");
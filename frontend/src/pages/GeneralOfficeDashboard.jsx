@@ -843,6 +843,7 @@ const GeneralOfficeDashboard = () => {
                                                     <option value="department">Specific Department</option>
                                                     <option value="branch">Specific Branch</option>
                                                     <option value="scholarship">Specific Scholarship Applicants</option>
+                                                    <option value="eligible">Students Eligible for a Scholarship</option>
                                                     <option value="custom">Custom Email List</option>
                                                 </select>
                                             </div>
@@ -881,7 +882,7 @@ const GeneralOfficeDashboard = () => {
                                                 </div>
                                             )}
 
-                                            {emailForm.target_group === 'scholarship' && (
+                                            {(emailForm.target_group === 'scholarship' || emailForm.target_group === 'eligible') && (
                                                 <div>
                                                     <label className="block text-sm font-semibold text-slate-700 mb-1.5">Scholarship ID</label>
                                                     <input
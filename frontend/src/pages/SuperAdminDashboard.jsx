@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from 'react';
 import api from '../services/api';
-import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, PieChart, Pie, Cell } from 'recharts';
+import { BarChart, Bar, LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, PieChart, Pie, Cell } from 'recharts';
 
 const COLORS = ['#1e3a8a', '#3b82f6', '#60a5fa', '#93c5fd', '#bfdbfe'];
 
@@ -9,6 +9,7 @@ const SuperAdminDashboard = () => {
     const [users, setUsers] = useState([]);
     const [stats, setStats] = useState(null);
     const [analytics, setAnalytics] = useState(null);
+    const [timeseries, setTimeseries] = useState(null);
     const [auditLogs, setAuditLogs] = useState([]);
     const [departments, setDepartments] = useState([]);
     const [sessions, setSessions] = useState([]);
@@ -100,8 +101,12 @@ const SuperAdminDashboard = () => {
 
     const fetchAnalytics = async () => {
         try {
-            const res = await api.get('/admin/analytics/dashboard');
+            const [res, seriesRes] = await Promise.all([
+                api.get('/admin/analytics/dashboard'),
+                api.get('/admin/analytics/timeseries')
+            ]);
             setAnalytics(res.data);
+            setTimeseries(seriesRes.data);
         } catch (e) {
             console.error(e);
         }
@@ -495,6 +500,39 @@ const SuperAdminDashboard = () => {
                                 </div>
                             )}
 
+                            {timeseries && (
+                                <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
+                                    <div className="bg-white p-6 rounded-xl shadow-sm border border-slate-200">
+                                        <h3 className="text-lg font-bold text-slate-800 mb-6">Applications per Day</h3>
+                                        <div className="h-64">
+                                            <ResponsiveContainer width="100%" height="100%">
+                                                <LineChart data={timeseries.applications_per_day}>
+                                                    <CartesianGrid strokeDasharray="3 3" vertical={false} />
+                                                    <XAxis dataKey="date" axisLine={false} tickLine={false} />
+                                                    <YAxis axisLine={false} tickLine={false} allowDecimals={false} />
+                                                    <Tooltip />
+                                                    <Line type="monotone" dataKey="value" stroke="#3b82f6" strokeWidth={2} dot={false} />
+                                                </LineChart>
+                                            </ResponsiveContainer>
+                                        </div>
+                                    </div>
+                                    <div className="bg-white p-6 rounded-xl shadow-sm border border-slate-200">
+                                        <h3 className="text-lg font-bold text-slate-800 mb-6">Approvals per Week</h3>
+                                        <div className="h-64">
+                                            <ResponsiveContainer width="100%" height="100%">
+                                                <BarChart data={timeseries.approvals_per_week}>
+                                                    <CartesianGrid strokeDasharray="3 3" vertical={false} />
+                                                    <XAxis dataKey="week_start" axisLine={false} tickLine={false} />
+                                                    <YAxis axisLine={false} tickLine={false} allowDecimals={false} />
+                                                    <Tooltip cursor={{ fill: '#f1f5f9' }} />
+                                                    <Bar dataKey="value" fill="#1e3a8a" radius={[4, 4, 0, 0]} />
+                                                </BarChart>
+                                            </ResponsiveContainer>
+                                        </div>
+                                    </div>
+                                </div>
+                            )}
+
                             {/* Recent Audit Logs */}
                             <div className="bg-white rounded-xl shadow-sm border border-slate-200 overflow-hidden">
                                 <div className="px-6 py-4 border-b border-slate-100 bg-slate-50/50">
@@ -1044,6 +1082,7 @@ const SuperAdminDashboard = () => {
                                                     <option value="department">Specific Department</option>
                                                     <option value="branch">Specific Branch</option>
                                                     <option value="scholarship">Specific Scholarship Applicants</option>
+                                                    <option value="eligible">Students Eligible for a Scholarship</option>
                                                     <option value="custom">Custom Email List</option>
                                                 </select>
                                             </div>
@@ -1082,7 +1121,7 @@ const SuperAdminDashboard = () => {
                                                 </div>
                                             )}
 
-                                            {emailForm.target_group === 'scholarship' && (
+                                            {(emailForm.target_group === 'scholarship' || emailForm.target_group === 'eligible') && (
                                                 <div>
                                                     <label className="block text-sm font-semibold text-slate-700 mb-1.5">Scholarship ID</label>
                                                     <input